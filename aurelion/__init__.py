@@ -0,0 +1 @@
+"""Paquete de soporte de la aplicación de la Tienda Aurelion."""
@@ -0,0 +1,127 @@
+"""
+Agregados de ventas (resumen mensual y por categoría, ciudad y medio de pago)
+mantenidos de forma incremental.
+
+Cada agregado guarda sum(importe), sum(cantidad) y el número de ítems de venta
+por grupo, por lo que un lote nuevo se incorpora sumando su propio agregado al
+existente, sin volver a recorrer el histórico.
+
+El agregado "cubo" tiene el grano más fino (día, categoría, ciudad, medio de
+pago y producto); cualquier corte o resumen sobre esas dimensiones se obtiene
+con rollup_cube() sin leer la tabla de hechos. Su tamaño depende del número de
+combinaciones de dimensiones y no del número de transacciones.
+"""
+import os
+
+import pandas as pd
+
+from aurelion import snapshots
+
+AGGREGATES_DIR = os.path.join(snapshots.SNAPSHOT_DIR, "aggregates")
+
+CUBE_NAME = "cubo"
+
+# Dimensiones del cubo; "fecha" es la fecha de venta truncada al día.
+CUBE_DIMENSIONS = ["fecha", "categoria", "ciudad", "medio_pago", "nombre_producto"]
+MEASURES = ["importe", "cantidad", "items"]
+
+# Nombre del agregado -> columna(s) de agrupación.
+ROLLUPS = {
+    "mensual": "mes",
+    "categoria": "categoria",
+    "ciudad": "ciudad",
+    "medio_pago": "medio_pago",
+    CUBE_NAME: CUBE_DIMENSIONS,
+}
+
+
+def aggregate_path(name):
+    """Ruta del agregado `name`."""
+    return os.path.join(AGGREGATES_DIR, f"{name}.parquet")
+
+
+def _month_end(dates):
+    # Fin de mes, igual que resample('ME') en train_model.py.
+    return dates.dt.to_period("M").dt.to_timestamp(how="end").dt.normalize()
+
+
+def _group_keys(df, name):
+    if name == "mensual":
+        return _month_end(df["fecha_venta"]).rename("mes")
+    if name == CUBE_NAME:
+        return [df["fecha_venta"].dt.normalize().rename("fecha"), *(df[col] for col in CUBE_DIMENSIONS[1:])]
+    return df[ROLLUPS[name]]
+
+
+def compute_rollup(df, name):
+    """Calcula el agregado `name` sobre las filas de la tabla de hechos `df`."""
+    grouped = df.groupby(_group_keys(df, name), observed=True)
+    rollup = pd.DataFrame({
+        "importe": grouped["importe"].sum(),
+        "cantidad": grouped["cantidad"].sum(),
+        "items": grouped.size(),
+    })
+    return rollup.reset_index()
+
+
+def merge_rollups(current, batch, name):
+    """Suma el agregado de un lote (`batch`) al agregado existente (`current`)."""
+    key = ROLLUPS[name]
+    merged = snapshots.concat([current, batch])
+    return merged.groupby(key, as_index=False, sort=True, observed=True)[MEASURES].sum()
+
+
+def build_rollups(df):
+    """Recalcula y guarda todos los agregados a partir de la tabla de hechos completa."""
+    for name in ROLLUPS:
+        snapshots.write_parquet(compute_rollup(df, name), aggregate_path(name))
+
+
+def update_rollups(batch):
+    """Incorpora a los agregados guardados las filas (ya unificadas) de un lote nuevo."""
+    for name in ROLLUPS:
+        path = aggregate_path(name)
+        rollup = compute_rollup(batch, name)
+        if os.path.exists(path):
+            rollup = merge_rollups(pd.read_parquet(path), rollup, name)
+        snapshots.write_parquet(rollup, path)
+
+
+def load_rollup(name):
+    """Lee el agregado `name` guardado en disco."""
+    return pd.read_parquet(aggregate_path(name))
+
+
+def is_complete():
+    """Indica si todos los agregados están guardados en disco."""
+    return all(os.path.exists(aggregate_path(name)) for name in ROLLUPS)
+
+
+def rollup_cube(cube, by=(), filters=None):
+    """
+    Resume el cubo por las dimensiones `by`, opcionalmente filtrado.
+
+    Args:
+        cube: Cubo leído con load_rollup(CUBE_NAME).
+        by: Dimensiones del resultado. Además de CUBE_DIMENSIONS admite
+            "mes" (fin de mes de la fecha; los meses sin ventas valen 0).
+        filters: Diccionario {dimensión: valor o lista de valores}.
+
+    Returns:
+        DataFrame indexado por `by` con las columnas importe, cantidad e
+        items. Sin dimensiones devuelve una sola fila con los totales.
+    """
+    for column, value in (filters or {}).items():
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        cube = cube[cube[column].isin(values)]
+
+    by = list(by)
+    if not by:
+        return cube[MEASURES].sum().to_frame().T.astype(cube[MEASURES].dtypes.to_dict())
+
+    keys = [_month_end(cube["fecha"]).rename("mes") if col == "mes" else cube[col] for col in by]
+    result = cube.groupby(keys, observed=True)[MEASURES].sum()
+    if by == ["mes"] and not result.empty:
+        months = pd.date_range(result.index.min(), result.index.max(), freq="ME", name="mes")
+        result = result.reindex(months, fill_value=0)
+    return result
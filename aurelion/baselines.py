@@ -0,0 +1,118 @@
+"""
+Modelos de referencia con la interfaz de scikit-learn (fit/predict).
+
+Se entrenan sobre la misma matriz de create_features que el Random Forest,
+por lo que sirven tal cual en train_model, el pronóstico recursivo
+(forecast_steps) y el backtesting. Viven en el paquete, y no en
+train_model.py, para que los modelos guardados con joblib puedan cargarse
+desde cualquier módulo.
+
+Si X es un array NumPy (como en forecast_steps), las columnas se ubican con
+`features`; si es un DataFrame, por sus nombres.
+"""
+import numpy as np
+from sklearn.base import BaseEstimator, RegressorMixin
+from sklearn.linear_model import Ridge
+from sklearn.preprocessing import StandardScaler
+
+
+def _columns(X, features, names):
+    """Columnas `names` de X como arrays float."""
+    if hasattr(X, "columns"):
+        return [X[name].to_numpy(dtype=float) for name in names]
+    X = np.asarray(X, dtype=float)
+    if features is None:
+        raise ValueError("Con un array NumPy hay que indicar `features`.")
+    return [X[:, list(features).index(name)] for name in names]
+
+
+class SeasonalNaive(RegressorMixin, BaseEstimator):
+    """Predice el valor del mismo mes del año anterior (la columna lag_<season_length>)."""
+
+    def __init__(self, features=None, season_length=12):
+        self.features = features
+        self.season_length = season_length
+
+    def fit(self, X, y):
+        _columns(X, self.features, [f"lag_{self.season_length}"])
+        return self
+
+    def predict(self, X):
+        return _columns(X, self.features, [f"lag_{self.season_length}"])[0]
+
+
+class LagRidge(RegressorMixin, BaseEstimator):
+    """Regresión ridge sobre las features estandarizadas (lags, medias móviles y calendario)."""
+
+    def __init__(self, alpha=1.0):
+        self.alpha = alpha
+
+    def fit(self, X, y):
+        X = np.asarray(X, dtype=float)
+        self.scaler_ = StandardScaler().fit(X)
+        self.ridge_ = Ridge(alpha=self.alpha).fit(self.scaler_.transform(X), y)
+        return self
+
+    def predict(self, X):
+        return self.ridge_.predict(self.scaler_.transform(np.asarray(X, dtype=float)))
+
+
+class HoltWinters(RegressorMixin, BaseEstimator):
+    """
+    Suavizado exponencial con tendencia y estacionalidad aditivas (ETS A,A,A).
+
+    fit recorre las ventas en orden de fecha y elige alpha, beta y gamma de una
+    grilla minimizando el error cuadrático a un paso. predict solo usa las
+    columnas month y year: el pronóstico para un mes es el nivel final más la
+    tendencia por los meses transcurridos desde el último dato de entrenamiento
+    más el componente estacional de ese mes, por lo que no depende de las
+    predicciones anteriores del pronóstico recursivo.
+    """
+
+    def __init__(self, features=None, season_length=12, alphas=(0.1, 0.2, 0.3, 0.5, 0.7, 0.9),
+                 betas=(0.0, 0.05, 0.1, 0.2), gammas=(0.05, 0.1, 0.2, 0.4)):
+        self.features = features
+        self.season_length = season_length
+        self.alphas = alphas
+        self.betas = betas
+        self.gammas = gammas
+
+    def _smooth(self, y, alpha, beta, gamma):
+        """Recorre `y` y devuelve (sse_a_un_paso, nivel, tendencia, estacionalidad)."""
+        m = self.season_length
+        level = y[:m].mean()
+        trend = (y[m:2 * m].mean() - level) / m
+        season = list(y[:m] - level)
+        sse = 0.0
+        for t in range(m, len(y)):
+            error = y[t] - (level + trend + season[t - m])
+            sse += error * error
+            previous = level
+            level = alpha * (y[t] - season[t - m]) + (1 - alpha) * (level + trend)
+            trend = beta * (level - previous) + (1 - beta) * trend
+            season.append(gamma * (y[t] - level) + (1 - gamma) * season[t - m])
+        return sse, level, trend, np.array(season[-m:])
+
+    def fit(self, X, y):
+        month, year = _columns(X, self.features, ["month", "year"])
+        y = np.asarray(y, dtype=float)
+        if len(y) < 2 * self.season_length:
+            raise ValueError(f"Se necesitan al menos {2 * self.season_length} meses para el modelo Holt-Winters.")
+        sse, alpha, beta, gamma = min(
+            (self._smooth(y, alpha, beta, gamma)[0], alpha, beta, gamma)
+            for alpha in self.alphas for beta in self.betas for gamma in self.gammas
+        )
+        _, self.level_, self.trend_, season = self._smooth(y, alpha, beta, gamma)
+        self.params_ = {"alpha": alpha, "beta": beta, "gamma": gamma}
+        self.last_period_ = int(year[-1] * 12 + month[-1] - 1)
+        # Componente estacional por mes del calendario (índice 0 = enero).
+        periods = (self.last_period_ - np.arange(self.season_length)[::-1])
+        self.season_ = np.empty(self.season_length)
+        self.season_[periods % self.season_length] = season
+        return self
+
+    def predict(self, X):
+        month, year = _columns(X, self.features, ["month", "year"])
+        periods = (year * 12 + month - 1).astype(int)
+        steps = periods - self.last_period_
+        return self.level_ + steps * self.trend_ + self.season_[periods % self.season_length]
@@ -0,0 +1,213 @@
+"""
+Caché de imágenes de los gráficos estáticos del EDA.
+
+Cada gráfico se identifica por su contenido: el nombre de la función de
+aurelion.eda_charts, el código de los módulos que lo dibujan (eda_charts,
+aggregates y este módulo), sus parámetros y la huella del conjunto de datos
+que dibuja. Si la imagen con esa clave ya existe en disco
+se sirve directamente; si no, se renderiza en un proceso aparte (pool de
+procesos con arranque "spawn") sin bloquear el hilo de Streamlit con el
+estado global de pyplot. Al cambiar los datos o el código del gráfico, la
+clave cambia y la imagen se vuelve a generar.
+"""
+import hashlib
+import inspect
+import json
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from aurelion import aggregates, data_access, eda_charts, fact_table, metrics, snapshots
+
+CHARTS_DIR = os.path.join(snapshots.SNAPSHOT_DIR, "charts")
+
+FORMAT = "png"
+DPI = 200
+# Versión de los gráficos; cambiarla regenera todas las imágenes (p. ej. al
+# actualizar matplotlib o seaborn, cuyo código no forma parte de la clave).
+CHART_VERSION = 1
+# Módulos cuyo código interviene en el dibujo: un cambio en cualquiera cambia la clave.
+CHART_MODULES = (eda_charts, aggregates, sys.modules[__name__])
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+# Conjuntos de datos que pueden dibujarse: nombre -> función de carga.
+DATASETS = {
+    fact_table.FACT_NAME: data_access.load_fact_table,
+    aggregates.CUBE_NAME: data_access.load_cube,
+    "unified_not_clean": data_access.load_unified_not_clean,
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+# Huellas de archivo memoizadas: ruta -> (mtime, sha256).
+_checksums = {}
+
+
+def _file_fingerprint(path):
+    mtime = os.stat(path).st_mtime_ns
+    entry = _checksums.get(path)
+    if entry is None or entry[0] != mtime:
+        entry = (mtime, fact_table.file_checksum(path))
+        _checksums[path] = entry
+    return entry[1]
+
+
+def dataset_fingerprint(dataset):
+    """
+    Huella del contenido del conjunto `dataset`.
+
+    Para la tabla de hechos y el cubo derivado de ella se usan las sumas de
+    las fuentes y los lotes añadidos de su manifiesto (ver
+    fact_table.content_fingerprint); para los CSV, la suma SHA-256 del archivo.
+    """
+    if dataset in (fact_table.FACT_NAME, aggregates.CUBE_NAME):
+        fact_table.ensure_fact_table()
+        return fact_table.content_fingerprint()
+    if dataset == "unified_not_clean":
+        return _file_fingerprint(data_access.UNIFIED_NOT_CLEAN_PATH)
+    raise KeyError(f"Conjunto de datos desconocido: {dataset}")
+
+
+def chart_key(chart, dataset, params, fingerprint, filters=None):
+    """Clave de contenido de un gráfico."""
+    payload = json.dumps(
+        {
+            "version": CHART_VERSION,
+            "chart": chart,
+            "source": inspect.getsource(getattr(eda_charts, chart)),
+            "modules": [_file_fingerprint(module.__file__) for module in CHART_MODULES],
+            "dataset": dataset,
+            "params": params,
+            "filters": filters or {},
+            "data": fingerprint,
+            "format": FORMAT,
+            "dpi": DPI,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:24]
+
+
+def chart_path(key):
+    """Ruta de la imagen con clave `key`."""
+    return os.path.join(CHARTS_DIR, f"{key}.{FORMAT}")
+
+
+def render_chart(chart, dataset, params, figsize, path, filters=None):
+    """
+    Dibuja el gráfico `chart` sobre `dataset` y lo guarda en `path`.
+
+    Se ejecuta dentro de los procesos del pool: carga sus propios datos y usa
+    una Figure independiente, sin tocar el estado global de pyplot. Con
+    `filters` ({columna: valor}) solo se dibujan las filas de ese segmento.
+    """
+    from matplotlib.figure import Figure
+
+    df = DATASETS[dataset]()
+    for column, value in (filters or {}).items():
+        df = df[df[column] == value]
+    fig = Figure(figsize=figsize)
+    getattr(eda_charts, chart)(fig, df, **params)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    fig.savefig(tmp_path, format=FORMAT, dpi=DPI, bbox_inches="tight")
+    os.replace(tmp_path, path)
+    return path
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def _reset_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def render_charts(requests, workers=None):
+    """
+    Devuelve las rutas de las imágenes de `requests`, renderizando solo las que faltan.
+
+    Args:
+        requests: Lista de diccionarios con las claves "chart" (función de
+            eda_charts), "dataset" (clave de DATASETS) y, opcionalmente,
+            "params" (dict), "figsize" (tupla) y "filters" ({columna: valor}).
+        workers: Número de procesos. 0 renderiza en el proceso actual; None
+            usa el pool compartido de MAX_WORKERS procesos y cualquier otro
+            valor, un pool propio de ese tamaño.
+
+    Returns:
+        Lista de rutas en el mismo orden que `requests`.
+    """
+    with metrics.phase(metrics.CHARTS):
+        return _render_charts(requests, workers)
+
+
+def _render_charts(requests, workers):
+    fingerprints = {}
+    paths, missing, pending = [], [], set()
+    for request in requests:
+        dataset = request["dataset"]
+        if dataset not in fingerprints:
+            fingerprints[dataset] = dataset_fingerprint(dataset)
+        params = request.get("params", {})
+        filters = request.get("filters", {})
+        figsize = tuple(request.get("figsize", (6.4, 4.8)))
+        key = chart_key(request["chart"], dataset, {**params, "figsize": figsize}, fingerprints[dataset], filters)
+        path = chart_path(key)
+        paths.append(path)
+        cached = path in pending or os.path.exists(path)
+        metrics.count_cache("chart_cache", hit=cached)
+        if not cached:
+            pending.add(path)
+            missing.append((request["chart"], dataset, params, figsize, path, filters))
+
+    if not missing:
+        return paths
+
+    if workers == 0 or len(missing) == 1:
+        for job in missing:
+            render_chart(*job)
+        return paths
+
+    try:
+        if workers is None:
+            executor = _get_executor()
+            futures = [executor.submit(render_chart, *job) for job in missing]
+            for future in futures:
+                future.result()
+        else:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                futures = [executor.submit(render_chart, *job) for job in missing]
+                for future in futures:
+                    future.result()
+    except BrokenProcessPool:
+        # Si el pool muere (p. ej. por falta de memoria) se renderiza en el proceso actual.
+        if workers is None:
+            _reset_executor()
+        for job in missing:
+            if not os.path.exists(job[4]):
+                render_chart(*job)
+    return paths
+
+
+def clear_cache():
+    """Elimina todas las imágenes almacenadas."""
+    if os.path.isdir(CHARTS_DIR):
+        for name in os.listdir(CHARTS_DIR):
+            os.remove(os.path.join(CHARTS_DIR, name))
@@ -0,0 +1,263 @@
+"""
+Capa de acceso a datos compartida por todas las vistas de la aplicación (./vistas).
+
+Cada tabla se lee una sola vez por proceso y se memoiza por ruta y fecha de
+modificación (mtime) del archivo. Si el archivo cambia en disco, la siguiente
+llamada lo vuelve a leer de forma automática. Todas las vistas reciben el
+mismo DataFrame, por lo que NO deben modificarlo en sitio (usar .copy()).
+
+Las tablas con snapshot Parquet (ver aurelion.snapshots) se leen desde el
+snapshot ya tipado, proyectando solo las columnas solicitadas.
+"""
+import os
+import threading
+
+import pandas as pd
+
+from aurelion import aggregates, exogenous, fact_table, metrics, segments, snapshots, streaming
+from aurelion.sales_index import SalesIndex
+
+DATA_DIR = snapshots.DATA_DIR
+
+# Rutas de las fuentes de datos usadas por la aplicación.
+VENTAS_PATH = os.path.join(DATA_DIR, "ventas.xlsx")
+DETALLE_VENTAS_PATH = os.path.join(DATA_DIR, "detalle_ventas.xlsx")
+CLIENTES_PATH = os.path.join(DATA_DIR, "clientes.xlsx")
+PRODUCTOS_PATH = os.path.join(DATA_DIR, "productos_corregidos.xlsx")
+UNIFIED_NOT_CLEAN_PATH = os.path.join(DATA_DIR, "df_unified_not_clean.csv")
+UNIFIED_CLEAN_PATH = os.path.join(DATA_DIR, "df_unified_clean.csv")
+EXPANDED_PATH = os.path.join(DATA_DIR, "df_expanded.csv")
+PREDICTIONS_PATH = os.path.join(DATA_DIR, "sales_predictions_2024_2025_final.csv")
+PREDICTIONS_BY_SERIES_PATH = os.path.join(DATA_DIR, "sales_predictions_by_series.csv")
+
+# Caché del proceso: clave -> (mtime, DataFrame, bytes en memoria).
+_cache = {}
+_lock = threading.Lock()
+
+
+def _read_source(path, **read_kwargs):
+    """Lee un archivo de datos según su extensión."""
+    if path.endswith((".xlsx", ".xls")):
+        return pd.read_excel(path, **read_kwargs)
+    if path.endswith(".csv"):
+        return pd.read_csv(path, **read_kwargs)
+    raise ValueError(f"Formato de archivo no soportado: {path}")
+
+
+def _memoized(key, path, loader):
+    """
+    Devuelve la entrada `key` de la caché o la recarga si `path` cambió en disco.
+
+    El tiempo se registra en la fase "carga" de la vista en curso junto con el
+    acierto o fallo de la caché y la memoria del DataFrame (ver aurelion.metrics).
+    """
+    with metrics.phase(metrics.LOAD):
+        mtime = os.stat(path).st_mtime_ns
+
+        with _lock:
+            entry = _cache.get(key)
+        if entry is not None and entry[0] == mtime:
+            metrics.count_cache("data_access", hit=True)
+            metrics.track_frame(key, entry[2])
+            return entry[1]
+
+        metrics.count_cache("data_access", hit=False)
+        df = loader()
+        nbytes = metrics.frame_bytes(df)
+        with _lock:
+            _cache[key] = (mtime, df, nbytes)
+        metrics.track_frame(key, nbytes)
+        return df
+
+
+def load_table(path, **read_kwargs):
+    """
+    Devuelve la tabla almacenada en `path`, leyéndola solo si no está en caché
+    o si el archivo cambió en disco desde la última lectura.
+
+    Args:
+        path: Ruta del archivo (.xlsx o .csv).
+        **read_kwargs: Argumentos adicionales para pd.read_excel / pd.read_csv.
+
+    Returns:
+        DataFrame compartido. No debe modificarse en sitio.
+    """
+    key = (
+        os.path.abspath(path),
+        tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in read_kwargs.items())),
+    )
+    return _memoized(key, path, lambda: _read_source(path, **read_kwargs))
+
+
+def load_dataset(name, columns=None):
+    """
+    Devuelve la tabla tipada `name` desde su snapshot Parquet.
+
+    Si el snapshot no existe o es anterior a su archivo fuente, se regenera
+    antes de leerlo. Si no puede escribirse (p. ej. disco de solo lectura),
+    la tabla se lee y tipa directamente desde la fuente.
+
+    Args:
+        name: Nombre de la tabla (clave de snapshots.SOURCES).
+        columns: Columnas a proyectar. None devuelve todas.
+
+    Returns:
+        DataFrame compartido. No debe modificarse en sitio.
+    """
+    columns = tuple(columns) if columns is not None else None
+    projection = list(columns) if columns is not None else None
+
+    if not snapshots.is_fresh(name):
+        try:
+            snapshots.write_snapshot(name)
+        except OSError:
+            source = snapshots.SOURCES[name]
+            return _memoized(
+                ("source", name, columns), source,
+                lambda: snapshots.read_source(name, projection),
+            )
+
+    path = snapshots.snapshot_path(name)
+    return _memoized(
+        ("snapshot", name, columns), path,
+        lambda: snapshots.read_snapshot(name, projection),
+    )
+
+
+def clear_cache():
+    """Vacía la caché de tablas del proceso."""
+    with _lock:
+        _cache.clear()
+
+
+# --- Accesos por tabla ---
+def load_ventas(columns=None):
+    """Tabla de ventas (ventas.xlsx)."""
+    return load_dataset("ventas", columns)
+
+
+def load_detalle_ventas(columns=None):
+    """Tabla de detalle de ventas (detalle_ventas.xlsx)."""
+    return load_dataset("detalle_ventas", columns)
+
+
+def load_clientes(columns=None):
+    """Tabla de clientes (clientes.xlsx)."""
+    return load_dataset("clientes", columns)
+
+
+def load_productos(columns=None):
+    """Catálogo de productos con categorías corregidas (productos_corregidos.xlsx)."""
+    return load_dataset("productos_corregidos", columns)
+
+
+def load_unified_not_clean():
+    """DataFrame unificado previo a la limpieza (df_unified_not_clean.csv)."""
+    return load_table(UNIFIED_NOT_CLEAN_PATH)
+
+
+def load_unified_clean(columns=None):
+    """DataFrame unificado y limpio (df_unified_clean.csv)."""
+    return load_dataset("df_unified_clean", columns)
+
+
+def load_expanded(columns=None):
+    """Histórico expandido usado para el modelo de predicción (df_expanded.csv)."""
+    return load_dataset("df_expanded", columns)
+
+
+def load_monthly_sales():
+    """
+    Ventas mensuales totales ('date', 'sales') del histórico expandido,
+    agregadas por bloques sin cargar el histórico completo.
+    """
+    return _memoized(
+        ("monthly_sales", "df_expanded"),
+        snapshots.SOURCES["df_expanded"],
+        streaming.monthly_sales,
+    )
+
+
+def load_series_sales(segmento, serie):
+    """
+    Ventas mensuales ('date', 'sales') de una serie del histórico expandido
+    (ver aurelion.segments.stream_series_sales).
+    """
+    return _memoized(
+        ("series_sales", "df_expanded", segmento, serie),
+        snapshots.SOURCES["df_expanded"],
+        lambda: segments.stream_series_sales(segmento, serie),
+    )
+
+
+def load_fact_table(columns=None):
+    """
+    Tabla de hechos unificada y tipada (ver aurelion.fact_table).
+
+    Se reconstruye solo si alguna de sus fuentes cambió desde la última vez e
+    incluye los lotes añadidos con fact_table.append_batch().
+    """
+    fact_table.ensure_fact_table()
+    projection = list(columns) if columns is not None else None
+    return _memoized(
+        ("snapshot", fact_table.FACT_NAME, tuple(columns) if columns is not None else None),
+        fact_table.fact_path(),
+        lambda: fact_table.read_fact_table(projection),
+    )
+
+
+def load_cube():
+    """
+    Cubo de ventas por día, categoría, ciudad, medio de pago y producto
+    (ver aurelion.aggregates.rollup_cube para cortarlo y resumirlo).
+    """
+    fact_table.ensure_fact_table()
+    return _memoized(
+        ("aggregate", aggregates.CUBE_NAME),
+        aggregates.aggregate_path(aggregates.CUBE_NAME),
+        lambda: aggregates.load_rollup(aggregates.CUBE_NAME),
+    )
+
+
+def load_unified_merged():
+    """Unión cruda de las cuatro tablas fuente, previa a la limpieza (sección 2 del EDA)."""
+    fact_table.ensure_fact_table()
+    return _memoized(
+        ("snapshot", fact_table.MERGED_NAME, None),
+        snapshots.snapshot_path(fact_table.MERGED_NAME),
+        lambda: snapshots.read_snapshot(fact_table.MERGED_NAME),
+    )
+
+
+def load_sales_index():
+    """Índices de búsqueda sobre la tabla de hechos (ver aurelion.sales_index)."""
+    fact_table.ensure_fact_table()
+    return _memoized(
+        ("index", fact_table.FACT_NAME),
+        fact_table.fact_path(),
+        lambda: SalesIndex(load_fact_table()),
+    )
+
+
+def load_exogenous(lags=exogenous.LAGS, windows=exogenous.WINDOWS):
+    """
+    Almacén de features exógenas mensuales (ver aurelion.exogenous), ampliado
+    con los meses nuevos del CSV de supermercados antes de leerlo.
+    """
+    lags, windows = tuple(sorted(set(lags))), tuple(sorted(set(windows)))
+    exogenous.update_store(lags, windows)
+    return _memoized(
+        ("exogenous", lags, windows),
+        exogenous.store_path(lags, windows),
+        lambda: pd.read_parquet(exogenous.store_path(lags, windows)).set_index("date"),
+    )
+
+
+def load_predictions():
+    """Predicciones de ventas exportadas por train_model.py."""
+    return load_table(PREDICTIONS_PATH)
+
+
+def load_predictions_by_series():
+    """Predicciones por segmento y serie exportadas por forecast_segments.py."""
+    return load_table(PREDICTIONS_BY_SERIES_PATH, parse_dates=["date"])
@@ -0,0 +1,229 @@
+"""
+Índice invertido para la búsqueda en la documentación y en el EDA.
+
+El índice se construye una sola vez por proceso sobre README.md,
+instrucciones.md y los bloques de texto del EDA (extraídos de vistas/eda.py
+sin ejecutarlo) y se reconstruye solo si alguno de esos archivos cambia.
+Cada línea de texto es un documento del índice.
+
+La tokenización ignora acentos y mayúsculas ("análisis" == "ANALISIS") y cada
+palabra buscada coincide también como prefijo ("pronost" encuentra
+"pronóstico"). Los resultados se ordenan por relevancia (tf-idf) entre todas
+las secciones.
+"""
+import ast
+import bisect
+import math
+import os
+import re
+import textwrap
+import threading
+import unicodedata
+from collections import Counter, defaultdict, namedtuple
+
+README_PATH = "./README.md"
+INSTRUCTIONS_PATH = "./instrucciones.md"
+EDA_SOURCE_PATH = "./vistas/eda.py"
+
+EDA_SOURCE = "EDA"
+
+# Llamadas de Streamlit cuyo texto literal se indexa en el EDA.
+_EDA_TEXT_CALLS = {"markdown", "write", "header", "subheader", "info"}
+# Peso de una coincidencia por prefijo frente a una palabra completa.
+_PREFIX_WEIGHT = 0.5
+
+_WORD = re.compile(r"\w+")
+
+Hit = namedtuple("Hit", ["source", "section", "text", "score"])
+# Sección de un documento Markdown: título, contenido y encabezados "###" que contiene.
+Section = namedtuple("Section", ["title", "content", "subsections"])
+
+
+def _fold_char(char):
+    # Primer carácter de la forma NFKD en minúsculas: "Á" -> "a", "ñ" -> "n".
+    return unicodedata.normalize("NFKD", char)[0].lower()[0]
+
+
+def fold(text):
+    """Texto en minúsculas y sin acentos, con la misma longitud que `text`."""
+    return "".join(_fold_char(char) for char in text)
+
+
+def tokenize(text):
+    """Palabras de `text` normalizadas (sin acentos ni mayúsculas)."""
+    return _WORD.findall(fold(text))
+
+
+def highlight(text, query, template="**:red[{}]**"):
+    """Resalta en `text` las palabras que empiezan por algún término de `query`."""
+    terms = tokenize(query)
+    if not terms:
+        return text
+    parts, last = [], 0
+    for match in _WORD.finditer(fold(text)):
+        if match.group().startswith(tuple(terms)):
+            parts.append(text[last:match.start()])
+            parts.append(template.format(text[match.start():match.end()]))
+            last = match.end()
+    parts.append(text[last:])
+    return "".join(parts)
+
+
+class SearchIndex:
+    """Índice invertido término -> {documento: frecuencia} con búsqueda por prefijo."""
+
+    def __init__(self):
+        self.documents = []
+        self.postings = defaultdict(dict)
+        # Fuente -> lista de Section de los documentos Markdown indexados.
+        self.sections = {}
+        self._vocabulary = None
+
+    def add(self, source, section, text):
+        """Indexa cada línea no vacía de `text` como un documento."""
+        for line in text.split("\n"):
+            tokens = tokenize(line)
+            if not tokens:
+                continue
+            doc_id = len(self.documents)
+            self.documents.append((source, section, line.strip()))
+            for term, count in Counter(tokens).items():
+                self.postings[term][doc_id] = count
+        self._vocabulary = None
+
+    def _expand(self, term):
+        """Términos del vocabulario que empiezan por `term`."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        start = bisect.bisect_left(self._vocabulary, term)
+        end = bisect.bisect_left(self._vocabulary, term + "\uffff")
+        return self._vocabulary[start:end]
+
+    def search(self, query, sources=None, limit=20):
+        """
+        Busca `query` y devuelve los resultados más relevantes.
+
+        Un documento es resultado si contiene todas las palabras de la consulta
+        (completas o como prefijo).
+
+        Args:
+            query: Texto a buscar.
+            sources: Fuentes en las que buscar (p. ej. ["README.md"]); None = todas.
+            limit: Número máximo de resultados.
+
+        Returns:
+            Lista de Hit ordenada por puntuación descendente.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        n_docs = len(self.documents)
+        scores = None
+        for term in terms:
+            term_scores = {}
+            for candidate in self._expand(term):
+                postings = self.postings[candidate]
+                weight = math.log(1 + n_docs / len(postings))
+                if candidate != term:
+                    weight *= _PREFIX_WEIGHT
+                for doc_id, count in postings.items():
+                    score = count * weight
+                    if score > term_scores.get(doc_id, 0):
+                        term_scores[doc_id] = score
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {doc_id: scores[doc_id] + score
+                          for doc_id, score in term_scores.items() if doc_id in scores}
+            if not scores:
+                return []
+
+        if sources is not None:
+            sources = set(sources)
+            scores = {doc_id: score for doc_id, score in scores.items()
+                      if self.documents[doc_id][0] in sources}
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [Hit(*self.documents[doc_id], score) for doc_id, score in ranked]
+
+
+def markdown_sections(path):
+    """Divide un archivo Markdown en (título, contenido) por sus encabezados "## "."""
+    with open(path, "r", encoding="utf-8") as file:
+        content = file.read()
+    sections = content.split("\n## ")
+    result = [(sections[0].split("\n")[0].replace("# ", ""), sections[0])]
+    result += [(section.split("\n")[0], "## " + section) for section in sections[1:]]
+    return result
+
+
+def eda_sections(path=EDA_SOURCE_PATH):
+    """
+    Textos literales de cada sección del EDA en vistas/eda.py.
+
+    Recorre el árbol sintáctico de see_eda() sin ejecutarlo y reúne, por cada
+    rama `selected_section == "..."`, los textos de st.markdown, st.write, etc.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        tree = ast.parse(file.read())
+
+    function = next(node for node in ast.walk(tree)
+                    if isinstance(node, ast.FunctionDef) and node.name == "see_eda")
+    result = []
+    for node in ast.walk(function):
+        if not (isinstance(node, ast.If) and isinstance(node.test, ast.Compare)):
+            continue
+        test = node.test
+        if not (isinstance(test.left, ast.Name) and test.left.id == "selected_section"
+                and isinstance(test.comparators[0], ast.Constant)):
+            continue
+        texts = []
+        for statement in node.body:
+            for call in ast.walk(statement):
+                if (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)
+                        and call.func.attr in _EDA_TEXT_CALLS and call.args
+                        and isinstance(call.args[0], ast.Constant)
+                        and isinstance(call.args[0].value, str)):
+                    texts.append(textwrap.dedent(call.args[0].value).strip())
+        result.append((test.comparators[0].value, "\n".join(texts)))
+    return result
+
+
+def build_index():
+    """Construye el índice sobre README.md, instrucciones.md y el EDA."""
+    index = SearchIndex()
+    for path, source in [(README_PATH, "README.md"), (INSTRUCTIONS_PATH, "instrucciones.md")]:
+        index.sections[source] = []
+        for section, text in markdown_sections(path):
+            index.add(source, section, text)
+            subsections = [line.replace("### ", "") for line in text.split("\n") if line.startswith("###")]
+            index.sections[source].append(Section(section, text, subsections))
+    for section, text in eda_sections():
+        index.add(EDA_SOURCE, section, text)
+    return index
+
+
+_index = None
+_index_mtimes = None
+_lock = threading.Lock()
+
+
+def get_index():
+    """Índice compartido del proceso; se reconstruye si algún archivo fuente cambió."""
+    global _index, _index_mtimes
+    mtimes = tuple(os.stat(path).st_mtime_ns for path in (README_PATH, INSTRUCTIONS_PATH, EDA_SOURCE_PATH))
+    with _lock:
+        if _index is None or _index_mtimes != mtimes:
+            _index = build_index()
+            _index_mtimes = mtimes
+        return _index
+
+
+def document_sections(source="README.md"):
+    """Secciones (Section) de un documento Markdown del índice compartido."""
+    return get_index().sections[source]
+
+
+def search(query, sources=None, limit=20):
+    """Busca `query` en el índice compartido (ver SearchIndex.search)."""
+    return get_index().search(query, sources=sources, limit=limit)
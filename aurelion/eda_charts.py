@@ -0,0 +1,174 @@
+"""
+Gráficos estáticos de las secciones 4, 5 y 6 del EDA.
+
+Cada función dibuja sobre una Figure de matplotlib (API orientada a objetos,
+sin estado global de pyplot), por lo que pueden ejecutarse en paralelo en
+procesos distintos. La firma es siempre `función(fig, df, **parámetros)`.
+
+Los gráficos de totales por grupo reciben el cubo de aurelion.aggregates en
+lugar de las filas de la tabla de hechos.
+
+seaborn se importa al dibujar el primer gráfico: el proceso de Streamlit solo
+necesita este módulo para calcular las claves de caché de chart_cache.
+"""
+import pandas as pd
+
+from aurelion.aggregates import rollup_cube
+from aurelion.lazy import lazy_import
+
+sns = lazy_import("seaborn")
+
+
+# --- Sección 4: Tratamiento de datos atípicos ---
+def boxplot(fig, df, column):
+    """Boxplot de una columna numérica."""
+    ax = fig.subplots()
+    sns.boxplot(x=df[column], ax=ax)
+    ax.set_title(f"Boxplot de {column}")
+
+
+# --- Sección 5: Análisis univariado ---
+def histogram(fig, df, column):
+    """Histograma con KDE y líneas de media y mediana."""
+    desc = df[column].describe()
+    ax = fig.subplots()
+    sns.histplot(df[column].dropna().unique(), kde=True, ax=ax)
+    ax.axvline(desc["mean"], color='r', linestyle='--', label='Media')
+    ax.axvline(desc["50%"], color='darkblue', linestyle='-', label='Mediana')
+    ax.set_title(f"Distribución de {column}")
+    ax.legend()
+
+
+def value_counts_bar(fig, df, column, xlabel, title):
+    """Gráfico de barras con la frecuencia de cada valor de la columna."""
+    counts = df[column].value_counts()
+    ax = fig.subplots()
+    sns.barplot(x=counts.index, y=counts.values, ax=ax)
+    ax.set_ylabel("Frecuencia")
+    ax.set_xlabel(xlabel)
+    ax.set_title(title)
+
+
+def top_pie(fig, df, column, top=5):
+    """Gráfico de pastel con los `top` valores más frecuentes y el resto como "Otros"."""
+    top_values = df[column].value_counts().head(top)
+    grouped_values = df[column].apply(lambda x: x if x in top_values.index else 'Otros')
+    counts = grouped_values.value_counts()
+    ax = fig.subplots()
+    ax.pie(counts.values, labels=counts.index, colors=sns.color_palette('mako'), autopct='%.0f%%', counterclock=False)
+    ax.set_title(f"Gráfico de pastel de la variable {column}")
+
+
+def monthly_count_line(fig, df, column):
+    """Línea de tiempo con el número de registros por mes de una columna de fecha."""
+    dates = pd.to_datetime(df[column].dropna())
+    per_month = dates.dt.to_period("M").value_counts().sort_index()
+    ax = fig.subplots()
+    per_month.plot(ax=ax)
+    ax.set_title(f"Evolución temporal de {column}")
+    ax.set_xlabel("Mes")
+    ax.set_ylabel("Frecuencia")
+
+
+# --- Sección 6: Análisis bivariado ---
+def numeric_correlation_heatmap(fig, df):
+    """Mapa de calor de la correlación de Pearson entre todas las columnas numéricas."""
+    corr_matrix = df.select_dtypes(include="number").corr(method='pearson')
+    ax = fig.subplots()
+    sns.heatmap(corr_matrix, annot=True, cmap="YlGnBu", fmt=".2f", linewidths=0.5, ax=ax)
+    ax.set_title("Matriz de correlación entre variables - Tienda Aurrelion")
+    fig.tight_layout()
+
+
+def correlation_heatmap(fig, df, columns, title='Mapa de Calor de Correlación'):
+    """Mapa de calor de la correlación entre `columns`."""
+    corr_matrix = df[list(columns)].corr()
+    ax = fig.subplots()
+    sns.heatmap(corr_matrix, annot=True, fmt='.2f', cmap='viridis', cbar=True, annot_kws={"size": 12}, ax=ax)
+    ax.set_title(title, fontsize=16)
+    ax.tick_params(axis='x', labelrotation=45, labelsize=10)
+    ax.tick_params(axis='y', labelrotation=0, labelsize=10)
+    fig.tight_layout()
+
+
+def total_by_bar(fig, cube, column, palette, title, xlabel):
+    """Barras con el importe total por valor de `column`, de mayor a menor."""
+    totals = rollup_cube(cube, [column])['importe'].sort_values(ascending=False)
+    ax = fig.subplots()
+    totals.plot(kind='bar', color=sns.color_palette(palette, len(totals)), ax=ax)
+    ax.set_title(title, fontsize=16)
+    ax.set_ylabel('Ingresos Totales (Importe)', fontsize=12)
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.tick_params(axis='x', labelrotation=45, labelsize=10)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment('right')
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+    fig.tight_layout()
+
+
+def category_price_boxplot(fig, df):
+    """Boxplot del precio unitario por categoría."""
+    ax = fig.subplots()
+    sns.boxplot(x='categoria', y='precio_unitario', data=df, hue='categoria', palette='viridis', legend=False, ax=ax)
+    ax.set_title('Distribución de Precios Unitarios por Categoría', fontsize=16)
+    ax.set_ylabel('Precio Unitario', fontsize=12)
+    ax.set_xlabel('Categoría', fontsize=12)
+    ax.tick_params(axis='x', labelrotation=45, labelsize=10)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment('right')
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+    fig.tight_layout()
+
+
+def category_payment_heatmap(fig, cube):
+    """Mapa de calor con la frecuencia de cada medio de pago por categoría."""
+    contingency_table = rollup_cube(cube, ['categoria', 'medio_pago'])['items'].unstack(fill_value=0)
+    ax = fig.subplots()
+    sns.heatmap(contingency_table, annot=True, fmt='d', cmap='YlGnBu', cbar=True, annot_kws={"size": 12}, ax=ax)
+    ax.set_title('Frecuencia de Medio de Pago por Categoría\n(Categórico vs. Categórico)', fontsize=16)
+    ax.set_ylabel('Categoría', fontsize=12)
+    ax.set_xlabel('Medio de Pago', fontsize=12)
+    ax.tick_params(axis='y', labelrotation=0, labelsize=10)
+    fig.tight_layout()
+
+
+def city_payment_stacked(fig, cube):
+    """Barras apiladas con el importe por medio de pago en cada ciudad."""
+    table = rollup_cube(cube, ['ciudad', 'medio_pago'])['importe'].unstack(fill_value=0)
+    table = table.loc[table.sum(axis=1).sort_values(ascending=False).index]
+    ax = fig.subplots()
+    table.plot(kind='bar', stacked=True, colormap='mako', ax=ax)
+    ax.set_title('Ingresos por Medio de Pago en cada Ciudad', fontsize=16)
+    ax.set_ylabel('Ingresos Totales (Importe)', fontsize=12)
+    ax.set_xlabel('Ciudad', fontsize=12)
+    ax.tick_params(axis='x', labelrotation=45, labelsize=10)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment('right')
+    ax.legend(title='Medio de Pago', fontsize=10)
+    ax.grid(axis='y', linestyle='--', alpha=0.5)
+    fig.tight_layout()
+
+
+def category_payment_stacked(fig, cube):
+    """Barras apiladas con la frecuencia de cada medio de pago por categoría."""
+    table = rollup_cube(cube, ['categoria', 'medio_pago'])['items'].unstack(fill_value=0)
+    ax = fig.subplots()
+    table.plot(kind='bar', stacked=True, colormap='mako', ax=ax)
+    ax.set_title('Medio de Pago por Categoría', fontsize=16)
+    ax.set_ylabel('Frecuencia', fontsize=12)
+    ax.set_xlabel('Categoría', fontsize=12)
+    ax.tick_params(axis='x', labelrotation=0, labelsize=10)
+    ax.legend(title='Medio de Pago', fontsize=10)
+    fig.tight_layout()
+
+
+def monthly_revenue_line(fig, cube, title='Ingresos Totales por mes 2024'):
+    """Línea con los ingresos totales por mes."""
+    monthly = rollup_cube(cube, ['mes'])['importe']
+    ax = fig.subplots()
+    monthly.plot(kind='line', marker='o', linestyle='-', color='dodgerblue', ax=ax)
+    ax.set_title(title, fontsize=16)
+    ax.set_ylabel('Ingresos Totales (Importe)', fontsize=12)
+    ax.set_xlabel('Mes', fontsize=12)
+    ax.grid(True, linestyle='--', alpha=0.7)
+    fig.tight_layout()
@@ -0,0 +1,249 @@
+"""
+Almacén de features exógenas mensuales a partir del índice nacional de ventas
+de supermercados (ventas-totales-supermercados-2.csv).
+
+El CSV se lee una sola vez y se alinea a fin de mes, igual que las ventas
+mensuales de train_model.py. Las columnas en pesos corrientes se expresan como
+participación en el total de su desglose (canal de venta, medio de pago y
+grupo de artículos): con la inflación del período su nivel refleja precios y
+no volumen. Se agregan las ventas a precios constantes y la inflación mensual
+implícita (variación del cociente entre precios corrientes y constantes).
+
+Sobre esa matriz alineada se calculan lags y medias móviles de los meses
+anteriores (nunca del mes actual, que se publica después de cerrado el mes),
+con nombres "exo_<columna>_lag_<k>" y "exo_<columna>_rolling_mean_<w>". El
+almacén incluye además el mes siguiente al último dato, cuyas features ya se
+conocen.
+
+La matriz se guarda en Parquet por configuración de lags y ventanas. Cuando el
+CSV trae meses nuevos, solo se calculan las features de esos meses (con los
+últimos meses guardados como contexto) y se agregan al final; si cambió algún
+mes ya guardado, el almacén se reconstruye.
+
+Uso:
+    python -m aurelion.exogenous --lags 1 12 --ventanas 3
+"""
+import argparse
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from aurelion import snapshots
+
+SOURCE_PATH = os.path.join(snapshots.DATA_DIR, "ventas-totales-supermercados-2.csv")
+EXOGENOUS_DIR = os.path.join(snapshots.SNAPSHOT_DIR, "exogenous")
+CONFIG_METADATA_KEY = b"aurelion_exogenous"
+
+PREFIX = "exo_"
+LAGS = (1, 12)
+WINDOWS = (3,)
+
+# Total del desglose -> columnas que se expresan como participación en ese total.
+SHARES = {
+    "ventas_totales_canal_venta": ["salon_ventas", "canales_on_line"],
+    "ventas_totales_medio_pago": ["efectivo", "tarjetas_debito", "tarjetas_credito", "otros_medios"],
+    "ventas_totales_grupo_articulos": [
+        "subtotal_ventas_alimentos_bebidas", "bebidas", "almacen", "panaderia", "lacteos", "carnes",
+        "verduleria_fruteria", "alimentos_preparados_rotiseria", "articulos_limpieza_perfumeria",
+        "indumentaria_calzado_textiles_hogar", "electronicos_articulos_hogar", "otros",
+    ],
+}
+# Columnas de la matriz alineada que usa el modelo si no se indican otras.
+DEFAULT_COLUMNS = ["ventas_precios_constantes", "inflacion", "canales_on_line", "tarjetas_credito"]
+
+
+def store_path(lags=LAGS, windows=WINDOWS):
+    """Ruta del almacén para esta configuración de lags y ventanas."""
+    return os.path.join(EXOGENOUS_DIR, f"features_{_config_key(lags, windows)}.parquet")
+
+
+def _config(lags, windows):
+    return {"lags": sorted(set(lags)), "windows": sorted(set(windows)), "shares": SHARES}
+
+
+def _config_key(lags, windows):
+    payload = json.dumps(_config(lags, windows), sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:12]
+
+
+def load_aligned(path=SOURCE_PATH):
+    """
+    Matriz mensual alineada a fin de mes: ventas a precios constantes,
+    inflación mensual (%) y participación (%) de cada columna de SHARES.
+
+    Returns:
+        DataFrame indexado por 'date' (fin de mes), ordenado por fecha.
+    """
+    source = pd.read_csv(path, parse_dates=["indice_tiempo"])
+    dates = source["indice_tiempo"].dt.to_period("M").dt.to_timestamp(how="end").dt.normalize()
+    prices = source["ventas_precios_corrientes"] / source["ventas_precios_constantes"]
+    columns = {
+        "ventas_precios_constantes": source["ventas_precios_constantes"],
+        "inflacion": prices.pct_change() * 100,
+    }
+    for total, parts in SHARES.items():
+        for part in parts:
+            columns[part] = source[part] / source[total] * 100
+    aligned = pd.DataFrame(columns).set_axis(pd.DatetimeIndex(dates, name="date"))
+    return aligned.sort_index()
+
+
+def feature_names(columns=DEFAULT_COLUMNS, lags=LAGS, windows=WINDOWS):
+    """Nombres de las features exógenas de `columns` con estos `lags` y `windows`."""
+    names = []
+    for column in columns:
+        names += [f"{PREFIX}{column}_lag_{lag}" for lag in lags]
+        names += [f"{PREFIX}{column}_rolling_mean_{window}" for window in windows]
+    return names
+
+
+def parse_names(names):
+    """Lags y ventanas que hacen falta para las features exógenas `names`."""
+    lags, windows = set(), set()
+    for name in names:
+        if not name.startswith(PREFIX):
+            continue
+        stem, _, value = name.rpartition("_")
+        if stem.endswith("_lag"):
+            lags.add(int(value))
+        elif stem.endswith("_rolling_mean"):
+            windows.add(int(value))
+        else:
+            raise ValueError(f"Feature exógena no reconocida: {name}")
+    return tuple(sorted(lags)), tuple(sorted(windows))
+
+
+def compute_features(aligned, lags=LAGS, windows=WINDOWS):
+    """
+    Lags y medias móviles de cada columna de `aligned`, más una fila para el
+    mes siguiente al último dato.
+
+    Returns:
+        DataFrame indexado por 'date' con las columnas de `aligned` (vacías en
+        el mes agregado) y sus features.
+    """
+    ahead = aligned.index[-1] + pd.offsets.MonthEnd(1)
+    aligned = aligned.reindex(aligned.index.append(pd.DatetimeIndex([ahead], name="date")))
+    features = {}
+    for column in aligned.columns:
+        values = aligned[column]
+        for lag in lags:
+            features[f"{PREFIX}{column}_lag_{lag}"] = values.shift(lag)
+        previous = values.shift(1)
+        for window in windows:
+            features[f"{PREFIX}{column}_rolling_mean_{window}"] = previous.rolling(window=window).mean()
+    return pd.concat([aligned, pd.DataFrame(features, index=aligned.index)], axis=1)
+
+
+def _write(store, lags, windows):
+    metadata = {CONFIG_METADATA_KEY: _config_key(lags, windows).encode()}
+    return snapshots.write_parquet(store.reset_index(), store_path(lags, windows), metadata)
+
+
+def is_fresh(lags=LAGS, windows=WINDOWS, path=SOURCE_PATH):
+    """Indica si el almacén existe, es posterior al CSV y fue escrito con esta configuración."""
+    target = store_path(lags, windows)
+    if not os.path.exists(target):
+        return False
+    if os.stat(target).st_mtime_ns < os.stat(path).st_mtime_ns:
+        return False
+    metadata = pq.read_schema(target).metadata or {}
+    return metadata.get(CONFIG_METADATA_KEY) == _config_key(lags, windows).encode()
+
+
+def update_store(lags=LAGS, windows=WINDOWS, path=SOURCE_PATH):
+    """
+    Crea o amplía el almacén de esta configuración a partir del CSV.
+
+    Returns:
+        Tupla (estado, meses_calculados) con estado "vigente", "ampliado" o
+        "reconstruido".
+    """
+    lags, windows = tuple(sorted(set(lags))), tuple(sorted(set(windows)))
+    if is_fresh(lags, windows, path):
+        return "vigente", 0
+
+    aligned = load_aligned(path)
+    target = store_path(lags, windows)
+    if os.path.exists(target):
+        stored = pd.read_parquet(target).set_index("date")
+        # Sin la fila del mes siguiente al último dato, que se recalcula.
+        stored = stored.iloc[:-1]
+        old = aligned.loc[aligned.index <= stored.index[-1]]
+        unchanged = (
+            stored.index.equals(old.index)
+            and np.allclose(stored[aligned.columns].to_numpy(), old.to_numpy(), equal_nan=True)
+        )
+        if unchanged:
+            new = aligned.loc[aligned.index > stored.index[-1]]
+            # Los últimos meses guardados bastan como contexto para los lags y las ventanas.
+            depth = max(lags + windows)
+            context = pd.concat([old.iloc[-depth:], new])
+            rows = compute_features(context, lags, windows).loc[lambda df: df.index > stored.index[-1]]
+            _write(pd.concat([stored, rows]), lags, windows)
+            return "ampliado", len(new)
+
+    _write(compute_features(aligned, lags, windows), lags, windows)
+    return "reconstruido", len(aligned)
+
+
+def load_features(names):
+    """
+    Features exógenas `names` del almacén (actualizado si hace falta).
+
+    Returns:
+        DataFrame indexado por 'date' (fin de mes). No debe modificarse en sitio.
+    """
+    from aurelion import data_access
+
+    lags, windows = parse_names(names)
+    return data_access.load_exogenous(lags, windows)[list(names)]
+
+
+def join_features(df_features, names):
+    """Agrega a la salida de create_features las features exógenas `names` del mismo mes."""
+    return df_features.merge(load_features(names), left_on="date", right_index=True, how="left")
+
+
+def future_values(features, dates, as_of=None):
+    """
+    Valores de las features exógenas para `dates` (p. ej. los meses de un pronóstico).
+
+    Los meses posteriores a los datos disponibles repiten los últimos valores
+    conocidos.
+
+    Args:
+        features: DataFrame indexado por fecha (ver load_features).
+        dates: Fechas de fin de mes.
+        as_of: Último mes cuyos datos macro se consideran publicados (p. ej. el
+            origen de un backtest); None usa todo el almacén.
+
+    Returns:
+        Array de forma (len(dates) x columnas).
+    """
+    if as_of is not None:
+        features = features.loc[:pd.Timestamp(as_of) + pd.offsets.MonthEnd(1)]
+    dates = pd.DatetimeIndex(dates)
+    known = features.reindex(features.index.union(dates)).ffill()
+    return known.loc[dates].to_numpy(dtype=float)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crea o amplía el almacén de features exógenas mensuales.")
+    parser.add_argument('--lags', type=int, nargs='+', default=list(LAGS), help="Lags de las features exógenas.")
+    parser.add_argument('--ventanas', type=int, nargs='+', default=list(WINDOWS),
+                        help="Ventanas de las medias móviles exógenas.")
+    args = parser.parse_args()
+
+    state, months = update_store(args.lags, args.ventanas)
+    store = pd.read_parquet(store_path(args.lags, args.ventanas))
+    print(f"Almacén {state} ({months} meses calculados): {len(store)} meses, "
+          f"{store['date'].min():%Y-%m} a {store['date'].max():%Y-%m}, en '{store_path(args.lags, args.ventanas)}'")
+
+
+if __name__ == "__main__":
+    main()
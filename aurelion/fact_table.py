@@ -0,0 +1,341 @@
+"""
+Tabla de hechos unificada de ventas (ventas + detalle_ventas + productos + clientes).
+
+La tabla se materializa una sola vez en Parquet junto con un manifiesto JSON
+con las sumas de verificación (SHA-256) de sus fuentes. Solo se reconstruye
+cuando alguna fuente cambia, de modo que las uniones y la eliminación de
+columnas duplicadas nunca se ejecutan durante una petición interactiva.
+
+La tabla se guarda como un directorio de particiones: part-00000.parquet
+contiene las filas derivadas de los Excel y cada lote añadido con
+append_batch() se escribe en una partición nueva, sin reescribir las
+anteriores. Las particiones de lotes se conservan al reconstruir la base.
+"""
+import hashlib
+import json
+import os
+import threading
+
+import pandas as pd
+
+from aurelion import aggregates, snapshots
+
+FACT_NAME = "fact_ventas"
+MERGED_NAME = "unified_merged"
+
+# Tablas fuente de la tabla de hechos.
+SOURCE_TABLES = ["ventas", "detalle_ventas", "productos_corregidos", "clientes"]
+
+BASE_PART = "part-00000.parquet"
+
+# Columnas de la unión cruda que repiten otra columna (las que drop_duplicate_columns
+# elimina sobre el histórico completo): datos del producto y del cliente que ya
+# vienen en detalle_ventas y ventas.
+MERGE_DUPLICATE_COLUMNS = ["nombre_producto_producto", "precio_unitario_producto",
+                           "nombre_cliente_cliente", "email_cliente"]
+
+# Columnas obligatorias de un lote nuevo.
+BATCH_VENTAS_COLUMNS = list(snapshots.SCHEMAS["ventas"])
+BATCH_DETALLE_COLUMNS = list(snapshots.SCHEMAS["detalle_ventas"])
+
+_build_lock = threading.Lock()
+
+
+def fact_path():
+    """Directorio con las particiones de la tabla de hechos."""
+    return os.path.join(snapshots.SNAPSHOT_DIR, FACT_NAME)
+
+
+def read_fact_table(columns=None):
+    """Lee todas las particiones de la tabla de hechos, proyectando `columns`."""
+    return snapshots.apply_schema(pd.read_parquet(fact_path(), columns=columns), "df_unified_clean")
+
+
+def manifest_path():
+    """Ruta del manifiesto con las sumas de verificación de las fuentes."""
+    return os.path.join(snapshots.SNAPSHOT_DIR, f"{FACT_NAME}.json")
+
+
+def file_checksum(path, chunk_size=1 << 20):
+    """Suma SHA-256 del contenido de un archivo."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def drop_duplicate_columns(df):
+    """
+    Elimina las columnas cuyo contenido repite el de una columna anterior.
+
+    Equivale a df.T.drop_duplicates().T, pero compara las columnas por su hash
+    de contenido (confirmando con .equals) sin transponer la tabla, por lo que
+    conserva los tipos de datos originales.
+    """
+    first_by_hash = {}
+    keep = []
+    for col in df.columns:
+        values = df[col]
+        key = (str(values.dtype), pd.util.hash_pandas_object(values, index=False).to_numpy().tobytes())
+        candidates = first_by_hash.setdefault(key, [])
+        if any(values.equals(df[other]) for other in candidates):
+            continue
+        candidates.append(col)
+        keep.append(col)
+    return df[keep]
+
+
+def merge_sources(ventas, detalle_ventas, productos, clientes):
+    """Une las cuatro tablas fuente tal como lo describe la sección 2 del EDA."""
+    df_unified = ventas.merge(detalle_ventas, on="id_venta", suffixes=("_ventas", "_dventas"))
+    df_unified = df_unified.merge(productos, on="id_producto", suffixes=("_dventas", "_producto"))
+    df_unified = df_unified.merge(clientes, on="id_cliente", suffixes=("_ventas", "_cliente"))
+    return df_unified
+
+
+def clean_unified(df_merged, by_name=False):
+    """
+    Convierte la unión cruda en la tabla de hechos limpia: sin columnas ni filas
+    duplicadas, con los nombres de df_unified_clean.csv y tipada.
+
+    Args:
+        df_merged: Salida de merge_sources.
+        by_name: Si es True, elimina las columnas de MERGE_DUPLICATE_COLUMNS por
+            nombre en lugar de comparar su contenido. Se usa con los lotes: en
+            pocas filas, columnas distintas pueden tener los mismos valores.
+    """
+    if by_name:
+        df_unified = df_merged.drop(columns=MERGE_DUPLICATE_COLUMNS)
+    else:
+        df_unified = drop_duplicate_columns(df_merged)
+    df_unified = df_unified.rename(
+        columns={
+            "nombre_cliente_ventas": "nombre_cliente",
+            "email_ventas": "email",
+            "nombre_producto_dventas": "nombre_producto",
+            "precio_unitario_dventas": "precio_unitario",
+            "fecha": "fecha_venta",
+            "fecha_alta": "fecha_alta_cliente",
+        }
+    )
+    df_unified = df_unified.drop(columns=["categoria"])
+    df_unified = df_unified.rename(columns={"categoria_corregida": "categoria"})
+    df_unified = df_unified.drop_duplicates().reset_index(drop=True)
+    return snapshots.apply_schema(df_unified[list(snapshots.SCHEMAS["df_unified_clean"])], "df_unified_clean")
+
+
+def _read_manifest():
+    try:
+        with open(manifest_path(), "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _source_state():
+    """Estado actual (mtime) de cada archivo fuente."""
+    return {name: os.stat(snapshots.SOURCES[name]).st_mtime_ns for name in SOURCE_TABLES}
+
+
+def is_fresh():
+    """
+    Indica si la tabla de hechos materializada corresponde a las fuentes actuales.
+
+    Si solo cambió el mtime de alguna fuente, se recalcula su suma de verificación
+    y, si el contenido es el mismo, se actualiza el manifiesto sin reconstruir.
+    """
+    manifest = _read_manifest()
+    if manifest is None or not os.path.exists(os.path.join(fact_path(), BASE_PART)):
+        return False
+    if manifest.get("schema") != snapshots.schema_version("df_unified_clean"):
+        return False
+
+    sources = manifest.get("sources", {})
+    mtimes = _source_state()
+    if all(sources.get(name, {}).get("mtime") == mtime for name, mtime in mtimes.items()):
+        return True
+
+    for name, mtime in mtimes.items():
+        if sources.get(name, {}).get("mtime") == mtime:
+            continue
+        if sources.get(name, {}).get("sha256") != file_checksum(snapshots.SOURCES[name]):
+            return False
+        sources[name]["mtime"] = mtime
+    _write_manifest(manifest)
+    return True
+
+
+def content_fingerprint():
+    """
+    Huella SHA-256 del contenido de la tabla de hechos según su manifiesto:
+    versión del esquema, suma de cada fuente y lotes añadidos. No depende de
+    los mtime que is_fresh() actualiza en el manifiesto.
+    """
+    manifest = _read_manifest() or {}
+    payload = json.dumps(
+        {
+            "schema": manifest.get("schema"),
+            "sources": {name: entry.get("sha256") for name, entry in manifest.get("sources", {}).items()},
+            "increments": manifest.get("increments", []),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _write_manifest(manifest):
+    tmp_path = manifest_path() + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2)
+    os.replace(tmp_path, manifest_path())
+
+
+def build_fact_table():
+    """
+    Construye y materializa la tabla de hechos y la unión cruda previa a la limpieza.
+
+    Solo se reescribe la partición base; las particiones de lotes añadidos con
+    append_batch() se conservan (convertidas al esquema actual si cambió) y los
+    agregados se recalculan sobre el total.
+
+    Returns:
+        DataFrame con la tabla de hechos (base y lotes).
+    """
+    tables = [snapshots.read_table(name) for name in SOURCE_TABLES]
+    df_merged = merge_sources(*tables)
+    df_base = clean_unified(df_merged)
+
+    manifest = _read_manifest() or {}
+    increments = manifest.get("increments", [])
+    schema = snapshots.schema_version("df_unified_clean")
+    if manifest.get("schema") != schema:
+        for increment in increments:
+            path = os.path.join(fact_path(), increment["part"])
+            snapshots.write_parquet(snapshots.apply_schema(pd.read_parquet(path), "df_unified_clean"), path)
+    snapshots.write_snapshot(MERGED_NAME, df_merged)
+    snapshots.write_parquet(df_base, os.path.join(fact_path(), BASE_PART))
+    df_fact = read_fact_table()
+    aggregates.build_rollups(df_fact)
+    _write_manifest({
+        "rows": int(len(df_fact)),
+        "max_id_venta": int(df_fact["id_venta"].max()),
+        "schema": schema,
+        "sources": {
+            name: {
+                "path": snapshots.SOURCES[name],
+                "mtime": os.stat(snapshots.SOURCES[name]).st_mtime_ns,
+                "sha256": file_checksum(snapshots.SOURCES[name]),
+            }
+            for name in SOURCE_TABLES
+        },
+        "increments": increments,
+    })
+    return df_fact
+
+
+def ensure_fact_table():
+    """Reconstruye la tabla de hechos solo si sus fuentes cambiaron."""
+    with _build_lock:
+        if not is_fresh():
+            build_fact_table()
+        elif not aggregates.is_complete():
+            aggregates.build_rollups(read_fact_table())
+
+
+def validate_batch(ventas, detalle_ventas, max_id_venta):
+    """
+    Valida un lote de ventas nuevas contra las claves existentes.
+
+    Args:
+        ventas: Filas nuevas con el formato de ventas.xlsx.
+        detalle_ventas: Filas nuevas con el formato de detalle_ventas.xlsx.
+        max_id_venta: Mayor id_venta ya registrado en la tabla de hechos.
+
+    Returns:
+        Lista de mensajes de error (vacía si el lote es válido).
+    """
+    errors = []
+    for label, df, columns in [
+        ("ventas", ventas, BATCH_VENTAS_COLUMNS),
+        ("detalle_ventas", detalle_ventas, BATCH_DETALLE_COLUMNS),
+    ]:
+        missing = [col for col in columns if col not in df.columns]
+        if missing:
+            errors.append(f"Faltan columnas en {label}: {', '.join(missing)}")
+    if errors:
+        return errors
+
+    if ventas["id_venta"].duplicated().any():
+        errors.append("Hay id_venta repetidos dentro del lote de ventas.")
+    old_ids = ventas.loc[ventas["id_venta"] <= max_id_venta, "id_venta"]
+    if not old_ids.empty:
+        errors.append(f"Los id_venta deben ser mayores que {max_id_venta}: {sorted(old_ids.unique().tolist())}")
+
+    clientes = snapshots.read_table("clientes", ["id_cliente"])
+    unknown_clients = set(ventas["id_cliente"]) - set(clientes["id_cliente"])
+    if unknown_clients:
+        errors.append(f"id_cliente inexistentes: {sorted(unknown_clients)}")
+
+    productos = snapshots.read_table("productos_corregidos", ["id_producto"])
+    unknown_products = set(detalle_ventas["id_producto"]) - set(productos["id_producto"])
+    if unknown_products:
+        errors.append(f"id_producto inexistentes: {sorted(unknown_products)}")
+
+    orphan_items = set(detalle_ventas["id_venta"]) - set(ventas["id_venta"])
+    if orphan_items:
+        errors.append(f"Detalles sin venta en el lote: {sorted(orphan_items)}")
+    empty_sales = set(ventas["id_venta"]) - set(detalle_ventas["id_venta"])
+    if empty_sales:
+        errors.append(f"Ventas sin detalle en el lote: {sorted(empty_sales)}")
+
+    if (detalle_ventas["cantidad"] <= 0).any():
+        errors.append("Todas las cantidades deben ser positivas.")
+    mismatched = (detalle_ventas["cantidad"] * detalle_ventas["precio_unitario"] - detalle_ventas["importe"]).abs() > 0.01
+    if mismatched.any():
+        errors.append("El importe debe ser cantidad * precio_unitario en todas las filas del detalle.")
+    return errors
+
+
+def append_batch(ventas, detalle_ventas):
+    """
+    Añade un lote de ventas nuevas a la tabla de hechos y a sus agregados.
+
+    Solo se unen y escriben las filas del lote (en una partición nueva) y los
+    agregados se actualizan sumando el agregado del lote; el histórico no se
+    vuelve a leer.
+
+    Args:
+        ventas: Filas nuevas con el formato de ventas.xlsx.
+        detalle_ventas: Filas nuevas con el formato de detalle_ventas.xlsx.
+
+    Returns:
+        DataFrame con las filas añadidas a la tabla de hechos.
+
+    Raises:
+        ValueError: Si el lote no pasa la validación.
+    """
+    with _build_lock:
+        if not is_fresh():
+            build_fact_table()
+        manifest = _read_manifest()
+
+        errors = validate_batch(ventas, detalle_ventas, manifest["max_id_venta"])
+        if errors:
+            raise ValueError("Lote inválido:\n- " + "\n- ".join(errors))
+
+        ventas = snapshots.apply_schema(ventas[BATCH_VENTAS_COLUMNS], "ventas")
+        detalle_ventas = snapshots.apply_schema(detalle_ventas[BATCH_DETALLE_COLUMNS], "detalle_ventas")
+        productos = snapshots.read_table("productos_corregidos")
+        clientes = snapshots.read_table("clientes")
+        df_batch = clean_unified(merge_sources(ventas, detalle_ventas, productos, clientes), by_name=True)
+
+        part = f"part-{len(manifest['increments']) + 1:05d}.parquet"
+        snapshots.write_parquet(df_batch, os.path.join(fact_path(), part))
+        aggregates.update_rollups(df_batch)
+
+        manifest["rows"] += int(len(df_batch))
+        manifest["max_id_venta"] = int(max(manifest["max_id_venta"], df_batch["id_venta"].max()))
+        manifest["increments"].append({"part": part, "rows": int(len(df_batch))})
+        _write_manifest(manifest)
+        return df_batch
@@ -0,0 +1,86 @@
+"""
+Capa de servicio de pronósticos para la vista de predicción de ventas.
+
+Devuelve el histórico mensual y el pronóstico de una serie (segmento y valor)
+para una versión de modelo y un horizonte dados. Cada combinación se calcula
+una sola vez y se guarda en una caché LRU en memoria; como ambas series se
+devuelven indexadas por fecha, filtrar un rango de fechas es un simple corte
+(.loc) sin volver a leer ni a agregar los datos.
+"""
+import os
+from functools import lru_cache
+
+from aurelion import data_access, metrics, snapshots
+
+CACHE_SIZE = 64
+
+
+def _file_token(path):
+    """Versión de un archivo en disco (mtime); invalida la caché si el archivo cambia."""
+    return os.stat(path).st_mtime_ns
+
+
+def available_series():
+    """
+    DataFrame con las combinaciones (segmento, serie, model_version) pronosticadas
+    y el número de meses pronosticados de cada una ("horizon").
+    """
+    predictions = data_access.load_predictions_by_series()
+    keys = ["segmento", "serie", "model_version"]
+    return predictions.groupby(keys, sort=False).size().rename("horizon").reset_index()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _history(history_token, segmento, serie):
+    # Solo la serie pedida: no se agregan las demás series del segmento.
+    return data_access.load_series_sales(segmento, serie).set_index("date")["sales"]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _forecast(predictions_token, model_version, horizon, segmento, serie):
+    predictions = data_access.load_predictions_by_series()
+    mask = (predictions["segmento"] == segmento) & (predictions["serie"] == serie)
+    if model_version is not None:
+        mask &= predictions["model_version"] == model_version
+    series = predictions.loc[mask].sort_values("date").set_index("date")["pred_sales"]
+    return series if horizon is None else series.iloc[:horizon]
+
+
+def get_forecast(segmento="total", serie="Total", model_version=None, horizon=None):
+    """
+    Histórico y pronóstico de una serie, memoizados con desalojo LRU.
+
+    Args:
+        segmento: "total" o una clave de SEGMENT_COLUMNS.
+        serie: Valor del segmento (p. ej. "Alimentos" o "Cordoba").
+        model_version: Clave del modelo en el registro; None acepta cualquiera.
+        horizon: Número de meses pronosticados a devolver; None devuelve todos.
+
+    Returns:
+        Tupla (historico, pronostico) de Series indexadas por fecha de fin de mes.
+    """
+    with metrics.phase(metrics.LOAD):
+        history_token = _file_token(snapshots.SOURCES["df_expanded"])
+        predictions_token = _file_token(data_access.PREDICTIONS_BY_SERIES_PATH)
+        history = _cached_call(_history, "forecast_history", history_token, segmento, serie)
+        forecast = _cached_call(_forecast, "forecast", predictions_token, model_version, horizon, segmento, serie)
+    return history, forecast
+
+
+def _cached_call(function, cache_name, *args):
+    """Llama a una función con lru_cache y registra si la llamada fue un acierto."""
+    hits = function.cache_info().hits
+    result = function(*args)
+    metrics.count_cache(cache_name, hit=function.cache_info().hits > hits)
+    return result
+
+
+def cache_info():
+    """Estadísticas (aciertos, fallos, tamaño) de las cachés del servicio."""
+    return {"history": _history.cache_info(), "forecast": _forecast.cache_info()}
+
+
+def clear_cache():
+    """Vacía las cachés del servicio."""
+    _history.cache_clear()
+    _forecast.cache_clear()
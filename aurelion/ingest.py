@@ -0,0 +1,88 @@
+"""
+Comando de ingesta: convierte las fuentes Excel/CSV de ./data en snapshots
+Parquet tipados, materializa la tabla de hechos unificada y añade lotes de
+ventas nuevas de forma incremental.
+
+Uso:
+    python -m aurelion.ingest            # solo tablas con snapshot desactualizado
+    python -m aurelion.ingest --force    # regenera todos los snapshots
+    python -m aurelion.ingest --ventas nuevas_ventas.xlsx --detalle nuevos_detalles.xlsx
+"""
+import argparse
+import sys
+
+import pandas as pd
+
+from aurelion import fact_table, snapshots
+
+
+def build_snapshots(force=False):
+    """
+    Genera los snapshots de todas las tablas conocidas y la tabla de hechos.
+
+    Args:
+        force: Si es True, regenera incluso los snapshots vigentes.
+
+    Returns:
+        Lista con los nombres de las tablas regeneradas.
+    """
+    rebuilt = []
+    for name in snapshots.SOURCES:
+        if force or not snapshots.is_fresh(name):
+            snapshots.write_snapshot(name)
+            rebuilt.append(name)
+    if force or not fact_table.is_fresh():
+        fact_table.build_fact_table()
+        rebuilt.append(fact_table.FACT_NAME)
+    return rebuilt
+
+
+def read_batch_file(path):
+    """Lee un archivo de lote (.xlsx o .csv)."""
+    if path.endswith(".xlsx"):
+        return pd.read_excel(path)
+    return pd.read_csv(path)
+
+
+def ingest_batch(ventas_path, detalle_path):
+    """
+    Añade a la tabla de hechos y a sus agregados un lote de ventas nuevas.
+
+    Args:
+        ventas_path: Archivo con filas nuevas en el formato de ventas.xlsx.
+        detalle_path: Archivo con filas nuevas en el formato de detalle_ventas.xlsx.
+
+    Returns:
+        DataFrame con las filas añadidas a la tabla de hechos.
+    """
+    return fact_table.append_batch(read_batch_file(ventas_path), read_batch_file(detalle_path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera los snapshots Parquet de ./data.")
+    parser.add_argument("--force", action="store_true", help="Regenerar todos los snapshots.")
+    parser.add_argument("--ventas", help="Lote de ventas nuevas (.xlsx o .csv).")
+    parser.add_argument("--detalle", help="Lote de detalle de las ventas nuevas (.xlsx o .csv).")
+    args = parser.parse_args()
+
+    if bool(args.ventas) != bool(args.detalle):
+        parser.error("--ventas y --detalle deben indicarse juntos.")
+
+    rebuilt = build_snapshots(force=args.force)
+    if rebuilt:
+        for name in rebuilt:
+            print(f"Snapshot generado: {name}")
+    else:
+        print("Todos los snapshots están actualizados.")
+
+    if args.ventas:
+        try:
+            df_batch = ingest_batch(args.ventas, args.detalle)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"Lote añadido: {df_batch['id_venta'].nunique()} ventas, {len(df_batch)} ítems.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Importación diferida de módulos pesados.
+
+lazy_import("seaborn") devuelve un sustituto del módulo que lo importa la
+primera vez que se accede a alguno de sus atributos (sns.boxplot, ...). Así,
+un módulo puede declarar sus dependencias al principio, como de costumbre,
+sin pagar su tiempo de importación hasta que realmente las usa: el menú
+principal de la aplicación no carga matplotlib, seaborn ni pandas.
+"""
+import importlib
+import sys
+
+
+class LazyModule:
+    """Sustituto de un módulo que lo importa en el primer acceso a un atributo."""
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name):
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_module", None)
+
+    def _load(self):
+        module = self._module
+        if module is None:
+            # import_module es seguro entre hilos (usa el lock de importación).
+            module = importlib.import_module(self._name)
+            object.__setattr__(self, "_module", module)
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "cargado" if self._module is not None else "sin cargar"
+        return f"<módulo diferido {self._name!r} ({state})>"
+
+
+def lazy_import(name):
+    """Módulo `name` si ya está importado; si no, un LazyModule que lo importará al usarse."""
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
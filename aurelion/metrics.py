@@ -0,0 +1,266 @@
+"""
+Instrumentación de las vistas de la aplicación.
+
+Cada ejecución de una vista (view) guarda su tiempo total y el desglose por
+fase: "carga" (lecturas de aurelion.data_access y del servicio de
+pronósticos), "transformacion" (filtros y cálculos de la vista), "graficos"
+(renderizado de figuras) y "otros" (el resto: widgets de Streamlit). Las fases
+se anidan y cada una cuenta solo su tiempo propio, por lo que la suma de las
+fases es el tiempo total de la vista. Además se registra la memoria de los
+DataFrames leídos y los aciertos y fallos de cada caché.
+
+Los datos pueden consultarse de tres formas:
+    * last_view(): la última vista del hilo actual (panel de depuración).
+    * prometheus_text(): totales del proceso en formato de texto de
+      Prometheus, servidos en /metrics con start_http_server().
+    * Logs estructurados: una línea JSON por vista en el logger
+      "aurelion.metrics" (ver configure_logging).
+"""
+import json
+import logging
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LOAD = "carga"
+TRANSFORM = "transformacion"
+CHARTS = "graficos"
+OTHER = "otros"
+
+logger = logging.getLogger("aurelion.metrics")
+
+# Estado por hilo: Streamlit ejecuta el script de cada sesión en su propio hilo.
+_local = threading.local()
+
+# Totales del proceso.
+_lock = threading.Lock()
+_view_runs = defaultdict(int)
+_view_seconds = defaultdict(float)
+_phase_seconds = defaultdict(float)
+_view_frame_bytes = {}
+_cache_counts = defaultdict(int)
+_server = None
+
+
+class ViewRecord:
+    """Mediciones de una ejecución de una vista."""
+
+    def __init__(self, name):
+        self.name = name
+        self.seconds = 0.0
+        self.phases = defaultdict(float)
+        self.frames = {}
+        self.cache = defaultdict(int)
+
+    @property
+    def frame_bytes(self):
+        """Memoria (bytes) de los DataFrames distintos leídos por la vista."""
+        return sum(self.frames.values())
+
+    def as_dict(self):
+        return {
+            "view": self.name,
+            "seconds": round(self.seconds, 6),
+            "phases": {phase: round(seconds, 6) for phase, seconds in self.phases.items()},
+            "dataframe_bytes": self.frame_bytes,
+            "cache": {f"{cache}.{result}": count for (cache, result), count in sorted(self.cache.items())},
+        }
+
+
+def _stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+def current_view():
+    """Vista en curso en este hilo, o None fuera de una vista."""
+    return getattr(_local, "view", None)
+
+
+def last_view():
+    """Última vista terminada en este hilo, o None."""
+    return getattr(_local, "last", None)
+
+
+@contextmanager
+def phase(name):
+    """
+    Acumula en la vista en curso el tiempo propio del bloque en la fase `name`.
+
+    El tiempo de las fases anidadas se descuenta de la fase que las contiene.
+    Fuera de una vista no hace nada.
+    """
+    record = current_view()
+    if record is None:
+        yield
+        return
+    stack = _stack()
+    entry = [name, 0.0]
+    stack.append(entry)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        stack.pop()
+        record.phases[name] += elapsed - entry[1]
+        if stack:
+            stack[-1][1] += elapsed
+
+
+@contextmanager
+def view(name):
+    """Mide la ejecución completa de la vista `name` (ver rename_view)."""
+    record = ViewRecord(name)
+    _local.view = record
+    _local.stack = []
+    started = time.perf_counter()
+    try:
+        with phase(OTHER):
+            yield record
+    finally:
+        record.seconds = time.perf_counter() - started
+        _local.view = None
+        _local.last = record
+        _publish(record)
+
+
+def rename_view(name):
+    """Cambia el nombre de la vista en curso (p. ej. para distinguir secciones del EDA)."""
+    record = current_view()
+    if record is not None:
+        record.name = name
+
+
+def count_cache(cache, hit):
+    """Registra un acierto (`hit`=True) o fallo de la caché `cache`."""
+    result = "hit" if hit else "miss"
+    with _lock:
+        _cache_counts[(cache, result)] += 1
+    record = current_view()
+    if record is not None:
+        record.cache[(cache, result)] += 1
+
+
+def frame_bytes(obj):
+    """Memoria de un DataFrame o Series (incluye los textos); None para otros objetos."""
+    # Sin importar pandas: si no está cargado, `obj` no puede ser un DataFrame.
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(obj, (pd.DataFrame, pd.Series)):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+    return None
+
+
+def track_frame(key, nbytes):
+    """Añade a la vista en curso la memoria `nbytes` del DataFrame identificado por `key`."""
+    record = current_view()
+    if record is not None and nbytes is not None:
+        record.frames[key] = nbytes
+
+
+def _publish(record):
+    with _lock:
+        _view_runs[record.name] += 1
+        _view_seconds[record.name] += record.seconds
+        for name, seconds in record.phases.items():
+            _phase_seconds[(record.name, name)] += seconds
+        _view_frame_bytes[record.name] = record.frame_bytes
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps({"event": "view", "timestamp": time.time(), **record.as_dict()}))
+
+
+def snapshot():
+    """Copia de los totales del proceso."""
+    with _lock:
+        return {
+            "view_runs": dict(_view_runs),
+            "view_seconds": dict(_view_seconds),
+            "phase_seconds": dict(_phase_seconds),
+            "view_frame_bytes": dict(_view_frame_bytes),
+            "cache": dict(_cache_counts),
+        }
+
+
+def reset():
+    """Vacía los totales del proceso."""
+    with _lock:
+        for totals in (_view_runs, _view_seconds, _phase_seconds, _view_frame_bytes, _cache_counts):
+            totals.clear()
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text():
+    """Totales del proceso en el formato de texto de Prometheus."""
+    totals = snapshot()
+    lines = [
+        "# HELP aurelion_view_runs_total Ejecuciones de cada vista.",
+        "# TYPE aurelion_view_runs_total counter",
+        *(f'aurelion_view_runs_total{{view="{_label(v)}"}} {n}' for v, n in sorted(totals["view_runs"].items())),
+        "# HELP aurelion_view_seconds_total Tiempo total de cada vista.",
+        "# TYPE aurelion_view_seconds_total counter",
+        *(f'aurelion_view_seconds_total{{view="{_label(v)}"}} {s:.6f}'
+          for v, s in sorted(totals["view_seconds"].items())),
+        "# HELP aurelion_view_phase_seconds_total Tiempo de cada vista por fase.",
+        "# TYPE aurelion_view_phase_seconds_total counter",
+        *(f'aurelion_view_phase_seconds_total{{view="{_label(v)}",phase="{p}"}} {s:.6f}'
+          for (v, p), s in sorted(totals["phase_seconds"].items())),
+        "# HELP aurelion_view_dataframe_bytes Memoria de los DataFrames leídos en la última ejecución de la vista.",
+        "# TYPE aurelion_view_dataframe_bytes gauge",
+        *(f'aurelion_view_dataframe_bytes{{view="{_label(v)}"}} {b}'
+          for v, b in sorted(totals["view_frame_bytes"].items())),
+        "# HELP aurelion_cache_requests_total Consultas a cada caché por resultado.",
+        "# TYPE aurelion_cache_requests_total counter",
+        *(f'aurelion_cache_requests_total{{cache="{_label(c)}",result="{r}"}} {n}'
+          for (c, r), n in sorted(totals["cache"].items())),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = prometheus_text().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_http_server(port, host="127.0.0.1"):
+    """
+    Sirve prometheus_text() en http://host:port/metrics desde un hilo aparte.
+
+    Solo se inicia un servidor por proceso; las llamadas siguientes devuelven
+    el ya existente.
+    """
+    global _server
+    with _lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            threading.Thread(target=_server.serve_forever, name="aurelion-metrics", daemon=True).start()
+        return _server
+
+
+def configure_logging(path=None):
+    """Envía los logs de las vistas (una línea JSON por vista) a `path` o a stderr."""
+    if any(getattr(handler, "_aurelion_metrics", False) for handler in logger.handlers):
+        return
+    handler = logging.FileHandler(path, encoding="utf-8") if path else logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    handler._aurelion_metrics = True
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
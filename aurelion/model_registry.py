@@ -0,0 +1,157 @@
+"""
+Registro de modelos entrenados.
+
+Cada modelo se guarda con joblib bajo una clave derivada de su clase, sus
+hiperparámetros, la lista de features y la huella (fingerprint) de los datos
+de entrenamiento. Si ya existe un modelo con la misma clave, se reutiliza en
+lugar de volver a entrenarlo, y un pronóstico hecho con el artefacto guardado
+es reproducible.
+
+El registro conserva como máximo MAX_MODELS modelos: los scripts que registran
+modelos llaman a prune() al terminar (en el proceso principal, no en los
+procesos del pool) para eliminar los usados hace más tiempo.
+"""
+import hashlib
+import json
+import os
+from datetime import datetime
+
+import joblib
+import pandas as pd
+
+MODELS_DIR = "./models"
+# Modelos que se conservan en el registro (p. ej. varias versiones de los datos
+# con todas las series de forecast_segments.py).
+MAX_MODELS = 500
+
+
+def data_fingerprint(*frames):
+    """Huella SHA-256 del contenido (valores e índice) de uno o varios DataFrame/Series."""
+    digest = hashlib.sha256()
+    for frame in frames:
+        digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+        columns = frame.columns if isinstance(frame, pd.DataFrame) else [frame.name]
+        digest.update(json.dumps([str(col) for col in columns]).encode())
+    return digest.hexdigest()
+
+
+def model_key(model_class, params, features, fingerprint):
+    """Clave del registro para un modelo de `model_class` con la configuración dada."""
+    payload = json.dumps(
+        {
+            "class": f"{model_class.__module__}.{model_class.__name__}",
+            "params": params,
+            "features": list(features),
+            "data": fingerprint,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:20]
+
+
+def _paths(key):
+    return os.path.join(MODELS_DIR, f"{key}.pkl"), os.path.join(MODELS_DIR, f"{key}.json")
+
+
+def exists(key):
+    """Indica si el registro contiene el modelo `key`."""
+    return os.path.exists(_paths(key)[0])
+
+
+def load(key):
+    """Carga el modelo `key` del registro y lo marca como usado recientemente."""
+    model_path = _paths(key)[0]
+    model = joblib.load(model_path)
+    try:
+        os.utime(model_path)
+    except OSError:
+        pass
+    return model
+
+
+def metadata(key):
+    """Metadatos (clase, hiperparámetros, features, huella de datos) del modelo `key`."""
+    with open(_paths(key)[1], "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save(key, model, info):
+    """Guarda `model` y sus metadatos `info` bajo la clave `key` (escritura atómica)."""
+    os.makedirs(MODELS_DIR, exist_ok=True)
+    model_path, meta_path = _paths(key)
+    # Temporales por proceso: varios workers pueden registrar el mismo modelo a la vez.
+    model_tmp, meta_tmp = f"{model_path}.{os.getpid()}.tmp", f"{meta_path}.{os.getpid()}.tmp"
+    joblib.dump(model, model_tmp)
+    os.replace(model_tmp, model_path)
+    with open(meta_tmp, "w", encoding="utf-8") as file:
+        json.dump(info, file, indent=2, default=str)
+    os.replace(meta_tmp, meta_path)
+
+
+def prune(max_models=MAX_MODELS):
+    """
+    Elimina los modelos usados hace más tiempo hasta dejar `max_models`.
+
+    El uso se mide por la fecha de modificación del .pkl, que se actualiza al
+    registrarlo y al cargarlo. No toca subcarpetas como models/tuning.
+
+    Returns:
+        Lista de claves eliminadas.
+    """
+    if not os.path.isdir(MODELS_DIR):
+        return []
+    models = []
+    for entry in os.scandir(MODELS_DIR):
+        if entry.is_file() and entry.name.endswith(".pkl"):
+            try:
+                models.append((entry.stat().st_mtime_ns, entry.name[:-len(".pkl")]))
+            except FileNotFoundError:
+                continue
+    models.sort()
+    removed = []
+    for _, key in models[:max(len(models) - max_models, 0)]:
+        for path in _paths(key):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        removed.append(key)
+    return removed
+
+
+def get_or_train(model_class, params, X, y, fingerprint=None):
+    """
+    Devuelve el modelo registrado para esta configuración o lo entrena y registra.
+
+    Args:
+        model_class: Clase del estimador (p. ej. RandomForestRegressor).
+        params: Hiperparámetros con los que se construye el estimador.
+        X: Matriz de entrenamiento (DataFrame con los nombres de las features).
+        y: Objetivo de entrenamiento.
+        fingerprint: Huella de los datos; si es None se calcula a partir de X e y.
+
+    Returns:
+        Tupla (modelo, clave, entrenado) donde `entrenado` indica si hubo que entrenarlo.
+    """
+    features = list(X.columns)
+    fingerprint = fingerprint or data_fingerprint(X, y)
+    key = model_key(model_class, params, features, fingerprint)
+    if exists(key):
+        try:
+            return load(key), key, False
+        except FileNotFoundError:
+            # Eliminado por prune() de otro proceso entre exists() y load(): se vuelve a entrenar.
+            pass
+
+    model = model_class(**params)
+    model.fit(X, y)
+    save(key, model, {
+        "class": f"{model_class.__module__}.{model_class.__name__}",
+        "params": params,
+        "features": features,
+        "data_fingerprint": fingerprint,
+        "rows": len(X),
+        "created": datetime.now().isoformat(timespec="seconds"),
+    })
+    return model, key, True
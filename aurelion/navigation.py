@@ -0,0 +1,44 @@
+"""
+Páginas de la aplicación y navegación entre ellas.
+
+Cada vista es un archivo de ./vistas que programa.py registra con
+st.navigation: en cada interacción Streamlit ejecuta solo el archivo de la
+página actual, que importa y calcula únicamente lo que esa vista necesita. La
+página actual queda en la URL, por lo que el estado de sesión solo guarda los
+valores de los widgets (los datos viven en las cachés de aurelion.data_access).
+"""
+import streamlit as st
+
+MENU = "menu"
+
+# Nombre de la vista (métricas y URL) -> (archivo de la página, título).
+# El orden es el de los botones del menú principal.
+PAGES = {
+    "menu": ("vistas/menu.py", "Tienda Aurelion"),
+    "documentacion": ("vistas/documentacion.py", "Ver documentación"),
+    "ventas": ("vistas/ventas.py", "Ver ventas"),
+    "clientes": ("vistas/clientes.py", "Ver clientes"),
+    "productos": ("vistas/productos.py", "Ver productos"),
+    "eda": ("vistas/eda.py", "Ver análisis exploratorio de datos"),
+    "prediccion": ("vistas/prediccion.py", "Ver predicción de ventas"),
+    "salir": ("vistas/salir.py", "Salir"),
+}
+
+
+def build_pages():
+    """Diccionario {nombre: st.Page} de todas las vistas; la primera es la página por defecto."""
+    return {
+        name: st.Page(path, title=title, url_path=name, default=name == MENU)
+        for name, (path, title) in PAGES.items()
+    }
+
+
+def go_to(name):
+    """Cambia a la página `name` (ver PAGES)."""
+    st.switch_page(PAGES[name][0])
+
+
+def back_to_menu_button():
+    """Botón para regresar al menú principal."""
+    if st.button("⬅️ Volver al Menú Principal"):
+        go_to(MENU)
@@ -0,0 +1,129 @@
+"""
+Índices en memoria sobre la tabla de hechos de ventas.
+
+El índice primario ordena las filas por id_venta y permite resolver un ID o un
+rango de IDs con búsqueda binaria (np.searchsorted). Un segundo índice ordenado
+por fecha_venta resuelve ventanas de fechas. Los índices secundarios sobre
+ciudad y medio_pago guardan, para cada valor, las posiciones de sus filas y un
+código entero por fila, de modo que filtrar un conjunto de candidatos cuesta
+O(candidatos) en lugar de O(tabla).
+"""
+import numpy as np
+import pandas as pd
+
+
+class SalesIndex:
+    """Índices primario (id_venta), de fechas y secundarios sobre una tabla de ventas."""
+
+    SECONDARY_COLUMNS = ("ciudad", "medio_pago")
+
+    def __init__(self, df, id_column="id_venta", date_column="fecha_venta"):
+        self.df = df
+
+        ids = df[id_column].to_numpy()
+        self._id_order = np.argsort(ids, kind="stable")
+        self._sorted_ids = ids[self._id_order]
+
+        dates = df[date_column].to_numpy(dtype="datetime64[ns]")
+        self._date_order = np.argsort(dates, kind="stable")
+        self._sorted_dates = dates[self._date_order]
+
+        # Índices secundarios: valor -> posiciones (ordenadas) y código entero por fila.
+        self._codes = {}
+        self._categories = {}
+        self._postings = {}
+        for column in self.SECONDARY_COLUMNS:
+            codes, categories = pd.factorize(df[column], sort=True)
+            self._codes[column] = codes
+            self._categories[column] = {value: code for code, value in enumerate(categories)}
+            order = np.argsort(codes, kind="stable")
+            bounds = np.searchsorted(codes[order], np.arange(len(categories) + 1))
+            self._postings[column] = {
+                value: order[bounds[code]:bounds[code + 1]]
+                for value, code in self._categories[column].items()
+            }
+
+    def __len__(self):
+        return len(self.df)
+
+    @property
+    def id_bounds(self):
+        """Tupla (mínimo, máximo) de id_venta."""
+        return int(self._sorted_ids[0]), int(self._sorted_ids[-1])
+
+    @property
+    def date_bounds(self):
+        """Tupla (primera, última) fecha de venta."""
+        return pd.Timestamp(self._sorted_dates[0]).date(), pd.Timestamp(self._sorted_dates[-1]).date()
+
+    def values(self, column):
+        """Valores distintos (ordenados) de una columna con índice secundario."""
+        return list(self._categories[column])
+
+    # --- Accesos primarios ---
+    def id_positions(self, low, high=None):
+        """Posiciones de las filas con id_venta en [low, high] (high=None busca solo low)."""
+        high = low if high is None else high
+        start = np.searchsorted(self._sorted_ids, low, side="left")
+        stop = np.searchsorted(self._sorted_ids, high, side="right")
+        return self._id_order[start:stop]
+
+    def date_positions(self, start, end):
+        """Posiciones de las filas con fecha_venta en [start, end] (fechas incluidas)."""
+        start = np.datetime64(pd.Timestamp(start), "ns")
+        # El extremo superior abarca el día completo.
+        end = np.datetime64(pd.Timestamp(end).normalize() + pd.Timedelta(days=1), "ns")
+        first = np.searchsorted(self._sorted_dates, start, side="left")
+        last = np.searchsorted(self._sorted_dates, end, side="left")
+        return self._date_order[first:last]
+
+    def value_positions(self, column, values):
+        """Posiciones (ordenadas) de las filas cuyo `column` está en `values`."""
+        postings = self._postings[column]
+        lists = [postings[value] for value in values if value in postings]
+        if not lists:
+            return np.empty(0, dtype=np.intp)
+        return np.sort(np.concatenate(lists))
+
+    # --- Filtros secundarios sobre candidatos ---
+    def _filter(self, positions, column, values):
+        codes = [self._categories[column][value] for value in values if value in self._categories[column]]
+        if len(codes) == len(self._categories[column]):
+            return positions
+        return positions[np.isin(self._codes[column][positions], codes)]
+
+    def query(self, id_range=None, date_range=None, ciudades=None, medios_pago=None):
+        """
+        Devuelve las filas que cumplen todos los filtros indicados.
+
+        Args:
+            id_range: Tupla (desde, hasta) de id_venta, ambos incluidos.
+            date_range: Tupla (desde, hasta) de fechas de venta, ambas incluidas.
+            ciudades: Valores de ciudad aceptados (None acepta todos).
+            medios_pago: Valores de medio_pago aceptados (None acepta todos).
+
+        Returns:
+            DataFrame con las filas coincidentes, ordenadas por su posición original.
+        """
+        # Se resuelve primero el acceso por rango (ID o fecha) y luego se filtran
+        # solo los candidatos resultantes con los índices secundarios.
+        if id_range is not None:
+            positions = self.id_positions(*id_range)
+            if date_range is not None:
+                positions = np.intersect1d(positions, self.date_positions(*date_range))
+        elif date_range is not None:
+            positions = self.date_positions(*date_range)
+        elif ciudades is not None:
+            positions = self.value_positions("ciudad", ciudades)
+            ciudades = None
+        elif medios_pago is not None:
+            positions = self.value_positions("medio_pago", medios_pago)
+            medios_pago = None
+        else:
+            positions = np.arange(len(self.df))
+
+        if ciudades is not None:
+            positions = self._filter(positions, "ciudad", ciudades)
+        if medios_pago is not None:
+            positions = self._filter(positions, "medio_pago", medios_pago)
+        return self.df.iloc[np.sort(positions)]
@@ -0,0 +1,101 @@
+"""
+Series mensuales de ventas por segmento (total, categoría, ciudad y producto)
+construidas a partir del histórico expandido.
+
+Los totales mensuales de todas las series se obtienen en una sola pasada con
+aurelion.streaming, por lo que el histórico puede recorrerse por bloques sin
+cargarlo completo en memoria.
+"""
+import pandas as pd
+
+from aurelion import streaming
+
+# Segmento -> columna de df_expanded que define las series.
+SEGMENT_COLUMNS = {
+    "categoria": "categoria",
+    "ciudad": "ciudad",
+    "producto": "nombre_producto",
+}
+
+
+def segment_groupings():
+    """Agrupaciones de streaming.fold_totals para el total y cada segmento."""
+    return {"total": [], **{segment: [column] for segment, column in SEGMENT_COLUMNS.items()}}
+
+
+def assemble_segment_sales(totals, top_n_products=20):
+    """
+    Ventas mensuales de todas las series en formato largo a partir de los
+    totales de streaming.fold_totals(..., segment_groupings()).
+
+    Args:
+        totals: Totales mensuales por agrupación.
+        top_n_products: Número de productos (por importe total) a incluir;
+            None incluye todos.
+
+    Returns:
+        DataFrame con columnas "segmento", "serie", "date" y "sales", con todos los
+        meses del histórico en cada serie (0 en los meses sin ventas) y ordenado
+        por serie y fecha.
+    """
+    total = totals["total"]
+    months = pd.date_range(total.index.min(), total.index.max(), freq="ME")
+    frames = [pd.DataFrame({
+        "segmento": "total", "serie": "Total", "date": months,
+        "sales": total.reindex(months, fill_value=0.0).to_numpy(),
+    })]
+
+    for segment in SEGMENT_COLUMNS:
+        monthly = totals[segment].unstack(fill_value=0.0).reindex(columns=months, fill_value=0.0)
+        if segment == "producto" and top_n_products is not None:
+            monthly = monthly.loc[monthly.sum(axis=1).nlargest(top_n_products).index]
+        long = monthly.stack().rename("sales").reset_index()
+        long.columns = ["serie", "date", "sales"]
+        long.insert(0, "segmento", segment)
+        frames.append(long)
+
+    sales = pd.concat(frames, ignore_index=True)
+    sales["serie"] = sales["serie"].astype(str)
+    return sales.sort_values(["segmento", "serie", "date"], kind="stable").reset_index(drop=True)
+
+
+def build_segment_sales(df, top_n_products=20):
+    """
+    Ventas mensuales de todas las series de un DataFrame ya cargado.
+
+    Args:
+        df: Transacciones con "fecha_venta", "importe" y las columnas de SEGMENT_COLUMNS.
+        top_n_products: Número de productos (por importe total) a pronosticar.
+    """
+    return assemble_segment_sales(streaming.fold_totals([df], segment_groupings()), top_n_products)
+
+
+def stream_segment_sales(name="df_expanded", top_n_products=20, batch_rows=streaming.BATCH_ROWS):
+    """Ventas mensuales de todas las series recorriendo la tabla `name` por bloques."""
+    columns = ["fecha_venta", "importe", *SEGMENT_COLUMNS.values()]
+    totals = streaming.fold_totals(streaming.iter_table(name, columns, batch_rows), segment_groupings())
+    return assemble_segment_sales(totals, top_n_products)
+
+
+def stream_series_sales(segmento, serie, name="df_expanded", batch_rows=streaming.BATCH_ROWS):
+    """
+    Ventas mensuales ('date', 'sales') de una sola serie recorriendo la tabla
+    `name` por bloques, con los mismos meses que stream_segment_sales.
+
+    Args:
+        segmento: "total" o una clave de SEGMENT_COLUMNS.
+        serie: Valor del segmento (p. ej. "Alimentos" o "Cordoba").
+    """
+    if segmento == "total":
+        return streaming.monthly_sales(name, batch_rows)
+    column = SEGMENT_COLUMNS[segmento]
+    chunks = (
+        chunk.assign(en_serie=(chunk[column] == serie).to_numpy())
+        for chunk in streaming.iter_table(name, ["fecha_venta", "importe", column], batch_rows)
+    )
+    # El total da el rango de meses del histórico; "en_serie", las ventas de la serie.
+    totals = streaming.fold_totals(chunks, {"total": [], "serie": ["en_serie"]})
+    months = pd.date_range(totals["total"].index.min(), totals["total"].index.max(), freq="ME", name="date")
+    by_flag = totals["serie"]
+    in_series = by_flag[by_flag.index.get_level_values(0).astype(bool)].droplevel(0)
+    return in_series.reindex(months, fill_value=0.0).rename("sales").reset_index()
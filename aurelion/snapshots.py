@@ -0,0 +1,207 @@
+"""
+Almacén de snapshots columnares (Parquet) generados a partir de las fuentes
+Excel y CSV de ./data.
+
+Los tipos de cada tabla son los mismos que la sección 3 del EDA aplica con
+"astype", de modo que leer un snapshot devuelve la tabla ya tipada y permite
+proyectar solo las columnas necesarias sin parsear XML ni texto.
+
+Las tablas unificadas (tabla de hechos, df_unified_clean y df_expanded) usan
+un esquema compacto: textos como categóricos (códigos enteros + diccionario),
+ids y cantidad con el entero más pequeño que admite su rango y fechas en
+datetime64. Todas las rutas de lectura aplican el mismo esquema.
+"""
+import hashlib
+import json
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+DATA_DIR = "./data"
+SNAPSHOT_DIR = os.path.join(DATA_DIR, "snapshots")
+
+# Tipos por tabla (ver "Corrección de tipos de datos" en la sección 3 del EDA).
+# En las tablas unificadas los textos se repiten en cada ítem de venta, por lo
+# que se guardan como categóricos; las agrupaciones operan sobre sus códigos.
+_UNIFIED_SCHEMA = {
+    "id_venta": "int32",
+    "fecha_venta": "datetime64[ns]",
+    "id_cliente": "int32",
+    "nombre_cliente": "category",
+    "email": "category",
+    "medio_pago": "category",
+    "id_producto": "int32",
+    "nombre_producto": "category",
+    "cantidad": "int16",
+    "precio_unitario": "float",
+    "importe": "float",
+    "categoria": "category",
+    "ciudad": "category",
+    "fecha_alta_cliente": "datetime64[ns]",
+}
+
+SCHEMAS = {
+    "ventas": {
+        "id_venta": "int",
+        "fecha": "datetime64[ns]",
+        "id_cliente": "int",
+        "nombre_cliente": "string",
+        "email": "string",
+        "medio_pago": "string",
+    },
+    "detalle_ventas": {
+        "id_venta": "int",
+        "id_producto": "int",
+        "nombre_producto": "string",
+        "cantidad": "int",
+        "precio_unitario": "float",
+        "importe": "float",
+    },
+    "clientes": {
+        "id_cliente": "int",
+        "nombre_cliente": "string",
+        "email": "string",
+        "ciudad": "string",
+        "fecha_alta": "datetime64[ns]",
+    },
+    "productos_corregidos": {
+        "id_producto": "int",
+        "nombre_producto": "string",
+        "categoria": "string",
+        "precio_unitario": "float",
+        "categoria_corregida": "string",
+    },
+    "df_unified_clean": _UNIFIED_SCHEMA,
+    "df_expanded": _UNIFIED_SCHEMA,
+}
+
+# Clave de los metadatos Parquet con la versión del esquema del snapshot.
+SCHEMA_METADATA_KEY = b"aurelion_schema"
+
+# Archivo fuente de cada tabla con snapshot.
+SOURCES = {
+    "ventas": os.path.join(DATA_DIR, "ventas.xlsx"),
+    "detalle_ventas": os.path.join(DATA_DIR, "detalle_ventas.xlsx"),
+    "clientes": os.path.join(DATA_DIR, "clientes.xlsx"),
+    "productos_corregidos": os.path.join(DATA_DIR, "productos_corregidos.xlsx"),
+    "df_unified_clean": os.path.join(DATA_DIR, "df_unified_clean.csv"),
+    "df_expanded": os.path.join(DATA_DIR, "df_expanded.csv"),
+}
+
+
+def schema_version(name):
+    """Huella corta del esquema de `name`; cambia si cambia algún tipo."""
+    payload = json.dumps(SCHEMAS[name], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:12]
+
+
+def concat(frames):
+    """
+    Concatena tablas conservando los categóricos.
+
+    pd.concat convierte a object las columnas categóricas con categorías
+    distintas; aquí se unifican antes las categorías de cada columna.
+    """
+    frames = [frame for frame in frames if len(frame.columns)]
+    if not frames:
+        return pd.DataFrame()
+    categorical = [
+        col for col in frames[0].columns
+        if any(isinstance(frame[col].dtype, pd.CategoricalDtype) for frame in frames if col in frame)
+    ]
+    for col in categorical:
+        categories = pd.Index(
+            [value for frame in frames if col in frame for value in frame[col].astype("category").cat.categories],
+            dtype=object,
+        ).unique()
+        frames = [
+            frame.assign(**{col: frame[col].astype(pd.CategoricalDtype(categories))}) if col in frame else frame
+            for frame in frames
+        ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def snapshot_path(name):
+    """Ruta del snapshot Parquet de la tabla `name`."""
+    return os.path.join(SNAPSHOT_DIR, f"{name}.parquet")
+
+
+def apply_schema(df, name):
+    """Convierte las columnas de `df` a los tipos definidos para la tabla `name`."""
+    schema = {col: dtype for col, dtype in SCHEMAS[name].items() if col in df.columns}
+    return df.astype(schema)
+
+
+def read_source(name, columns=None):
+    """Lee la tabla `name` desde su archivo fuente (Excel o CSV) y la tipa."""
+    path = SOURCES[name]
+    if path.endswith(".xlsx"):
+        df = pd.read_excel(path, usecols=columns)
+    else:
+        df = pd.read_csv(path, usecols=columns)
+    return apply_schema(df, name)
+
+
+def is_fresh(name):
+    """
+    Indica si el snapshot de `name` existe, es posterior a su archivo fuente y
+    fue escrito con el esquema actual.
+    """
+    path = snapshot_path(name)
+    if not os.path.exists(path):
+        return False
+    if os.stat(path).st_mtime_ns < os.stat(SOURCES[name]).st_mtime_ns:
+        return False
+    metadata = pq.read_schema(path).metadata or {}
+    return metadata.get(SCHEMA_METADATA_KEY) == schema_version(name).encode()
+
+
+def write_snapshot(name, df=None):
+    """
+    Escribe el snapshot Parquet de la tabla `name`.
+
+    Args:
+        name: Nombre de la tabla (clave de SOURCES).
+        df: Tabla ya tipada. Si es None, se lee desde el archivo fuente.
+
+    Returns:
+        Ruta del snapshot escrito.
+    """
+    if df is None:
+        df = read_source(name)
+    metadata = {SCHEMA_METADATA_KEY: schema_version(name).encode()} if name in SCHEMAS else None
+    return write_parquet(df, snapshot_path(name), metadata)
+
+
+def write_parquet(df, path, metadata=None):
+    """
+    Escribe `df` en Parquet de forma atómica: los lectores nunca ven un archivo a medio escribir.
+
+    Args:
+        df: Tabla a escribir.
+        path: Ruta del archivo.
+        metadata: Pares clave/valor (bytes) adicionales para los metadatos del archivo.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Un temporal por proceso: varios procesos pueden escribir el mismo archivo a la vez.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if metadata:
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **metadata})
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_table(name, columns=None):
+    """Lee la tabla `name` desde su snapshot si está vigente o, si no, desde su fuente."""
+    if is_fresh(name):
+        return read_snapshot(name, columns)
+    return read_source(name, columns)
+
+
+def read_snapshot(name, columns=None):
+    """Lee el snapshot de `name`, proyectando solo `columns` si se indican."""
+    return pd.read_parquet(snapshot_path(name), columns=columns)
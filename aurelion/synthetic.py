@@ -0,0 +1,315 @@
+"""
+Generador sintético del histórico de ventas a escala configurable.
+
+Reproduce el proceso descrito en "Generación de Dataset Expandido" del README
+para cualquier número de filas (de miles a 10^8): los perfiles de productos,
+clientes, medios de pago, cantidades e ítems por venta se extraen de la tabla
+de hechos, y el número de ítems de cada mes es proporcional a la columna
+`ventas_precios_constantes` del índice de ventas de supermercados.
+
+Todo se genera con operaciones vectorizadas de NumPy por particiones de filas
+consecutivas, por lo que la memoria depende del tamaño de partición y no del
+total. Con la misma semilla y los mismos parámetros el resultado es idéntico.
+
+Uso:
+    python -m aurelion.synthetic --filas 10000000 [--semilla 42] [--salida DIR]
+"""
+import argparse
+import glob
+import json
+import math
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from aurelion import data_access, snapshots
+
+SUPERMARKET_INDEX_PATH = os.path.join(snapshots.DATA_DIR, "ventas-totales-supermercados-2.csv")
+ENVELOPE_COLUMN = "ventas_precios_constantes"
+SYNTHETIC_DIR = os.path.join(snapshots.SNAPSHOT_DIR, "synthetic")
+MANIFEST_NAME = "_manifest.json"
+
+PARTITION_ROWS = 1_000_000
+# Dominios de los emails de los clientes sintéticos (los mismos de df_expanded.csv).
+SYNTHETIC_DOMAINS = ["test.co", "data.net", "example.com"]
+# Filas por cliente sintético cuando no se indica su número (~200 en df_expanded.csv).
+ROWS_PER_CLIENT = 200
+
+
+def _distribution(values):
+    """Valores distintos de `values` y su frecuencia relativa."""
+    counts = pd.Series(values).value_counts(sort=False)
+    return counts.index.to_numpy(), (counts / counts.sum()).to_numpy()
+
+
+def _categories(values):
+    """Códigos y categorías de un array de textos (categorías únicas)."""
+    codes, categories = pd.factorize(np.asarray(values, dtype=object), sort=True)
+    return codes.astype(np.int32), pd.CategoricalDtype(categories)
+
+
+def monthly_envelope(start=None, end=None, path=SUPERMARKET_INDEX_PATH):
+    """
+    Pesos mensuales de volumen entre `start` y `end` (incluidos).
+
+    Args:
+        start: Primer mes ("2017-01"); por defecto, el primero del índice.
+        end: Último mes; por defecto, el de la última venta de la tabla de hechos.
+
+    Returns:
+        Series indexada por el primer día de cada mes con pesos que suman 1.
+    """
+    index = pd.read_csv(path, usecols=["indice_tiempo", ENVELOPE_COLUMN], parse_dates=["indice_tiempo"])
+    envelope = index.set_index("indice_tiempo")[ENVELOPE_COLUMN].sort_index()
+    if end is None:
+        end = data_access.load_fact_table(columns=["fecha_venta"])["fecha_venta"].max()
+    start = pd.Period(start if start is not None else envelope.index.min(), "M").to_timestamp()
+    end = pd.Period(end, "M").to_timestamp()
+    envelope = envelope.loc[start:end]
+    if envelope.empty or envelope.index.min() != start or envelope.index.max() != end:
+        raise ValueError(
+            f"El índice de supermercados no cubre {start:%Y-%m} a {end:%Y-%m} "
+            f"(disponible: {index['indice_tiempo'].min():%Y-%m} a {index['indice_tiempo'].max():%Y-%m})."
+        )
+    return envelope / envelope.sum()
+
+
+class Profiles:
+    """
+    Perfiles de la tabla de hechos y clientes (reales y sintéticos) a muestrear.
+
+    Los clientes se guardan ordenados por fecha de alta para elegir, con una
+    búsqueda binaria, solo entre los dados de alta antes de cada venta.
+    """
+
+    def __init__(self, fact, n_clients, first_date, last_date, rng):
+        # Productos: distribución de los ítems vendidos y sus atributos.
+        products = fact.drop_duplicates("id_producto").set_index("id_producto")
+        product_ids, self.product_p = _distribution(fact["id_producto"].to_numpy())
+        products = products.loc[product_ids]
+        self.product_id = product_ids.astype(np.int32)
+        self.product_price = products["precio_unitario"].to_numpy(dtype=float)
+        self.product_name, self.product_name_dtype = _categories(products["nombre_producto"].astype(str))
+        self.category, self.category_dtype = _categories(products["categoria"].astype(str))
+
+        self.quantities, self.quantity_p = _distribution(fact["cantidad"].to_numpy())
+        self.items, self.items_p = _distribution(fact.groupby("id_venta", observed=True).size().to_numpy())
+        self.payments, self.payment_p = _distribution(
+            fact.drop_duplicates("id_venta")["medio_pago"].astype(str).to_numpy())
+        self._build_clients(fact, n_clients, first_date, last_date, rng)
+
+    def _build_clients(self, fact, n_clients, first_date, last_date, rng):
+        real = fact.drop_duplicates("id_cliente")
+        names = real["nombre_cliente"].astype(str).str.split(" ", n=1)
+        first_names = np.unique(names.str[0].to_numpy(dtype=object))
+        last_names = np.unique(names.str[1].dropna().to_numpy(dtype=object))
+        cities, city_p = _distribution(real["ciudad"].astype(str).to_numpy())
+
+        # Clientes sintéticos: nombres combinados de los reales, alta repartida
+        # en el periodo simulado (el primero, al inicio, para que toda venta
+        # tenga al menos un cliente elegible).
+        ids = np.arange(1, n_clients + 1, dtype=np.int64) + int(real["id_cliente"].max())
+        first = rng.choice(first_names, n_clients).astype(str)
+        last = rng.choice(last_names, n_clients).astype(str)
+        span = (last_date - first_date).days + 1
+        offsets = np.sort(rng.integers(0, span, n_clients))
+        offsets[0] = 0
+        domains = rng.choice(np.array(SYNTHETIC_DOMAINS), n_clients)
+        local = np.char.lower(np.char.add(np.char.add(first, "."), last))
+        local = np.char.replace(local, " ", "")
+        emails = np.char.add(np.char.add(np.char.add(local, ids.astype(str)), "@"), domains)
+
+        client_id = np.concatenate([real["id_cliente"].to_numpy(dtype=np.int64), ids])
+        client_name = np.concatenate([real["nombre_cliente"].astype(str).to_numpy(dtype=object),
+                                      np.char.add(np.char.add(first, " "), last).astype(object)])
+        client_email = np.concatenate([real["email"].astype(str).to_numpy(dtype=object), emails.astype(object)])
+        client_city = np.concatenate([real["ciudad"].astype(str).to_numpy(dtype=object),
+                                      rng.choice(cities, n_clients, p=city_p)])
+        client_signup = np.concatenate([real["fecha_alta_cliente"].to_numpy(dtype="datetime64[D]"),
+                                        np.datetime64(first_date.date(), "D") + offsets])
+
+        order = np.argsort(client_signup, kind="stable")
+        self.client_id = client_id[order].astype(np.int32)
+        self.client_signup = client_signup[order]
+        self.client_name, self.client_name_dtype = _categories(client_name[order])
+        self.client_email, self.client_email_dtype = _categories(client_email[order])
+        self.client_city, self.city_dtype = _categories(client_city[order])
+
+    def sample_sizes(self, n_rows, rng):
+        """Ítems de cada venta hasta sumar exactamente `n_rows` (la última se recorta)."""
+        mean = float(np.dot(self.items, self.items_p))
+        sizes = np.empty(0, dtype=np.int64)
+        while sizes.sum() < n_rows:
+            missing = n_rows - sizes.sum()
+            draw = rng.choice(self.items, math.ceil(missing / mean) + 16, p=self.items_p)
+            sizes = np.concatenate([sizes, draw])
+        total = np.cumsum(sizes)
+        n_sales = int(np.searchsorted(total, n_rows)) + 1
+        sizes = sizes[:n_sales]
+        sizes[-1] -= total[n_sales - 1] - n_rows
+        return sizes
+
+    def sample_clients(self, dates, rng):
+        """Índice de un cliente dado de alta a más tardar en cada fecha."""
+        eligible = np.searchsorted(self.client_signup, dates, side="right")
+        return (rng.random(len(dates)) * eligible).astype(np.int64)
+
+
+def _partition(profiles, month_starts, month_days, month_ends, first_row, n_rows, first_sale, rng):
+    """
+    Genera las filas [first_row, first_row + n_rows) del histórico.
+
+    El día de cada venta sale de su posición (más un desplazamiento aleatorio)
+    dentro de las filas de su mes: se reparte de forma uniforme en el mes y
+    las fechas quedan ordenadas también entre particiones.
+    """
+    # Nivel venta: fecha, cliente y medio de pago compartidos por sus ítems.
+    sizes = profiles.sample_sizes(n_rows, rng)
+    sale_row = first_row + np.cumsum(sizes) - sizes
+    sale_month = np.searchsorted(month_ends, sale_row, side="right")
+    month_first = month_ends[sale_month] - np.diff(month_ends, prepend=0)[sale_month]
+    position = (sale_row - month_first + rng.random(len(sizes))) / (month_ends[sale_month] - month_first)
+    sale_date = month_starts[sale_month] + (position * month_days[sale_month]).astype(np.int64)
+    client = profiles.sample_clients(sale_date, rng)
+    payment = rng.choice(len(profiles.payments), len(sizes), p=profiles.payment_p)
+
+    # Nivel ítem: producto y cantidad.
+    sale = np.repeat(np.arange(len(sizes)), sizes)
+    client = client[sale]
+    product = rng.choice(len(profiles.product_id), n_rows, p=profiles.product_p)
+    quantity = rng.choice(profiles.quantities, n_rows, p=profiles.quantity_p).astype(np.int16)
+    price = profiles.product_price[product]
+
+    df = pd.DataFrame({
+        "id_venta": (first_sale + sale).astype(np.int32),
+        "fecha_venta": sale_date[sale].astype("datetime64[ns]"),
+        "id_cliente": profiles.client_id[client],
+        "nombre_cliente": pd.Categorical.from_codes(profiles.client_name[client], dtype=profiles.client_name_dtype),
+        "email": pd.Categorical.from_codes(profiles.client_email[client], dtype=profiles.client_email_dtype),
+        "medio_pago": pd.Categorical.from_codes(payment[sale], categories=profiles.payments),
+        "id_producto": profiles.product_id[product],
+        "nombre_producto": pd.Categorical.from_codes(profiles.product_name[product], dtype=profiles.product_name_dtype),
+        "cantidad": quantity,
+        "precio_unitario": price,
+        "importe": quantity * price,
+        "categoria": pd.Categorical.from_codes(profiles.category[product], dtype=profiles.category_dtype),
+        "ciudad": pd.Categorical.from_codes(profiles.client_city[client], dtype=profiles.city_dtype),
+        "fecha_alta_cliente": profiles.client_signup[client].astype("datetime64[ns]"),
+    })
+    return df, len(sizes)
+
+
+def default_clients(n_rows):
+    """Clientes sintéticos por defecto: uno cada ROWS_PER_CLIENT filas."""
+    return max(1, n_rows // ROWS_PER_CLIENT)
+
+
+def iter_partitions(n_rows, seed=None, start=None, end=None, n_clients=None, partition_rows=PARTITION_ROWS):
+    """
+    Genera el histórico sintético por particiones.
+
+    Args:
+        n_rows: Número total de ítems de venta (filas).
+        seed: Semilla; None usa una aleatoria.
+        start, end: Primer y último mes simulados (ver monthly_envelope).
+        n_clients: Clientes sintéticos además de los reales (por defecto,
+            default_clients(n_rows)).
+        partition_rows: Filas por partición.
+
+    Yields:
+        DataFrames con las columnas y tipos de df_expanded, en orden de fecha
+        y con id_venta consecutivos entre particiones.
+    """
+    if n_rows <= 0 or partition_rows <= 0:
+        raise ValueError("El número de filas y el tamaño de partición deben ser positivos.")
+    envelope = monthly_envelope(start, end)
+    n_parts = math.ceil(n_rows / partition_rows)
+    seeds = np.random.SeedSequence(seed).spawn(n_parts + 1)
+    rng = np.random.default_rng(seeds[0])
+
+    month_starts = envelope.index.to_numpy(dtype="datetime64[D]")
+    month_days = envelope.index.days_in_month.to_numpy()
+    month_ends = np.cumsum(rng.multinomial(n_rows, envelope.to_numpy()))
+
+    fact = data_access.load_fact_table()
+    if n_clients is None:
+        n_clients = default_clients(n_rows)
+    last_date = envelope.index.max() + pd.offsets.MonthEnd(0)
+    profiles = Profiles(fact, n_clients, envelope.index.min(), last_date, rng)
+
+    first_sale = 1
+    for part in range(n_parts):
+        first_row = part * partition_rows
+        size = min(partition_rows, n_rows - first_row)
+        df, n_sales = _partition(profiles, month_starts, month_days, month_ends,
+                                 first_row, size, first_sale, np.random.default_rng(seeds[part + 1]))
+        first_sale += n_sales
+        yield df
+
+
+def write_synthetic(n_rows, output_dir=SYNTHETIC_DIR, seed=None, start=None, end=None,
+                    n_clients=None, partition_rows=PARTITION_ROWS):
+    """
+    Escribe el histórico sintético como un directorio de particiones Parquet
+    (part-00000.parquet, ...) legible con aurelion.streaming.iter_chunks.
+
+    Las particiones de una ejecución anterior en `output_dir` se eliminan. Los
+    parámetros usados se guardan en `output_dir/_manifest.json`.
+
+    Returns:
+        Diccionario del manifiesto.
+    """
+    for path in glob.glob(os.path.join(output_dir, "part-*.parquet")):
+        os.remove(path)
+    metadata = {snapshots.SCHEMA_METADATA_KEY: snapshots.schema_version("df_expanded").encode()}
+
+    started = time.perf_counter()
+    files, n_sales = [], 0
+    for part, df in enumerate(iter_partitions(n_rows, seed, start, end, n_clients, partition_rows)):
+        path = os.path.join(output_dir, f"part-{part:05d}.parquet")
+        snapshots.write_parquet(df, path, metadata)
+        files.append(os.path.basename(path))
+        n_sales = int(df["id_venta"].iloc[-1])
+
+    manifest = {
+        "rows": n_rows,
+        "sales": n_sales,
+        "seed": seed,
+        "start": start,
+        "end": end,
+        "clients": n_clients if n_clients is not None else default_clients(n_rows),
+        "partition_rows": partition_rows,
+        "files": files,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+    with open(os.path.join(output_dir, MANIFEST_NAME), "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera un histórico de ventas sintético en Parquet.")
+    parser.add_argument("--filas", type=int, required=True, help="Número de ítems de venta a generar.")
+    parser.add_argument("--semilla", type=int, default=None, help="Semilla del generador.")
+    parser.add_argument("--desde", default=None, help="Primer mes simulado (AAAA-MM).")
+    parser.add_argument("--hasta", default=None, help="Último mes simulado (AAAA-MM).")
+    parser.add_argument("--clientes", type=int, default=None, help="Número de clientes sintéticos.")
+    parser.add_argument("--filas-por-particion", type=int, default=PARTITION_ROWS,
+                        help="Filas de cada archivo Parquet.")
+    parser.add_argument("--salida", default=SYNTHETIC_DIR, help="Directorio de salida.")
+    args = parser.parse_args()
+
+    try:
+        manifest = write_synthetic(args.filas, args.salida, args.semilla, args.desde, args.hasta,
+                                   args.clientes, args.filas_por_particion)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"Generadas {manifest['rows']:,} filas ({manifest['sales']:,} ventas) en "
+          f"{len(manifest['files'])} particiones de {os.path.abspath(args.salida)} "
+          f"({manifest['seconds']} s).")
+
+
+if __name__ == "__main__":
+    main()
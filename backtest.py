@@ -0,0 +1,225 @@
+"""
+Backtesting con origen móvil (rolling origin) del modelo de ventas mensuales.
+
+Para cada origen (un fin de mes del histórico) se entrena el modelo solo con
+los meses hasta el origen y se pronostica de forma recursiva (forecast_steps)
+hasta el mayor horizonte pedido; cada pronóstico se compara con las ventas
+reales a 1, 3, 6 y 12 meses (por defecto). Así un cambio del modelo se evalúa
+sobre decenas de cortes de 2019 a 2024 y no sobre una única validación.
+
+Las features se leen una sola vez de cached_features y la matriz se
+comparte con los procesos del pool al iniciarlos; cada tarea del pool es un
+grupo de orígenes.
+
+Con --exogenas el modelo usa además las features exógenas de
+aurelion.exogenous; desde cada origen solo se consideran publicados los datos
+macro hasta ese mes (los meses siguientes repiten los últimos valores).
+
+Uso:
+    python backtest.py --horizontes 1 3 6 12 --workers 4
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+
+from aurelion import exogenous, snapshots
+from train_model import FEATURES, MODEL_PARAMS, TARGET, cached_features, forecast_steps, load_monthly_sales
+
+HORIZONS = (1, 3, 6, 12)
+# Meses mínimos de entrenamiento (con todas las features) antes del primer origen.
+MIN_TRAIN = 24
+# Resultado generado: va con los demás artefactos, fuera de los datos versionados.
+OUTPUT_PATH = os.path.join(snapshots.SNAPSHOT_DIR, "backtest_errors.csv")
+
+# Datos compartidos con cada proceso del pool (ver _init_worker).
+_shared = {}
+
+
+def _init_worker(X, y, feature_dates, history, history_dates, features, model_params, model_class,
+                 exogenous_features):
+    """Guarda en el proceso del pool la matriz de features y el histórico completos."""
+    _shared.update(X=X, y=y, feature_dates=feature_dates, history=history, history_dates=history_dates,
+                   features=features, model_params=model_params, model_class=model_class,
+                   exogenous_features=exogenous_features)
+
+
+def forecast_from_origins(X, y, feature_dates, history, history_dates, features, model_params, origins, horizon,
+                          model_class=RandomForestRegressor, exogenous_features=None):
+    """
+    Entrena un modelo por origen con las filas hasta el origen y pronostica `horizon` meses.
+
+    Args:
+        X, y: Matriz de features y objetivo, ordenados por `feature_dates`.
+        history, history_dates: Ventas mensuales completas (para los lags) y sus fechas.
+        features: Nombres de las columnas de X.
+        model_params: Hiperparámetros del modelo.
+        origins: Fechas de corte (fin de mes).
+        model_class: Clase del modelo (ver train_model.BACKENDS).
+        exogenous_features: Features exógenas de `features` indexadas por fecha
+            (ver exogenous.load_features); None si el modelo no las usa.
+
+    Returns:
+        Lista de tuplas (origen, filas_de_entrenamiento, predicciones) con
+        `horizon` predicciones por origen.
+    """
+    results = []
+    for origin in origins:
+        # Filas de entrenamiento y de histórico hasta el origen (ambas ordenadas por fecha).
+        cutoff = np.datetime64(origin)
+        n_train = np.searchsorted(feature_dates, cutoff, side="right")
+        n_history = np.searchsorted(history_dates, cutoff, side="right")
+        model = model_class(**model_params)
+        model.fit(X[:n_train], y[:n_train])
+        exo_values = None
+        if exogenous_features is not None:
+            future_dates = pd.date_range(start=origin + pd.offsets.MonthEnd(1), periods=horizon, freq='ME')
+            exo_values = exogenous.future_values(exogenous_features, future_dates, as_of=origin)
+        _, predictions = forecast_steps(model, history[:n_history], origin, features, horizon, exo_values)
+        results.append((origin, n_train, predictions[0]))
+    return results
+
+
+def _backtest_chunk(origins, horizon):
+    """Pronostica desde cada origen de `origins` (se ejecuta en un proceso del pool)."""
+    return forecast_from_origins(
+        _shared["X"], _shared["y"], _shared["feature_dates"], _shared["history"], _shared["history_dates"],
+        _shared["features"], _shared["model_params"], origins, horizon, _shared["model_class"],
+        _shared["exogenous_features"],
+    )
+
+
+def default_origins(df_model, horizons=HORIZONS, min_train=MIN_TRAIN):
+    """
+    Orígenes por defecto: cada fin de mes con al menos `min_train` meses de
+    entrenamiento y al menos el menor horizonte de datos reales posteriores.
+    """
+    dates = df_model['date'].sort_values().reset_index(drop=True)
+    last_origin = dates.iloc[-1] - pd.offsets.MonthEnd(min(horizons))
+    return [date for date in dates.iloc[min_train - 1:] if date <= last_origin]
+
+
+def backtest(monthly_sales, origins=None, horizons=HORIZONS, features=FEATURES, model_params=None,
+             df_features=None, min_train=MIN_TRAIN, workers=None, chunk_size=None,
+             model_class=RandomForestRegressor):
+    """
+    Evalúa el pronóstico recursivo desde varios orígenes en paralelo.
+
+    Args:
+        monthly_sales: DataFrame con 'date' (fin de mes) y 'sales', ordenado por fecha.
+        origins: Fechas de corte (fin de mes); None usa default_origins.
+        horizons: Horizontes (meses después del origen) a evaluar.
+        features: Features del modelo (de create_features o de aurelion.exogenous).
+        model_params: Hiperparámetros del modelo (None usa MODEL_PARAMS).
+        df_features: Salida de create_features(monthly_sales) si ya se calculó
+            (None la lee de cached_features).
+        min_train: Meses mínimos de entrenamiento para los orígenes por defecto.
+        workers: Procesos del pool (None usa todos los núcleos).
+        chunk_size: Orígenes por tarea enviada al pool (None reparte ~4 tareas por proceso).
+        model_class: Clase del modelo (ver train_model.BACKENDS).
+
+    Returns:
+        DataFrame tidy con una fila por origen y horizonte: 'origin', 'horizon',
+        'date', 'train_rows', 'sales', 'pred_sales', 'error', 'abs_error' y
+        'pct_error' (error absoluto relativo a las ventas reales, en %).
+    """
+    model_params = MODEL_PARAMS if model_params is None else model_params
+    horizons = sorted(set(horizons))
+    if df_features is None:
+        df_features = cached_features(monthly_sales)
+    exo_names = [name for name in features if name.startswith(exogenous.PREFIX)]
+    exogenous_features = exogenous.load_features(exo_names) if exo_names else None
+    missing = [name for name in exo_names if name not in df_features.columns]
+    if missing:
+        df_features = exogenous.join_features(df_features, missing)
+    df_model = df_features.dropna(subset=features + [TARGET])
+    if origins is None:
+        origins = default_origins(df_model, horizons, min_train)
+    origins = sorted(pd.Timestamp(origin) + pd.offsets.MonthEnd(0) for origin in origins)
+    if not origins:
+        raise ValueError("No hay orígenes con datos suficientes para el backtesting.")
+
+    # Matriz de features y objetivo calculadas una sola vez para todos los orígenes.
+    shared = (
+        df_model[features].to_numpy(dtype=float), df_model[TARGET].to_numpy(dtype=float),
+        df_model['date'].to_numpy(), monthly_sales[TARGET].to_numpy(dtype=float),
+        monthly_sales['date'].to_numpy(), list(features), model_params, model_class, exogenous_features,
+    )
+    horizon = max(horizons)
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(origins) // ((workers or os.cpu_count() or 1) * 4)))
+    chunks = [origins[i:i + chunk_size] for i in range(0, len(origins), chunk_size)]
+
+    actual = monthly_sales.set_index('date')[TARGET]
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=shared) as pool:
+        futures = [pool.submit(_backtest_chunk, chunk, horizon) for chunk in chunks]
+        for future in futures:
+            for origin, train_rows, predictions in future.result():
+                for h in horizons:
+                    date = origin + pd.offsets.MonthEnd(h)
+                    if date in actual.index:
+                        rows.append((origin, h, date, train_rows, actual[date], predictions[h - 1]))
+
+    result = pd.DataFrame(rows, columns=['origin', 'horizon', 'date', 'train_rows', 'sales', 'pred_sales'])
+    result['error'] = result['pred_sales'] - result['sales']
+    result['abs_error'] = result['error'].abs()
+    result['pct_error'] = result['abs_error'] / result['sales'].abs() * 100
+    return result
+
+
+def summarize(errors):
+    """Resumen por horizonte: número de orígenes, MAE, RMSE y MAPE (%)."""
+    grouped = errors.groupby('horizon')
+    return pd.DataFrame({
+        'origins': grouped.size(),
+        'mae': grouped['abs_error'].mean(),
+        'rmse': grouped['error'].apply(lambda e: np.sqrt(np.mean(e ** 2))),
+        'mape': grouped['pct_error'].mean(),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtesting con origen móvil del modelo de ventas mensuales.")
+    parser.add_argument('--horizontes', type=int, nargs='+', default=list(HORIZONS),
+                        help="Horizontes a evaluar, en meses después del origen.")
+    parser.add_argument('--desde', help="Primer origen (por defecto, tras --min-entrenamiento meses).")
+    parser.add_argument('--hasta', help="Último origen (por defecto, el último con datos reales posteriores).")
+    parser.add_argument('--paso', type=int, default=1, help="Meses entre orígenes consecutivos.")
+    parser.add_argument('--min-entrenamiento', type=int, default=MIN_TRAIN,
+                        help="Meses mínimos de entrenamiento antes del primer origen.")
+    parser.add_argument('--workers', type=int, default=None, help="Procesos del pool (por defecto, todos los núcleos).")
+    parser.add_argument('--exogenas', action='store_true',
+                        help="Agregar las features exógenas del índice de supermercados (ver aurelion.exogenous).")
+    parser.add_argument('--salida', default=OUTPUT_PATH, help="Archivo CSV con el error por origen y horizonte.")
+    args = parser.parse_args()
+
+    monthly_sales = load_monthly_sales()
+    df_features = cached_features(monthly_sales)
+    features = FEATURES
+    if args.exogenas:
+        features = FEATURES + exogenous.feature_names()
+        df_features = exogenous.join_features(df_features, exogenous.feature_names())
+    origins = default_origins(df_features.dropna(), args.horizontes, args.min_entrenamiento)
+    if args.desde:
+        origins = [origin for origin in origins if origin >= pd.Timestamp(args.desde)]
+    if args.hasta:
+        origins = [origin for origin in origins if origin <= pd.Timestamp(args.hasta)]
+    origins = origins[::args.paso]
+    if not origins:
+        parser.error("No hay orígenes en el rango indicado.")
+    print(f"Backtesting de {len(origins)} orígenes ({origins[0]:%Y-%m} a {origins[-1]:%Y-%m}) "
+          f"con {args.workers or os.cpu_count()} procesos...")
+
+    errors = backtest(monthly_sales, origins, args.horizontes, features, df_features=df_features, workers=args.workers)
+    os.makedirs(os.path.dirname(args.salida) or ".", exist_ok=True)
+    errors.to_csv(args.salida, index=False)
+    print(f"Errores por origen y horizonte guardados en '{args.salida}'\n")
+    print(summarize(errors).to_string(float_format=lambda value: f"{value:,.2f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,465 @@
+"""
+Benchmarks de las etapas de carga, unión, agregación y pronóstico.
+
+Cada etapa se mide sobre datasets generados con aurelion.synthetic de 10^3 a
+10^7 filas y se reporta el tiempo, la memoria máxima (RSS) y las filas por
+segundo. Cada medición corre en un proceso nuevo, por lo que la memoria de una
+etapa no se mezcla con la de las anteriores, y la preparación de sus datos no
+forma parte del tiempo medido.
+
+Los resultados se guardan en JSON (uno por ejecución, con el commit actual)
+para comparar ejecuciones entre commits con --comparar.
+
+Uso:
+    python benchmark.py [--filas 1000 100000] [--etapas merge rf_fit] [--repeticiones 3]
+    python benchmark.py --comparar benchmarks/<anterior>.json
+"""
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+
+from aurelion import aggregates, fact_table, snapshots, synthetic
+from train_model import (FEATURES, MODEL_PARAMS, TARGET, _predict_array, _series_layout, create_features,
+                         extend_features, forecast_steps)
+
+RESULTS_DIR = "./benchmarks"
+DATA_DIR = os.path.join(snapshots.SNAPSHOT_DIR, "benchmarks")
+
+SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+SEED = 42
+# Meses por serie de los paneles de features y horizonte del pronóstico.
+PANEL_MONTHS = 90
+HORIZON = 18
+# Filas con las que se entrena el modelo de rf_predict y forecast_recursive.
+MODEL_ROWS = 10_000
+# Tablas fuente (claves de snapshots.SOURCES) que se generan para cada tamaño.
+SOURCE_NAMES = ["ventas", "detalle_ventas", "clientes", "productos_corregidos"]
+
+# Etapa: preparación (en el proceso de la medición, no cronometrada), función
+# medida, formatos de archivo que necesita y máximo de filas por defecto
+# (None = sin límite). Los límites evitan mediciones de horas o que no caben
+# en memoria; --sin-limites los ignora.
+Stage = namedtuple("Stage", ["setup", "run", "formats", "max_rows"])
+
+
+# --- Datos generados ---------------------------------------------------------
+
+def dataset_dir(rows, seed):
+    """Carpeta de los archivos generados para `rows` filas."""
+    return os.path.join(DATA_DIR, f"{rows}_{seed}")
+
+
+def _split_sources(unified, productos):
+    """Tablas fuente (ventas, detalle_ventas, clientes y productos) de una tabla unificada."""
+    ventas = unified.drop_duplicates("id_venta")[
+        ["id_venta", "fecha_venta", "id_cliente", "nombre_cliente", "email", "medio_pago"]
+    ].rename(columns={"fecha_venta": "fecha"})
+    detalle = unified[["id_venta", "id_producto", "nombre_producto", "cantidad", "precio_unitario", "importe"]]
+    clientes = unified.drop_duplicates("id_cliente")[
+        ["id_cliente", "nombre_cliente", "email", "ciudad", "fecha_alta_cliente"]
+    ].rename(columns={"fecha_alta_cliente": "fecha_alta"})
+    tables = {"ventas": ventas, "detalle_ventas": detalle, "clientes": clientes, "productos_corregidos": productos}
+    # Tipos de las fuentes reales (textos como string, no categóricos).
+    return {name: snapshots.apply_schema(df.reset_index(drop=True), name) for name, df in tables.items()}
+
+
+def prepare_dataset(rows, seed, formats):
+    """
+    Genera (una sola vez) los archivos de `rows` filas en los formatos pedidos.
+
+    Siempre escribe la tabla unificada y las cuatro fuentes en Parquet; "csv"
+    añade df_unified.csv y "xlsx", las cuatro fuentes en Excel.
+    """
+    folder = dataset_dir(rows, seed)
+    unified_path = os.path.join(folder, "unified.parquet")
+    if not os.path.exists(unified_path):
+        unified = snapshots.concat(list(synthetic.iter_partitions(rows, seed=seed)))
+        sources = _split_sources(unified, snapshots.read_table("productos_corregidos"))
+        for name, df in sources.items():
+            snapshots.write_parquet(df, os.path.join(folder, f"{name}.parquet"))
+        snapshots.write_parquet(unified, unified_path)
+
+    if "csv" in formats and not os.path.exists(os.path.join(folder, "df_unified.csv")):
+        pd.read_parquet(unified_path).to_csv(os.path.join(folder, "df_unified.csv"), index=False)
+    if "xlsx" in formats:
+        for name in SOURCE_NAMES:
+            path = os.path.join(folder, f"{name}.xlsx")
+            if not os.path.exists(path):
+                pd.read_parquet(os.path.join(folder, f"{name}.parquet")).to_excel(path, index=False)
+
+
+def _read_sources(folder):
+    # En el orden de fact_table.merge_sources.
+    return [pd.read_parquet(os.path.join(folder, f"{name}.parquet"))
+            for name in ("ventas", "detalle_ventas", "productos_corregidos", "clientes")]
+
+
+def _panel(rows, seed):
+    """Panel en formato largo ('serie', 'date', 'sales') de unas `rows` filas."""
+    rng = np.random.default_rng(seed)
+    n_series = max(1, -(-rows // PANEL_MONTHS))
+    months = pd.date_range("2017-01-31", periods=PANEL_MONTHS, freq="ME")
+    season = 1 + 0.2 * np.sin(2 * np.pi * months.month.to_numpy() / 12)
+    level = rng.lognormal(12, 1, size=(n_series, 1))
+    sales = level * season * rng.lognormal(0, 0.1, size=(n_series, PANEL_MONTHS))
+    panel = pd.DataFrame({
+        "serie": np.repeat(np.arange(n_series), PANEL_MONTHS),
+        "date": np.tile(months, n_series),
+        "sales": sales.ravel(),
+    })
+    return panel.iloc[:rows]
+
+
+def _model_data(rows, seed):
+    return create_features(_panel(rows, seed), by="serie").dropna()[FEATURES + [TARGET]]
+
+
+def _fit_model(df):
+    return RandomForestRegressor(**MODEL_PARAMS).fit(df[FEATURES], df[TARGET])
+
+
+# --- Etapas --------------------------------------------------------------------
+# Cada setup recibe (carpeta de datos, filas, semilla) y devuelve los argumentos
+# de la función medida.
+
+def _setup_folder(folder, rows, seed):
+    return (folder,)
+
+
+def run_load_excel(folder):
+    # Carga de las fuentes como en see_sales / see_eda antes de los snapshots.
+    for name in SOURCE_NAMES:
+        pd.read_excel(os.path.join(folder, f"{name}.xlsx"))
+
+
+def run_load_csv(folder):
+    pd.read_csv(os.path.join(folder, "df_unified.csv"))
+
+
+def run_load_parquet(folder):
+    pd.read_parquet(os.path.join(folder, "unified.parquet"))
+
+
+def _setup_sources(folder, rows, seed):
+    return tuple(_read_sources(folder))
+
+
+def run_merge(ventas, detalle_ventas, productos, clientes):
+    fact_table.merge_sources(ventas, detalle_ventas, productos, clientes)
+
+
+def _setup_merged(folder, rows, seed):
+    return (fact_table.merge_sources(*_read_sources(folder)),)
+
+
+def run_dedupe_transpose(df_merged):
+    # Eliminación de columnas duplicadas tal como se describe en el EDA.
+    df_merged.T.drop_duplicates().T
+
+
+def run_dedupe_hash(df_merged):
+    fact_table.drop_duplicate_columns(df_merged)
+
+
+def _setup_unified(folder, rows, seed):
+    return (pd.read_parquet(os.path.join(folder, "unified.parquet")),)
+
+
+def run_rollups_groupby(df):
+    # Resúmenes del reporte bivariado calculados sobre las transacciones.
+    df.groupby("categoria", observed=True)["importe"].sum()
+    df.groupby("ciudad", observed=True)["importe"].sum()
+    pd.crosstab(df["categoria"], df["medio_pago"], values=df["importe"], aggfunc="sum")
+    df.set_index("fecha_venta").resample("ME")["importe"].sum()
+    df[["cantidad", "precio_unitario", "importe"]].corr()
+
+
+def run_rollups_cube(df):
+    cube = aggregates.compute_rollup(df, aggregates.CUBE_NAME)
+    for by in (["categoria"], ["ciudad"], ["categoria", "medio_pago"], ["mes"]):
+        aggregates.rollup_cube(cube, by)
+
+
+def _setup_panel(folder, rows, seed):
+    return (_panel(rows, seed),)
+
+
+def run_create_features(panel):
+    create_features(panel, by="serie")
+
+
+def _setup_features_update(folder, rows, seed):
+    # Features ya calculadas para todos los meses salvo el último de cada serie.
+    panel = _panel(rows, seed)
+    stored = create_features(panel[panel["date"] < panel["date"].max()], by="serie")
+    return stored, _series_layout(stored, "serie"), panel
+
+
+def run_features_update(stored, layout, panel):
+    # Motor de cached_features: toma las filas guardadas y calcula el mes nuevo.
+    extend_features(stored, panel, by="serie", layout=layout)
+
+
+def _setup_model_data(folder, rows, seed):
+    return (_model_data(rows, seed),)
+
+
+def run_rf_fit(df):
+    _fit_model(df)
+
+
+def _setup_predict(folder, rows, seed):
+    model = _fit_model(_model_data(MODEL_ROWS, seed))
+    return model, _model_data(rows, seed)[FEATURES].to_numpy()
+
+
+def run_rf_predict(model, X):
+    _predict_array(model, X)
+
+
+def _setup_forecast(folder, rows, seed):
+    # Una serie por cada HORIZON filas pronosticadas.
+    model = _fit_model(_model_data(MODEL_ROWS, seed))
+    panel = _panel(max(1, rows // HORIZON) * PANEL_MONTHS, seed)
+    history = panel["sales"].to_numpy().reshape(-1, PANEL_MONTHS)
+    return model, history, panel["date"].max()
+
+
+def run_forecast_recursive(model, history, last_date):
+    # Motor de forecast_recursive, con todas las series en cada paso.
+    forecast_steps(model, history, last_date, FEATURES, HORIZON)
+
+
+STAGES = {
+    "carga_excel": Stage(_setup_folder, run_load_excel, ("xlsx",), 10 ** 5),
+    "carga_csv": Stage(_setup_folder, run_load_csv, ("csv",), None),
+    "carga_parquet": Stage(_setup_folder, run_load_parquet, (), None),
+    "merge": Stage(_setup_sources, run_merge, (), 10 ** 6),
+    "dedupe_transpuesta": Stage(_setup_merged, run_dedupe_transpose, (), 10 ** 5),
+    "dedupe_hash": Stage(_setup_merged, run_dedupe_hash, (), 10 ** 6),
+    "rollups_groupby": Stage(_setup_unified, run_rollups_groupby, (), None),
+    "rollups_cubo": Stage(_setup_unified, run_rollups_cube, (), None),
+    "create_features": Stage(_setup_panel, run_create_features, (), None),
+    "features_incremental": Stage(_setup_features_update, run_features_update, (), None),
+    "rf_fit": Stage(_setup_model_data, run_rf_fit, (), 10 ** 5),
+    "rf_predict": Stage(_setup_predict, run_rf_predict, (), 10 ** 6),
+    "forecast_recursive": Stage(_setup_forecast, run_forecast_recursive, (), 10 ** 6),
+}
+# Etapas que leen los datos generados con aurelion.synthetic (las demás generan su panel).
+SYNTHETIC_STAGES = {"carga_excel", "carga_csv", "carga_parquet", "merge",
+                    "dedupe_transpuesta", "dedupe_hash", "rollups_groupby", "rollups_cubo"}
+
+
+# --- Medición ------------------------------------------------------------------
+
+def _reset_peak_rss():
+    """Reinicia el pico de RSS del proceso (solo Linux); devuelve si fue posible."""
+    try:
+        with open("/proc/self/clear_refs", "w") as file:
+            file.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _proc_status_mb(field):
+    with open("/proc/self/status") as file:
+        for line in file:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) / 1024
+    return None
+
+
+def _peak_rss_mb(reset):
+    if reset:
+        return _proc_status_mb("VmHWM")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss está en bytes en macOS y en KB en Linux.
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+def measure(stage_name, rows, seed, repeats):
+    """
+    Mide la etapa `stage_name` con `rows` filas (se ejecuta en un proceso nuevo).
+
+    Returns:
+        Diccionario con el tiempo mínimo y los de cada repetición (segundos),
+        filas por segundo y memoria máxima del proceso durante la etapa (MB).
+    """
+    stage = STAGES[stage_name]
+    args = stage.setup(dataset_dir(rows, seed), rows, seed)
+    reset = _reset_peak_rss()
+    start_rss = _proc_status_mb("VmRSS") if reset else None
+    times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        stage.run(*args)
+        times.append(time.perf_counter() - started)
+    seconds = min(times)
+    return {
+        "stage": stage_name,
+        "rows": rows,
+        "status": "ok",
+        "seconds": round(seconds, 6),
+        "seconds_all": [round(t, 6) for t in times],
+        "rows_per_second": round(rows / seconds, 1) if seconds > 0 else None,
+        "peak_rss_mb": round(_peak_rss_mb(reset), 1),
+        # Memoria del proceso al empezar (datos de entrada y librerías cargadas).
+        "start_rss_mb": round(start_rss, 1) if start_rss is not None else None,
+        # Sin reinicio del pico, la memoria incluye la de la preparación.
+        "peak_rss_includes_setup": not reset,
+    }
+
+
+def _measure_isolated(stage_name, rows, seed, repeats):
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(measure, stage_name, rows, seed, repeats).result()
+
+
+def run_benchmarks(stages, sizes, seed=SEED, repeats=1, limits=True, log=print):
+    """
+    Ejecuta las etapas `stages` para cada tamaño de `sizes`.
+
+    Returns:
+        Lista de resultados (ver measure); las combinaciones que superan el
+        máximo de filas de la etapa figuran con status "omitido" y las que
+        fallan, con status "error".
+    """
+    results = []
+    for rows in sizes:
+        for name in stages:
+            stage = STAGES[name]
+            if limits and stage.max_rows is not None and rows > stage.max_rows:
+                results.append({"stage": name, "rows": rows, "status": "omitido"})
+                continue
+            try:
+                if name in SYNTHETIC_STAGES:
+                    prepare_dataset(rows, seed, stage.formats)
+                result = _measure_isolated(name, rows, seed, repeats)
+            except Exception as e:  # noqa: BLE001 - se registra y se sigue con la siguiente etapa.
+                result = {"stage": name, "rows": rows, "status": "error", "error": f"{type(e).__name__}: {e}"}
+            results.append(result)
+            log(_format_result(result))
+    return results
+
+
+def _format_result(result):
+    if result["status"] != "ok":
+        return f"{result['stage']:<20} {result['rows']:>10,}  {result['status']} {result.get('error', '')}"
+    return (f"{result['stage']:<20} {result['rows']:>10,}  {result['seconds']:>10.4f} s  "
+            f"{result['rows_per_second']:>14,.0f} filas/s  {result['peak_rss_mb']:>8.1f} MB")
+
+
+def _git_commit():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                    capture_output=True, text=True, check=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, dirty
+
+
+def environment():
+    """Commit y entorno de la ejecución, guardados junto a los resultados."""
+    import sklearn
+
+    commit, dirty = _git_commit()
+    return {
+        "commit": commit,
+        "dirty": dirty,
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "sklearn": sklearn.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def save_results(results, meta, output_dir=RESULTS_DIR, prefix=""):
+    """Guarda los resultados en `output_dir/<prefijo><fecha>_<commit>.json` y devuelve la ruta."""
+    os.makedirs(output_dir, exist_ok=True)
+    stamp = meta["timestamp"].replace(":", "").replace("-", "")
+    name = f"{prefix}{stamp}_{meta['commit'] or 'sin-commit'}{'-dirty' if meta['dirty'] else ''}.json"
+    path = os.path.join(output_dir, name)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"meta": meta, "results": results}, file, indent=2)
+    return path
+
+
+def compare(results, baseline, threshold=0.2):
+    """
+    Compara los tiempos con los de una ejecución anterior.
+
+    Args:
+        results: Resultados actuales.
+        baseline: Contenido del JSON de la ejecución anterior.
+        threshold: Aumento relativo del tiempo a partir del cual se marca una regresión.
+
+    Returns:
+        Lista de (etapa, filas, segundos anteriores, segundos actuales, cociente, regresión).
+    """
+    previous = {(r["stage"], r["rows"]): r for r in baseline["results"] if r["status"] == "ok"}
+    rows = []
+    for result in results:
+        base = previous.get((result["stage"], result["rows"]))
+        if result["status"] != "ok" or base is None or base["seconds"] <= 0:
+            continue
+        ratio = result["seconds"] / base["seconds"]
+        rows.append((result["stage"], result["rows"], base["seconds"], result["seconds"], ratio,
+                     ratio > 1 + threshold))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mide el tiempo y la memoria de las etapas del proyecto.")
+    parser.add_argument("--etapas", nargs="*", default=list(STAGES), choices=list(STAGES),
+                        help="Etapas a medir (por defecto, todas).")
+    parser.add_argument("--filas", nargs="*", type=int, default=SIZES, help="Tamaños de los datasets.")
+    parser.add_argument("--semilla", type=int, default=SEED, help="Semilla de los datos generados.")
+    parser.add_argument("--repeticiones", type=int, default=1, help="Repeticiones por medición (se toma la mínima).")
+    parser.add_argument("--sin-limites", action="store_true", help="Medir también por encima del máximo de cada etapa.")
+    parser.add_argument("--salida", default=RESULTS_DIR, help="Carpeta de los resultados JSON.")
+    parser.add_argument("--comparar", help="JSON de una ejecución anterior con el que comparar.")
+    parser.add_argument("--umbral", type=float, default=0.2,
+                        help="Aumento relativo del tiempo que se considera regresión (0.2 = 20%%).")
+    args = parser.parse_args()
+
+    meta = {**environment(), "seed": args.semilla, "repeats": args.repeticiones}
+    print(f"{'etapa':<20} {'filas':>10}  {'tiempo':>12}  {'rendimiento':>21}  {'memoria':>11}")
+    results = run_benchmarks(args.etapas, args.filas, args.semilla, args.repeticiones, not args.sin_limites)
+    path = save_results(results, meta, args.salida)
+    print(f"\nResultados guardados en {path}")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as file:
+            baseline = json.load(file)
+        print(f"\nComparación con {baseline['meta'].get('commit')} ({args.comparar}):")
+        regressions = 0
+        for stage, rows, before, after, ratio, regression in compare(results, baseline, args.umbral):
+            regressions += regression
+            print(f"{stage:<20} {rows:>10,}  {before:>10.4f} s -> {after:>10.4f} s  x{ratio:5.2f}"
+                  f"{'  REGRESIÓN' if regression else ''}")
+        if regressions:
+            print(f"\n{regressions} regresiones por encima del {args.umbral:.0%}.")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
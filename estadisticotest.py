@@ -1,105 +1,139 @@
-import pandas as pd 
-import seaborn as sns 
-import matplotlib.pyplot as plt 
-import os 
-# --- 0. Configuración y Carga de Datos --- 
-# Nombre del archivo de entrada 
-file_name = './data/df_unified_clean.csv' 
-if not os.path.exists(file_name): 
-    print(f"Error: No se encontró el archivo '{file_name}'.") 
-    print("Asegúrate de que el archivo CSV esté en la misma carpeta que este script.") 
-else: 
-    print(f"Cargando datos desde '{file_name}'...") 
-    df = pd.read_csv(file_name) 
-    # Conversión crucial de tipos de datos 
-    try: 
-        df['fecha_venta'] = pd.to_datetime(df['fecha_venta']) 
-        df['fecha_alta_cliente'] = pd.to_datetime(df['fecha_alta_cliente']) 
-        print("Columnas de fecha convertidas a datetime.") 
-    except Exception as e: 
-        print(f"Advertencia: No se pudieron convertir las columnas de fecha. {e}") 
-print("\n--- Iniciando generación de gráficos ---") 
-# --- 1. Gráfico Numérico vs. Numérico (Heatmap de Correlación) --- 
-print("Generando Gráfico 1: Mapa de Calor de Correlación...") 
-numeric_cols = ['cantidad', 'precio_unitario', 'importe'] 
-corr_matrix = df[numeric_cols].corr() 
-plt.figure(figsize=(8, 6)) 
-sns.heatmap(corr_matrix, annot=True, fmt='.2f', cmap='viridis', cbar=True, 
-annot_kws={"size": 12}) 
-plt.title('Mapa de Calor de Correlación\n(Numérico vs. Numérico)', fontsize=16) 
-plt.xticks(rotation=45, ha='right', fontsize=10) 
-plt.yticks(rotation=0, fontsize=10) 
-plt.tight_layout() 
-plt.savefig('correlacion_numerica.png') 
-plt.clf() # Limpiar la figura actual 
-
-# --- 2. Gráfico Categórico vs. Numérico (Barras: Ventas por Categoría) --- 
-print("Generando Gráfico 2: Ingresos Totales por Categoría...") 
-ventas_por_categoria = df.groupby('categoria')['importe'].sum().sort_values(ascending=False) 
-plt.figure(figsize=(10, 7)) 
-colors_cat = sns.color_palette('viridis', len(ventas_por_categoria)) 
-ventas_por_categoria.plot(kind='bar', color=colors_cat) 
-plt.title('Ingresos Totales por Categoría\n(Categórico vs. Numérico)', fontsize=16) 
-plt.ylabel('Ingresos Totales (Importe)', fontsize=12) 
-plt.xlabel('Categoría', fontsize=12) 
-plt.xticks(rotation=45, ha='right', fontsize=10) 
-plt.grid(axis='y', linestyle='--', alpha=0.7) 
-plt.tight_layout() 
-plt.savefig('ventas_por_categoria.png') 
-plt.clf() 
-# --- 3. Gráfico Categórico vs. Numérico (Barras: Ventas por Ciudad) --- 
-print("Generando Gráfico 3: Ingresos Totales por Ciudad...") 
-ventas_por_ciudad = df.groupby('ciudad')['importe'].sum().sort_values(ascending=False) 
-plt.figure(figsize=(10, 7)) 
-colors_city = sns.color_palette('plasma', len(ventas_por_ciudad)) 
-ventas_por_ciudad.plot(kind='bar', color=colors_city) 
-plt.title('Ingresos Totales por Ciudad\n(Categórico vs. Numérico)', fontsize=16) 
-plt.ylabel('Ingresos Totales (Importe)', fontsize=12) 
-plt.xlabel('Ciudad', fontsize=12) 
-plt.xticks(rotation=45, ha='right', fontsize=10) 
-plt.grid(axis='y', linestyle='--', alpha=0.7) 
-plt.tight_layout() 
-plt.savefig('ventas_por_ciudad.png') 
-plt.clf() 
-# --- 4. Gráfico Categórico vs. Numérico (Boxplot: Distribución de Precios) --- 
-print("Generando Gráfico 4: Distribución de Precios por Categoría...") 
-plt.figure(figsize=(10, 7)) 
-sns.boxplot(x='categoria', y='precio_unitario', data=df, palette='viridis') 
-plt.title('Distribución de Precios Unitarios por Categoría', fontsize=16) 
-plt.ylabel('Precio Unitario', fontsize=12) 
-plt.xlabel('Categoría', fontsize=12) 
-plt.xticks(rotation=45, ha='right', fontsize=10) 
-plt.grid(axis='y', linestyle='--', alpha=0.7) 
-plt.tight_layout() 
-plt.savefig('distribucion_precios_categoria.png') 
-plt.clf() 
-# --- 5. Gráfico Categórico vs. Categórico (Heatmap: Categoría vs. Medio de Pago) --- 
-print("Generando Gráfico 5: Relación entre Categoría y Medio de Pago...") 
-contingency_table = pd.crosstab(df['categoria'], df['medio_pago']) 
-plt.figure(figsize=(10, 7)) 
-sns.heatmap(contingency_table, annot=True, fmt='d', cmap='YlGnBu', 
-cbar=True, annot_kws={"size": 12}) 
-plt.title('Frecuencia de Medio de Pago por Categoría\n(Categórico vs. Categórico)', fontsize=16) 
-plt.ylabel('Categoría', fontsize=12) 
-plt.xlabel('Medio de Pago', fontsize=12) 
-plt.yticks(rotation=0, fontsize=10) 
-plt.tight_layout() 
-plt.savefig('categoria_vs_mediopago_heatmap.png') 
-plt.clf() 
-# --- 6. Gráfico Serie Temporal (Líneas: Evolución de Ventas) --- 
-print("Generando Gráfico 6: Evolución de Ingresos Totales (Series Temporales)...") 
-# Asegurarse de que fecha_venta es el índice para remuestrear 
-df_time = df.set_index('fecha_venta') 
-# Remuestrear por mes ('M') y sumar los importes 
-ventas_mensuales = df_time['importe'].resample('M').sum() 
-plt.figure(figsize=(12, 7)) 
-ventas_mensuales.plot(kind='line', marker='o', linestyle='-', color='dodgerblue') 
-plt.title('Ingresos Totales por Mes\n(Serie Temporal)', fontsize=16) 
-plt.ylabel('Ingresos Totales (Importe)', fontsize=12) 
-plt.xlabel('Mes', fontsize=12) 
-plt.grid(True, linestyle='--', alpha=0.7) 
-plt.tight_layout() 
-plt.savefig('evolucion_ventas_mensuales.png') 
-plt.clf() 
-print("\n--- ¡Análisis completado! ---") 
-print(f"Se generaron 6 archivos .png en la carpeta: {os.getcwd()}")
\ No newline at end of file
+"""
+Generación del reporte de gráficos bivariados de la Tienda Aurelion.
+
+Cada gráfico se declara como un trabajo independiente y se renderiza con la
+API orientada a objetos de matplotlib en un pool de procesos (ver
+aurelion.chart_cache). Los gráficos cuyos datos y definición no cambiaron
+desde la última ejecución no se vuelven a dibujar.
+
+Con --segmentos se genera además el mismo reporte para cada valor de las
+columnas indicadas (por ejemplo, un reporte por ciudad y por categoría).
+
+Uso:
+    python estadisticotest.py [--segmentos ciudad categoria] [--workers N] [--salida DIR]
+"""
+import argparse
+import json
+import os
+import shutil
+
+from aurelion import aggregates, chart_cache, data_access, fact_table
+
+MANIFEST_NAME = ".reporte.json"
+
+FACT = fact_table.FACT_NAME
+CUBE = aggregates.CUBE_NAME
+
+# Gráficos del reporte: (archivo, función de aurelion.eda_charts, conjunto de
+# datos, parámetros, tamaño). Los totales por grupo se leen del cubo.
+REPORT_CHARTS = [
+    ('correlacion_numerica.png', 'correlation_heatmap', FACT,
+     {'columns': ['cantidad', 'precio_unitario', 'importe'],
+      'title': 'Mapa de Calor de Correlación\n(Numérico vs. Numérico)'}, (8, 6)),
+    ('ventas_por_categoria.png', 'total_by_bar', CUBE,
+     {'column': 'categoria', 'palette': 'viridis',
+      'title': 'Ingresos Totales por Categoría\n(Categórico vs. Numérico)', 'xlabel': 'Categoría'}, (10, 7)),
+    ('ventas_por_ciudad.png', 'total_by_bar', CUBE,
+     {'column': 'ciudad', 'palette': 'plasma',
+      'title': 'Ingresos Totales por Ciudad\n(Categórico vs. Numérico)', 'xlabel': 'Ciudad'}, (10, 7)),
+    ('distribucion_precios_categoria.png', 'category_price_boxplot', FACT, {}, (10, 7)),
+    ('categoria_vs_mediopago_heatmap.png', 'category_payment_heatmap', CUBE, {}, (10, 7)),
+    ('evolucion_ventas_mensuales.png', 'monthly_revenue_line', CUBE,
+     {'title': 'Ingresos Totales por Mes\n(Serie Temporal)'}, (12, 7)),
+]
+
+# Columnas por las que agrupa cada gráfico; en un reporte segmentado por esa
+# misma columna el gráfico tendría un solo valor y se omite.
+GROUPING_COLUMNS = {
+    'ventas_por_categoria.png': {'categoria'},
+    'ventas_por_ciudad.png': {'ciudad'},
+    'distribucion_precios_categoria.png': {'categoria'},
+    'categoria_vs_mediopago_heatmap.png': {'categoria', 'medio_pago'},
+}
+
+
+def report_jobs(output_dir, segments=()):
+    """
+    Declara los trabajos del reporte general y de cada segmento.
+
+    Args:
+        output_dir: Carpeta de salida del reporte general.
+        segments: Columnas de la tabla de hechos por las que segmentar. Cada
+            valor genera su reporte en `output_dir/<columna>/<valor>/`.
+
+    Returns:
+        Lista de (ruta de salida, petición para chart_cache.render_charts).
+    """
+    targets = [(output_dir, {})]
+    if segments:
+        df = data_access.load_fact_table(columns=list(segments))
+        for column in segments:
+            for value in sorted(df[column].dropna().unique()):
+                folder = str(value).replace(os.sep, "_")
+                targets.append((os.path.join(output_dir, column, folder), {column: value}))
+
+    jobs = []
+    for folder, filters in targets:
+        for file_name, chart, dataset, params, figsize in REPORT_CHARTS:
+            if GROUPING_COLUMNS.get(file_name, set()) & set(filters):
+                continue
+            jobs.append((
+                os.path.join(folder, file_name),
+                {"chart": chart, "dataset": dataset, "params": params,
+                 "figsize": figsize, "filters": filters},
+            ))
+    return jobs
+
+
+def generate_report(output_dir=".", segments=(), workers=None):
+    """
+    Genera el reporte y copia a `output_dir` solo los gráficos que cambiaron.
+
+    Returns:
+        Tupla (gráficos actualizados, gráficos sin cambios).
+    """
+    jobs = report_jobs(output_dir, segments)
+    images = chart_cache.render_charts([request for _, request in jobs], workers=workers)
+
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as file:
+            manifest = json.load(file)
+
+    updated = unchanged = 0
+    for (path, _), image in zip(jobs, images):
+        key = os.path.relpath(path, output_dir)
+        image_key = os.path.basename(image)
+        if manifest.get(key) == image_key and os.path.exists(path):
+            unchanged += 1
+            continue
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        shutil.copyfile(image, path)
+        manifest[key] = image_key
+        updated += 1
+
+    os.makedirs(output_dir, exist_ok=True)
+    with open(manifest_path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+    return updated, unchanged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera los gráficos del análisis bivariado.")
+    parser.add_argument('--segmentos', nargs='*', default=[], choices=aggregates.CUBE_DIMENSIONS[1:],
+                        help="Columnas por las que generar un reporte por valor (p. ej. ciudad categoria).")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Procesos del pool (0 = en el proceso actual).")
+    parser.add_argument('--salida', default='.', help="Carpeta de salida de los gráficos.")
+    args = parser.parse_args()
+
+    print("\n--- Iniciando generación de gráficos ---")
+    updated, unchanged = generate_report(args.salida, args.segmentos, args.workers)
+    print("\n--- ¡Análisis completado! ---")
+    print(f"Se generaron {updated} archivos .png ({unchanged} sin cambios) en la carpeta: "
+          f"{os.path.abspath(args.salida)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Pronóstico por segmentos: una serie mensual por categoría, por ciudad y por
+cada uno de los N productos más vendidos (además del total).
+
+Las features de todas las series se calculan en una sola pasada vectorizada
+(cached_features con `by`, que solo calcula los meses nuevos de cada serie si
+ya se calcularon en el proceso) y el entrenamiento y pronóstico de cada serie se
+reparte entre un pool de procesos. El resultado es una única tabla "tidy"
+con una fila por segmento, serie y mes pronosticado.
+
+Uso:
+    python forecast_segments.py --top-productos 20 --workers 4
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+
+from aurelion import data_access, model_registry
+from aurelion.segments import stream_segment_sales
+from train_model import FEATURES, MODEL_PARAMS, TARGET, cached_features, forecast_steps
+
+def _fit_forecast_chunk(jobs, features, horizon, model_params):
+    """
+    Obtiene del registro (o entrena) y pronostica un grupo de series (se ejecuta
+    en un proceso del pool).
+
+    Args:
+        jobs: Lista de tuplas (clave, X, y, historial, última_fecha) por serie.
+
+    Returns:
+        Lista de tuplas (clave, versión_del_modelo, fechas_futuras, predicciones).
+    """
+    results = []
+    for key, X, y, history, last_date in jobs:
+        # Se reutiliza el modelo registrado si la serie no cambió desde el último entrenamiento.
+        model, version, _ = model_registry.get_or_train(
+            RandomForestRegressor, model_params, pd.DataFrame(X, columns=features), pd.Series(y, name=TARGET)
+        )
+        future_dates, predictions = forecast_steps(model, history, last_date, features, horizon)
+        results.append((key, version, future_dates, predictions[0]))
+    return results
+
+
+def forecast_segments(segment_sales, end_date='2025-12-31', features=FEATURES, workers=None,
+                      model_params=None, chunk_size=None):
+    """
+    Pronostica todas las series de `segment_sales` en paralelo.
+
+    Args:
+        segment_sales: Salida de segments.stream_segment_sales.
+        end_date: Último mes a pronosticar.
+        features: Features del modelo (deben poder generarse con create_features).
+        workers: Procesos del pool (None usa todos los núcleos).
+        model_params: Hiperparámetros del RandomForestRegressor de cada serie (None usa MODEL_PARAMS).
+        chunk_size: Series por tarea enviada al pool (None reparte ~4 tareas por proceso).
+
+    Returns:
+        DataFrame tidy con 'segmento', 'serie', 'model_version' (clave del modelo en el
+        registro), 'date' y 'pred_sales'.
+    """
+    model_params = MODEL_PARAMS if model_params is None else model_params
+
+    # Features de todas las series en una sola pasada vectorizada.
+    df_features = cached_features(segment_sales, series="segmentos", by=['segmento', 'serie'])
+    df_model = df_features.dropna(subset=features)
+
+    last_date = segment_sales['date'].max()
+    horizon = (pd.Timestamp(end_date).to_period('M') - last_date.to_period('M')).n
+
+    # Una tarea por serie: matriz de entrenamiento, objetivo e historial para los lags.
+    history_by_series = {
+        key: group[TARGET].to_numpy()
+        for key, group in segment_sales.groupby(['segmento', 'serie'], sort=False)
+    }
+    jobs = [
+        (key, group[features].to_numpy(), group[TARGET].to_numpy(), history_by_series[key], last_date)
+        for key, group in df_model.groupby(['segmento', 'serie'], sort=False)
+    ]
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(jobs) // ((workers or os.cpu_count() or 1) * 4)))
+    chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_fit_forecast_chunk, chunk, features, horizon, model_params) for chunk in chunks]
+        for future in futures:
+            for (segment, serie), version, future_dates, predictions in future.result():
+                rows.append(pd.DataFrame({
+                    'segmento': segment, 'serie': serie, 'model_version': version,
+                    'date': future_dates, 'pred_sales': predictions,
+                }))
+    # Una sola limpieza del registro, con todos los procesos del pool ya terminados.
+    model_registry.prune()
+
+    return pd.concat(rows, ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pronóstico de ventas por categoría, ciudad y producto.")
+    parser.add_argument('--top-productos', type=int, default=20, help="Número de productos a pronosticar.")
+    parser.add_argument('--hasta', default='2025-12-31', help="Último mes a pronosticar.")
+    parser.add_argument('--workers', type=int, default=None, help="Procesos del pool (por defecto, todos los núcleos).")
+    parser.add_argument('--salida', default=data_access.PREDICTIONS_BY_SERIES_PATH, help="Archivo CSV de salida.")
+    args = parser.parse_args()
+
+    segment_sales = stream_segment_sales(top_n_products=args.top_productos)
+    n_series = segment_sales.groupby(['segmento', 'serie']).ngroups
+    print(f"Pronosticando {n_series} series con {args.workers or os.cpu_count()} procesos...")
+
+    df_future = forecast_segments(segment_sales, end_date=args.hasta, workers=args.workers)
+    df_future['pred_sales'] = np.round(df_future['pred_sales'], 2)
+    df_future.to_csv(args.salida, index=False)
+    print(f"Predicciones guardadas en '{args.salida}'")
+
+
+if __name__ == "__main__":
+    main()
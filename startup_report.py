@@ -0,0 +1,156 @@
+"""
+Reporte de arranque en frío de la aplicación Streamlit.
+
+Cada vista de la aplicación se ejecuta en un proceso nuevo (con el
+AppTest de Streamlit, sin servidor) y se mide:
+    * el tiempo de la primera ejecución (importaciones del script + vista),
+    * el de una segunda ejecución (cada interacción del usuario),
+    * los módulos pesados que la vista llegó a importar y la memoria máxima.
+
+Los resultados se guardan en JSON junto a los de benchmark.py. Con --comparar
+se marca como regresión una vista que tarde más que en la ejecución anterior
+(más allá de --umbral) o que importe un módulo pesado que antes no importaba.
+
+Uso:
+    python startup_report.py [--comparar benchmarks/arranque_<anterior>.json]
+"""
+import argparse
+import ast
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+APP_PATH = "./programa.py"
+NAVIGATION_PATH = "./aurelion/navigation.py"
+RESULTS_DIR = "./benchmarks"
+
+# Módulos cuya importación cuesta más de ~50 ms; el menú no debería cargar ninguno.
+HEAVY_MODULES = ["pandas", "numpy", "pyarrow", "matplotlib", "seaborn", "scipy",
+                 "sklearn", "joblib", "streamlit_mermaid"]
+
+
+def app_views(path=NAVIGATION_PATH):
+    """
+    Vistas de la aplicación: {nombre: archivo de la página} según PAGES de
+    aurelion.navigation (leído sin importarlo, pues importa Streamlit).
+    """
+    with open(path, encoding="utf-8") as file:
+        tree = ast.parse(file.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "PAGES" for t in node.targets):
+            pages = ast.literal_eval(node.value)
+            return {name: page_path for name, (page_path, _) in pages.items()}
+    raise LookupError(f"No se encontró PAGES en {path}")
+
+
+def measure_view(page_path):
+    """
+    Mide la página `page_path` en el proceso actual (que debe ser nuevo).
+
+    Returns:
+        Diccionario con los tiempos (s), los módulos pesados importados y la
+        memoria máxima (MB).
+    """
+    started = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    harness_seconds = time.perf_counter() - started
+
+    before = set(sys.modules)
+    app = AppTest.from_file(APP_PATH, default_timeout=300)
+    app.switch_page(page_path)
+    started = time.perf_counter()
+    app.run()
+    first_seconds = time.perf_counter() - started
+    loaded = {name.split(".")[0] for name in set(sys.modules) - before}
+
+    started = time.perf_counter()
+    app.run()
+    rerun_seconds = time.perf_counter() - started
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "harness_seconds": round(harness_seconds, 4),
+        "seconds": round(first_seconds, 4),
+        "rerun_seconds": round(rerun_seconds, 4),
+        "modules": sorted(loaded & set(HEAVY_MODULES)),
+        "peak_rss_mb": round(peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024, 1),
+        "errors": [str(e.value) for e in app.exception],
+    }
+
+
+def run_report(views=None, log=print):
+    """Mide cada vista en su propio proceso y devuelve la lista de resultados."""
+    results = []
+    for name, page_path in app_views().items():
+        if views and name not in views:
+            continue
+        process = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--medir", page_path],
+            capture_output=True, text=True,
+        )
+        if process.returncode != 0:
+            result = {"stage": f"arranque/{name}", "rows": None, "status": "error",
+                      "error": process.stderr.strip().splitlines()[-1:]}
+        else:
+            measured = json.loads(process.stdout.strip().splitlines()[-1])
+            status = "error" if measured["errors"] else "ok"
+            result = {"stage": f"arranque/{name}", "rows": None, "status": status, **measured}
+        results.append(result)
+        log(_format_result(result))
+    return results
+
+
+def _format_result(result):
+    if "seconds" not in result:
+        return f"{result['stage']:<24} error {result.get('error')}"
+    return (f"{result['stage']:<24} {result['seconds']:>8.3f} s  {result['rerun_seconds']:>8.3f} s  "
+            f"{result['peak_rss_mb']:>8.1f} MB  {', '.join(result['modules']) or '-'}"
+            f"{'  ERROR' if result['status'] != 'ok' else ''}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mide el arranque en frío de cada vista de la aplicación.")
+    parser.add_argument("--vistas", nargs="*", help="Vistas a medir (por defecto, todas).")
+    parser.add_argument("--salida", default=RESULTS_DIR, help="Carpeta de los resultados JSON.")
+    parser.add_argument("--comparar", help="JSON de un reporte anterior con el que comparar.")
+    parser.add_argument("--umbral", type=float, default=0.2,
+                        help="Aumento relativo del tiempo que se considera regresión (0.2 = 20%%).")
+    parser.add_argument("--medir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.medir is not None:
+        # Proceso hijo: mide una sola vista e imprime el resultado en JSON.
+        print(json.dumps(measure_view(args.medir)))
+        return
+
+    # benchmark importa pandas y sklearn: solo en el proceso principal.
+    import benchmark
+
+    print(f"{'vista':<24} {'1ª ejec.':>10}  {'siguiente':>10}  {'memoria':>11}  módulos pesados")
+    results = run_report(args.vistas)
+    meta = benchmark.environment()
+    path = benchmark.save_results(results, meta, args.salida, prefix="arranque_")
+    print(f"\nResultados guardados en {path}")
+
+    failed = any(result["status"] != "ok" for result in results)
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as file:
+            baseline = json.load(file)
+        print(f"\nComparación con {baseline['meta'].get('commit')} ({args.comparar}):")
+        modules_before = {r["stage"]: set(r.get("modules", [])) for r in baseline["results"]}
+        for stage, _, before, after, ratio, regression in benchmark.compare(results, baseline, args.umbral):
+            result = next(r for r in results if r["stage"] == stage)
+            new_modules = set(result["modules"]) - modules_before.get(stage, set())
+            failed |= regression or bool(new_modules)
+            print(f"{stage:<24} {before:>8.3f} s -> {after:>8.3f} s  x{ratio:5.2f}"
+                  f"{'  REGRESIÓN' if regression else ''}"
+                  f"{'  nuevos módulos: ' + ', '.join(sorted(new_modules)) if new_modules else ''}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
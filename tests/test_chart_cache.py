@@ -0,0 +1,23 @@
+from aurelion import aggregates, chart_cache
+
+
+def _key():
+    return chart_cache.chart_key("histogram", "fact_ventas", {"column": "importe"}, "huella")
+
+
+def test_chart_key_changes_with_helper_modules(monkeypatch):
+    key = _key()
+    assert _key() == key
+
+    fingerprint = chart_cache._file_fingerprint
+    monkeypatch.setattr(
+        chart_cache, "_file_fingerprint",
+        lambda path: "otra" if path == aggregates.__file__ else fingerprint(path),
+    )
+    assert _key() != key
+
+
+def test_chart_key_changes_with_chart_version(monkeypatch):
+    key = _key()
+    monkeypatch.setattr(chart_cache, "CHART_VERSION", chart_cache.CHART_VERSION + 1)
+    assert _key() != key
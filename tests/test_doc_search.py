@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from aurelion import doc_search
+
+
+@pytest.fixture
+def index():
+    index = doc_search.SearchIndex()
+    index.add("README.md", "Modelo", "Análisis del pronóstico de ventas\nPronosticar la demanda mensual")
+    index.add("README.md", "Datos", "Ventas por ciudad\nVentas por categoría\nVentas por medio de pago\nPagos con tarjeta")
+    index.add("instrucciones.md", "Uso", "ANALISIS de clientes")
+    return index
+
+
+def test_search_ignores_accents_and_case(index):
+    hits = index.search("analisis")
+
+    assert {hit.text for hit in hits} == {"Análisis del pronóstico de ventas", "ANALISIS de clientes"}
+    assert index.search("CATEGORÍA")[0].text == "Ventas por categoría"
+
+
+def test_search_matches_prefixes_below_whole_words(index):
+    assert {hit.text for hit in index.search("pronost")} == {
+        "Análisis del pronóstico de ventas", "Pronosticar la demanda mensual",
+    }
+
+    hits = index.search("pago")
+    # "pago" es palabra completa en una línea y prefijo de "pagos" en la otra.
+    assert [hit.text for hit in hits] == ["Ventas por medio de pago", "Pagos con tarjeta"]
+    assert hits[0].score == pytest.approx(2 * hits[1].score)
+
+
+def test_search_requires_every_term_and_ranks_rare_terms_higher(index):
+    assert [hit.text for hit in index.search("ventas ciudad")] == ["Ventas por ciudad"]
+    assert index.search("ventas clientes") == []
+    # "ciudad" aparece en una sola línea y "ventas", en cuatro.
+    ventas, ciudad = index.search("ventas")[0].score, index.search("ciudad")[0].score
+    assert ciudad > ventas
+
+
+def test_search_filters_by_source(index):
+    hits = index.search("analisis", sources=["instrucciones.md"])
+
+    assert [(hit.source, hit.section) for hit in hits] == [("instrucciones.md", "Uso")]
+
+
+def test_highlight_marks_prefix_matches_keeping_accents():
+    text = doc_search.highlight("Análisis del pronóstico", "pronost", template="[{}]")
+
+    assert text == "Análisis del [pronóstico]"
+
+
+def test_document_sections_are_shared_until_a_file_changes(tmp_path, monkeypatch):
+    readme = tmp_path / "README.md"
+    readme.write_text("# Título\nIntro\n## Uno\ntexto\n### Sub\n## Dos\nmás texto\n", encoding="utf-8")
+    (tmp_path / "instrucciones.md").write_text("# Instrucciones\n", encoding="utf-8")
+    monkeypatch.setattr(doc_search, "README_PATH", str(readme))
+    monkeypatch.setattr(doc_search, "INSTRUCTIONS_PATH", str(tmp_path / "instrucciones.md"))
+    monkeypatch.setattr(doc_search, "_index", None)
+
+    sections = doc_search.document_sections()
+
+    assert [section.title for section in sections] == ["Título", "Uno", "Dos"]
+    assert sections[1] == doc_search.Section("Uno", "## Uno\ntexto\n### Sub", ["Sub"])
+    assert doc_search.document_sections() is sections
+    assert doc_search.search("texto", sources=["README.md"])[0].section == "Uno"
+
+    readme.write_text("# Título\n## Tres\n", encoding="utf-8")
+    os.utime(readme, ns=(1, readme.stat().st_mtime_ns + 10 ** 9))
+    assert [section.title for section in doc_search.document_sections()] == ["Título", "Tres"]
@@ -0,0 +1,60 @@
+import os
+
+import pandas as pd
+import pytest
+
+from aurelion import exogenous
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    """Almacén en una carpeta temporal y dos copias del CSV: recortada y completa."""
+    monkeypatch.setattr(exogenous, "EXOGENOUS_DIR", str(tmp_path / "exogenous"))
+    source = pd.read_csv(exogenous.SOURCE_PATH)
+    short, full = str(tmp_path / "short.csv"), str(tmp_path / "full.csv")
+    source.iloc[:-5].to_csv(short, index=False)
+    source.to_csv(full, index=False)
+    return short, full
+
+
+def _store():
+    return pd.read_parquet(exogenous.store_path()).set_index("date")
+
+
+def _touch_after(path, reference):
+    """Deja `path` más nuevo que `reference`, como un CSV recién descargado."""
+    mtime = os.stat(reference).st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_new_months_extend_the_store_like_a_full_rebuild(sources):
+    short, full = sources
+    assert exogenous.update_store(path=short) == ("reconstruido", 99)
+
+    _touch_after(full, exogenous.store_path())
+    assert exogenous.update_store(path=full) == ("ampliado", 5)
+
+    expected = exogenous.compute_features(exogenous.load_aligned(full))
+    pd.testing.assert_frame_equal(_store(), expected, check_freq=False)
+
+
+def test_fresh_store_is_left_alone(sources):
+    short, _ = sources
+    exogenous.update_store(path=short)
+
+    assert exogenous.is_fresh(path=short)
+    assert exogenous.update_store(path=short) == ("vigente", 0)
+
+
+def test_revised_month_rebuilds_the_store(sources):
+    short, full = sources
+    exogenous.update_store(path=short)
+
+    revised = pd.read_csv(full)
+    revised.loc[10, "ventas_precios_constantes"] *= 1.05
+    revised.to_csv(full, index=False)
+    _touch_after(full, exogenous.store_path())
+
+    assert exogenous.update_store(path=full) == ("reconstruido", 104)
+    expected = exogenous.compute_features(exogenous.load_aligned(full))
+    pd.testing.assert_frame_equal(_store(), expected, check_freq=False)
@@ -0,0 +1,67 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from aurelion import aggregates, fact_table, snapshots
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    """Snapshots, tabla de hechos y agregados en una carpeta temporal."""
+    monkeypatch.setattr(snapshots, "SNAPSHOT_DIR", str(tmp_path))
+    monkeypatch.setattr(aggregates, "AGGREGATES_DIR", str(tmp_path / "aggregates"))
+    return tmp_path
+
+
+def _one_sale(id_producto, id_cliente, cantidad):
+    """Lote de una venta con un solo ítem, con los datos del catálogo y del cliente."""
+    producto = snapshots.read_table("productos_corregidos").set_index("id_producto").loc[id_producto]
+    cliente = snapshots.read_table("clientes").set_index("id_cliente").loc[id_cliente]
+    fact_table.ensure_fact_table()
+    id_venta = fact_table._read_manifest()["max_id_venta"] + 1
+    ventas = pd.DataFrame({
+        "id_venta": [id_venta], "fecha": [pd.Timestamp("2024-07-01")], "id_cliente": [id_cliente],
+        "nombre_cliente": [cliente["nombre_cliente"]], "email": [cliente["email"]], "medio_pago": ["efectivo"],
+    })
+    detalle = pd.DataFrame({
+        "id_venta": [id_venta], "id_producto": [id_producto], "nombre_producto": [producto["nombre_producto"]],
+        "cantidad": [cantidad], "precio_unitario": [producto["precio_unitario"]],
+        "importe": [cantidad * producto["precio_unitario"]],
+    })
+    return ventas, detalle
+
+
+@pytest.mark.parametrize("id_producto, id_cliente, cantidad", [(2, 1, 2), (1, 1, 1)])
+def test_append_single_row_batch(snapshot_dir, id_producto, id_cliente, cantidad):
+    ventas, detalle = _one_sale(id_producto, id_cliente, cantidad)
+    rows_before = fact_table._read_manifest()["rows"]
+
+    df_batch = fact_table.append_batch(ventas, detalle)
+
+    assert list(df_batch.columns) == list(snapshots.SCHEMAS["df_unified_clean"])
+    assert len(df_batch) == 1
+    assert df_batch.loc[0, "cantidad"] == cantidad
+    assert df_batch.loc[0, "id_producto"] == id_producto
+    assert fact_table._read_manifest()["rows"] == rows_before + 1
+    assert len(fact_table.read_fact_table()) == rows_before + 1
+
+
+def test_content_fingerprint_ignores_source_mtime(snapshot_dir, monkeypatch):
+    sources = {}
+    for name in fact_table.SOURCE_TABLES:
+        path = snapshot_dir / os.path.basename(snapshots.SOURCES[name])
+        shutil.copy2(snapshots.SOURCES[name], path)
+        sources[name] = str(path)
+    monkeypatch.setattr(snapshots, "SOURCES", {**snapshots.SOURCES, **sources})
+    fact_table.ensure_fact_table()
+    fingerprint = fact_table.content_fingerprint()
+
+    # Un mtime nuevo con el mismo contenido reescribe el manifiesto pero no cambia la huella.
+    os.utime(sources["clientes"])
+    assert fact_table.is_fresh()
+    assert fact_table.content_fingerprint() == fingerprint
+
+    fact_table.append_batch(*_one_sale(2, 1, 2))
+    assert fact_table.content_fingerprint() != fingerprint
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import train_model
+
+
+def _panel(n_series=4, n_months=30, seed=0):
+    rng = np.random.default_rng(seed)
+    months = pd.date_range("2020-01-31", periods=n_months, freq="ME")
+    return pd.DataFrame({
+        "serie": np.repeat([f"s{i}" for i in range(n_series)], n_months),
+        "date": np.tile(months, n_series),
+        "sales": rng.lognormal(10, 1, n_series * n_months),
+    })
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(train_model, "_feature_cache", {})
+
+
+def test_cached_features_computes_appended_months():
+    panel = _panel()
+    stored = train_model.cached_features(panel[panel["date"] < "2022-05-31"], series="test", by="serie")
+
+    extended, n_computed = train_model.extend_features(stored, panel, by="serie")
+
+    assert n_computed == 4 * 2
+    pd.testing.assert_frame_equal(extended, train_model.create_features(panel, by="serie"))
+    pd.testing.assert_frame_equal(train_model.cached_features(panel, series="test", by="serie"), extended)
+
+
+def test_extend_features_handles_revised_months_and_new_series():
+    panel = _panel()
+    stored = train_model.create_features(panel[panel["date"] < "2022-06-30"], by="serie")
+    revised = pd.concat([panel, _panel(n_series=1, n_months=5, seed=1).assign(serie="nueva")], ignore_index=True)
+    # Último mes guardado de s1 corregido por un lote posterior.
+    revised.loc[(revised["serie"] == "s1") & (revised["date"] == "2022-05-31"), "sales"] += 100.0
+    revised = revised.sort_values(["date", "serie"], kind="stable")
+
+    extended, n_computed = train_model.extend_features(stored, revised, by="serie")
+
+    assert n_computed == 4 + 5 + 1
+    pd.testing.assert_frame_equal(extended, train_model.create_features(revised, by="serie"))
+
+
+def test_extend_features_rejects_missing_rows():
+    panel = _panel()
+    stored = train_model.create_features(panel, by="serie")
+
+    assert train_model.extend_features(stored, panel[panel["serie"] != "s0"], by="serie") is None
+    assert train_model.extend_features(stored, panel.iloc[:-1], by="serie") is None
+
+
+def test_cached_features_single_series():
+    sales = _panel(n_series=1).drop(columns="serie")
+    train_model.cached_features(sales.iloc[:-3])
+
+    pd.testing.assert_frame_equal(train_model.cached_features(sales), train_model.create_features(sales))
+
+
+def test_forecast_steps_with_calendar_features_only():
+    from sklearn.linear_model import LinearRegression
+
+    sales = _panel(n_series=1).drop(columns="serie")
+    df_model = train_model.create_features(sales, lags=[], windows=[])
+    model = LinearRegression().fit(df_model[["month", "year"]], df_model["sales"])
+
+    dates, predictions = train_model.forecast_steps(
+        model, sales["sales"].to_numpy(), sales["date"].max(), ["month", "year"], horizon=3
+    )
+
+    assert list(dates) == list(pd.date_range("2022-07-31", periods=3, freq="ME"))
+    expected = model.predict(pd.DataFrame({"month": dates.month, "year": dates.year}))
+    np.testing.assert_allclose(predictions[0], expected)
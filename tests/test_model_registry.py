@@ -0,0 +1,45 @@
+import os
+
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from aurelion import model_registry
+
+
+def test_prune_keeps_most_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(model_registry, "MODELS_DIR", str(tmp_path))
+    X = pd.DataFrame({"x": [1.0, 2.0, 3.0]})
+    keys = []
+    for i in range(4):
+        _, key, trained = model_registry.get_or_train(LinearRegression, {}, X, X["x"] * i)
+        assert trained
+        keys.append(key)
+        # Fechas de modificación distintas y en orden de registro.
+        os.utime(model_registry._paths(key)[0], ns=(i * 10 ** 9, i * 10 ** 9))
+
+    # Cargar el más antiguo lo marca como usado recientemente.
+    model_registry.load(keys[0])
+    removed = model_registry.prune(max_models=2)
+
+    assert removed == keys[1:3]
+    assert [model_registry.exists(key) for key in keys] == [True, False, False, True]
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        os.path.basename(path) for key in (keys[0], keys[3]) for path in model_registry._paths(key)
+    )
+
+
+def test_get_or_train_retrains_a_model_pruned_by_another_process(tmp_path, monkeypatch):
+    monkeypatch.setattr(model_registry, "MODELS_DIR", str(tmp_path))
+    X = pd.DataFrame({"x": [1.0, 2.0, 3.0]})
+    _, key, _ = model_registry.get_or_train(LinearRegression, {}, X, X["x"])
+    # Otro proceso elimina el modelo justo después de exists().
+    monkeypatch.setattr(model_registry, "exists", lambda key: True)
+    for path in model_registry._paths(key):
+        os.remove(path)
+
+    model, same_key, trained = model_registry.get_or_train(LinearRegression, {}, X, X["x"])
+
+    assert same_key == key and trained
+    assert os.path.exists(model_registry._paths(key)[0])
+    assert model.predict(X) == pytest.approx(X["x"])
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from aurelion.sales_index import SalesIndex
+
+
+@pytest.fixture(scope="module")
+def sales():
+    """Ventas desordenadas, con varios ítems por id_venta y horas dentro del día."""
+    rng = np.random.default_rng(7)
+    n_rows = 500
+    return pd.DataFrame({
+        "id_venta": rng.integers(1, 120, n_rows),
+        "fecha_venta": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 90 * 24, n_rows), unit="h"),
+        "ciudad": rng.choice(["Cordoba", "Rosario", "Mendoza"], n_rows),
+        "medio_pago": pd.Categorical(rng.choice(["efectivo", "qr", "tarjeta"], n_rows)),
+        "importe": rng.uniform(10, 100, n_rows),
+    })
+
+
+@pytest.mark.parametrize("id_range", [(40, 40), (10, 55), (0, 500), (200, 300)])
+def test_id_range_matches_pandas(sales, id_range):
+    result = SalesIndex(sales).query(id_range=id_range)
+
+    expected = sales[sales["id_venta"].between(*id_range)]
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("date_range", [("2024-01-10", "2024-01-10"), ("2024-02-01", "2024-02-29"),
+                                        ("2023-01-01", "2025-01-01")])
+def test_date_range_includes_the_whole_last_day(sales, date_range):
+    result = SalesIndex(sales).query(date_range=date_range)
+
+    start, end = pd.Timestamp(date_range[0]), pd.Timestamp(date_range[1]) + pd.Timedelta(days=1)
+    expected = sales[(sales["fecha_venta"] >= start) & (sales["fecha_venta"] < end)]
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_ranges_combined_with_secondary_filters(sales):
+    result = SalesIndex(sales).query(
+        id_range=(20, 90), date_range=("2024-01-15", "2024-03-01"), ciudades=["Rosario", "Salta"],
+        medios_pago=["qr", "tarjeta"],
+    )
+
+    expected = sales[
+        sales["id_venta"].between(20, 90)
+        & (sales["fecha_venta"] >= "2024-01-15") & (sales["fecha_venta"] < "2024-03-02")
+        & sales["ciudad"].isin(["Rosario"]) & sales["medio_pago"].isin(["qr", "tarjeta"])
+    ]
+    assert len(expected)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_secondary_filter_only(sales):
+    result = SalesIndex(sales).query(medios_pago=["efectivo"])
+
+    pd.testing.assert_frame_equal(result, sales[sales["medio_pago"] == "efectivo"])
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from aurelion import streaming
+
+
+@pytest.fixture(scope="module")
+def transactions():
+    rng = np.random.default_rng(3)
+    n_rows = 2_000
+    return pd.DataFrame({
+        "fecha_venta": pd.Timestamp("2023-01-01") + pd.to_timedelta(rng.integers(0, 400, n_rows), unit="D"),
+        "importe": rng.uniform(1, 500, n_rows).round(2),
+        "categoria": rng.choice(["Alimentos", "Limpieza", "Bebidas"], n_rows),
+        "ciudad": rng.choice(["Cordoba", "Rosario"], n_rows),
+    })
+
+
+def _chunks(df, batch_rows):
+    # Categóricos con categorías distintas en cada bloque, como al leer Parquet por lotes.
+    for start in range(0, len(df), batch_rows):
+        chunk = df.iloc[start:start + batch_rows].copy()
+        if "categoria" in chunk:
+            chunk["categoria"] = chunk["categoria"].astype("category")
+        yield chunk
+
+
+@pytest.mark.parametrize("freq", ["ME", "D"])
+def test_fold_totals_match_a_full_groupby(transactions, freq):
+    groupings = {"total": [], "categoria": ["categoria"], "cruce": ["categoria", "ciudad"]}
+
+    totals = streaming.fold_totals(_chunks(transactions, 333), groupings, freq=freq)
+
+    dates = streaming.period_end(transactions["fecha_venta"], freq).rename("date")
+    for name, columns in groupings.items():
+        expected = transactions["importe"].groupby([transactions[col] for col in columns] + [dates]).sum()
+        result = totals[name].sort_index()
+        assert list(result.index.names) == columns + ["date"]
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+        assert result.index.to_list() == expected.index.to_list()
+
+
+@pytest.mark.parametrize("extension", ["csv", "parquet"])
+def test_iter_chunks_reads_only_the_requested_columns(tmp_path, transactions, extension):
+    path = str(tmp_path / f"ventas.{extension}")
+    if extension == "csv":
+        transactions.to_csv(path, index=False)
+    else:
+        transactions.to_parquet(path, index=False)
+
+    chunks = list(streaming.iter_chunks(path, ["fecha_venta", "importe"], batch_rows=500))
+
+    assert [len(chunk) for chunk in chunks] == [500] * 4
+    assert all(list(chunk.columns) == ["fecha_venta", "importe"] for chunk in chunks)
+    np.testing.assert_allclose(pd.concat(chunks)["importe"].to_numpy(), transactions["importe"].to_numpy())
+
+
+def test_monthly_sales_equals_resample(monkeypatch, transactions):
+    # Sin ventas en marzo de 2023: el mes debe figurar con 0.
+    gap = transactions[transactions["fecha_venta"].dt.to_period("M") != "2023-03"]
+    monkeypatch.setattr(streaming, "iter_table", lambda name, columns, batch_rows: _chunks(gap[columns], 250))
+
+    result = streaming.monthly_sales()
+
+    expected = gap.set_index("fecha_venta").resample("ME")["importe"].sum()
+    assert result.loc[result["date"] == "2023-03-31", "sales"].item() == 0
+    np.testing.assert_allclose(result["sales"].to_numpy(), expected.to_numpy())
+    assert list(result["date"]) == list(expected.index)
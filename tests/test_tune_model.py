@@ -0,0 +1,71 @@
+import pandas as pd
+
+import tune_model
+from tune_model import TrialLog, config_key, rung_origins, sample_configs, successive_halving
+
+ORIGINS = list(pd.date_range("2020-01-31", periods=9, freq="ME"))
+HORIZONS = (1, 3)
+
+
+def test_sample_configs_is_reproducible_and_distinct():
+    configs = sample_configs(10, seed=3)
+
+    assert configs == sample_configs(10, seed=3)
+    assert len({config_key(config) for config in configs}) == 10
+    assert configs != sample_configs(10, seed=4)
+
+
+def test_rung_origins_are_nested_and_end_with_all():
+    dates = [f"{origin:%Y-%m-%d}" for origin in ORIGINS]
+
+    rungs = rung_origins(dates, n_rungs=3, eta=3)
+
+    assert [len(rung) for rung in rungs] == [1, 3, 9]
+    assert rungs[-1] == dates
+    # Cada ronda incluye los orígenes de la anterior, empezando por el más reciente.
+    assert rungs[0] == [dates[-1]]
+    assert all(set(rungs[i]) <= set(rungs[i + 1]) for i in range(len(rungs) - 1))
+
+
+def _record(log, key, config, origins, error):
+    for origin in origins:
+        log.append(key, config, origin, max(HORIZONS), {h: error + h for h in HORIZONS})
+
+
+def test_halving_resumes_from_stored_evaluations(tmp_path, monkeypatch):
+    # Sin evaluaciones pendientes no debe entrenarse ningún modelo.
+    monkeypatch.setattr(tune_model, "_evaluate_chunk", None)
+    candidates = sample_configs(9, seed=0)
+    keys = [config_key(config) for config in candidates]
+    rungs = rung_origins([f"{origin:%Y-%m-%d}" for origin in ORIGINS], 3, 3)
+    path = str(tmp_path / "tuning" / "search.jsonl")
+
+    # Lo que habría guardado una búsqueda completa: todas en la primera ronda,
+    # las 3 mejores en la segunda y la mejor en la última.
+    log = TrialLog(path)
+    for i, (key, config) in enumerate(zip(keys, candidates)):
+        rung = 2 if i == 0 else 1 if i < 3 else 0
+        _record(log, key, config, rungs[rung], error=float(i))
+
+    messages = []
+    ranking = successive_halving(None, candidates, TrialLog(path), ORIGINS, HORIZONS, eta=3,
+                                 workers=1, report=messages.append)
+
+    assert all("(0 evaluaciones nuevas)" in message for message in messages)
+    assert len(messages) == 3
+    assert ranking["config"].tolist() == keys
+    assert ranking["round"].tolist() == [3, 2, 2, 1, 1, 1, 1, 1, 1]
+    assert ranking["origins"].tolist() == [9, 3, 3, 1, 1, 1, 1, 1, 1]
+    assert ranking["mae"].tolist() == [i + 2.0 for i in range(9)]
+
+
+def test_trial_log_needs_the_longest_horizon(tmp_path):
+    path = str(tmp_path / "search.jsonl")
+    config = sample_configs(1)[0]
+    TrialLog(path).append("a", config, "2020-01-31", 3, {1: 1.0, 3: 5.0})
+
+    log = TrialLog(path)
+    assert log.errors("a", "2020-01-31", (1, 3)) == {1: 1.0, 3: 5.0}
+    assert log.errors("a", "2020-01-31", (1, 6)) is None
+    assert log.score("a", ["2020-01-31"], (1, 3)) == 3.0
+    assert log.configs == {"a": config}
@@ -1,56 +1,179 @@
+import argparse
+import io
+import sys
+import time
+import warnings
+from collections import namedtuple
+
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 import joblib
 import matplotlib.pyplot as plt
 
-def forecast_recursive(model, df_historical, features):
+from aurelion import data_access, exogenous, model_registry
+from aurelion.baselines import HoltWinters, LagRidge, SeasonalNaive
+
+class LagRingBuffer:
+    """
+    Buffer circular de tamaño fijo con las últimas ventas de una o varias series.
+
+    Guarda solo los valores necesarios para los lags y la media móvil, de modo
+    que cada paso del pronóstico recursivo cuesta O(1) sin importar la longitud
+    del histórico.
+    """
+
+    def __init__(self, history, size):
+        """
+        Args:
+            history: Array 1D (una serie) o 2D (series x tiempo) con el histórico.
+            size: Número de valores a conservar (el mayor lag o ventana usado).
+        """
+        history = np.atleast_2d(np.asarray(history, dtype=float))
+        if history.shape[1] < size:
+            raise ValueError(f"Se necesitan al menos {size} valores de histórico, hay {history.shape[1]}.")
+        self.size = size
+        self._values = history[:, -size:].copy()
+        # Posición donde se escribirá el siguiente valor (la más antigua).
+        self._pos = 0
+
+    @property
+    def n_series(self):
+        """Número de series guardadas en el buffer."""
+        return self._values.shape[0]
+
+    def lags(self, lags):
+        """Matriz (series x len(lags)) con los valores de hace `lag` pasos."""
+        idx = (self._pos - np.asarray(lags)) % self.size
+        return self._values[:, idx]
+
+    def push(self, values):
+        """Añade el valor más reciente de cada serie, descartando el más antiguo."""
+        self._values[:, self._pos] = values
+        self._pos = (self._pos + 1) % self.size
+
+
+def _feature_plan(features):
+    """
+    Traduce los nombres de features a los lags que hay que leer del buffer.
+    Las features exógenas (ver aurelion.exogenous) no se leen del buffer.
+
+    Returns:
+        Tupla (lags, rolling_windows, size) donde `lags` son los lags a leer en orden
+        y `size` el tamaño mínimo del buffer.
+    """
+    lags, windows = [], []
+    for name in features:
+        if name.startswith("lag_"):
+            lags.append(int(name[len("lag_"):]))
+        elif name.startswith("rolling_mean_"):
+            windows.append(int(name[len("rolling_mean_"):]))
+        elif name not in ("month", "year") and not name.startswith(exogenous.PREFIX):
+            raise ValueError(f"Feature no soportada para el pronóstico recursivo: {name}")
+    # Sin lags ni medias móviles (solo calendario) basta con el último valor.
+    size = max(lags + windows, default=1)
+    return lags, windows, size
+
+
+def _predict_array(model, X):
+    """Predice sobre un array NumPy aunque el modelo se haya entrenado con un DataFrame."""
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="X does not have valid feature names")
+        return model.predict(X)
+
+
+def forecast_steps(model, history, last_date, features, horizon, exogenous_values=None):
+    """
+    Motor de pronóstico recursivo sobre una o varias series mensuales.
+
+    Cada paso arma el vector de features en NumPy a partir de un LagRingBuffer,
+    predice y empuja la predicción al buffer para el paso siguiente. No se crea
+    ningún DataFrame dentro del bucle.
+
+    Args:
+        model: Modelo con método predict entrenado sobre `features`.
+        history: Array 1D (una serie) o 2D (series x meses) con las ventas históricas.
+        last_date: Última fecha (fin de mes) del histórico.
+        features: Lista ordenada de nombres de features del modelo.
+        horizon: Número de meses a pronosticar.
+        exogenous_values: Array (horizon x features exógenas) con los valores de las
+            features exógenas de `features`, en su orden (ver exogenous.future_values).
+
+    Returns:
+        Tupla (fechas_futuras, predicciones) con predicciones de forma (series x horizon).
+    """
+    lags, windows, size = _feature_plan(features)
+    buffer = LagRingBuffer(history, size)
+    n_series = buffer.n_series
+
+    future_dates = pd.date_range(start=pd.Timestamp(last_date) + pd.DateOffset(months=1), periods=horizon, freq='ME')
+    months = future_dates.month.to_numpy(dtype=float)
+    years = future_dates.year.to_numpy(dtype=float)
+
+    # Columnas de la matriz de features que ocupa cada tipo de feature.
+    lag_cols = [i for i, name in enumerate(features) if name.startswith("lag_")]
+    window_cols = [i for i, name in enumerate(features) if name.startswith("rolling_mean_")]
+    month_cols = [i for i, name in enumerate(features) if name == "month"]
+    year_cols = [i for i, name in enumerate(features) if name == "year"]
+    exo_cols = [i for i, name in enumerate(features) if name.startswith(exogenous.PREFIX)]
+    if exo_cols and exogenous_values is None:
+        raise ValueError("El modelo usa features exógenas: hay que indicar `exogenous_values`.")
+    window_lags = [np.arange(1, window + 1) for window in windows]
+
+    X = np.empty((n_series, len(features)))
+    predictions = np.empty((n_series, horizon))
+    for step in range(horizon):
+        X[:, month_cols] = months[step]
+        X[:, year_cols] = years[step]
+        if exo_cols:
+            X[:, exo_cols] = exogenous_values[step]
+        if lag_cols:
+            X[:, lag_cols] = buffer.lags(lags)
+        for col, window_lag in zip(window_cols, window_lags):
+            X[:, col] = buffer.lags(window_lag).mean(axis=1)
+
+        predictions[:, step] = _predict_array(model, X)
+        buffer.push(predictions[:, step])
+
+    return future_dates, predictions
+
+
+def forecast_recursive(model, df_historical, features, end_date='2025-12-31'):
     """
-    Realiza una predicción recursiva (multi-step forecast) para 18 meses.
+    Realiza una predicción recursiva (multi-step forecast) hasta `end_date`.
+
+    No entrena ningún modelo: usa `model` tal cual (normalmente el modelo final
+    obtenido del registro de modelos), por lo que el pronóstico es reproducible
+    a partir del artefacto guardado. Si `features` incluye features exógenas,
+    sus valores futuros se leen del almacén de aurelion.exogenous.
 
     Args:
-        model: Modelo de regresión entrenado (RandomForestRegressor).
+        model: Modelo de regresión entrenado (RandomForestRegressor) con todos los datos.
         df_historical: DataFrame con datos históricos y features calculados (hasta Jun 2024).
         features: Lista de nombres de columnas a usar como features.
+        end_date: Último mes a pronosticar (por defecto, Diciembre 2025).
 
     Returns:
         DataFrame con las predicciones futuras.
     """
-    # 7. Retomar el entrenamiento con TODOS los datos (modelo_full)
-    X_all = df_historical[features]
-    y_all = df_historical['sales']
-    model_full = RandomForestRegressor(n_estimators=100, random_state=42)
-    model_full.fit(X_all, y_all)
-    
     # Iniciar desde el mes siguiente al último dato
     last_date = df_historical['date'].max()
-    # Generar fechas futuras: Julio 2024 hasta Diciembre 2025
-    future_dates = pd.date_range(start=last_date + pd.DateOffset(months=1), end='2025-12-31', freq='M')
-    
-    # Copia del historial base (solo 'date' y 'sales') para actualizar en el loop
-    history_df = df_historical[['date', 'sales']].copy() 
-    future_predictions = []
-
-    for date in future_dates:
-        # Añadir fila vacía temporal al historial para calcular los lags del nuevo mes
-        new_row = pd.DataFrame([{'date': date, 'sales': np.nan}])
-        temp_df = pd.concat([history_df, new_row], ignore_index=True)
-        
-        # Recalcular features (esto llena los lags de la última fila con valores del historial)
-        temp_df_feat = create_features(temp_df) 
-        current_X = temp_df_feat.iloc[[-1]][features]
-        
-        # Predecir
-        pred_sales = model_full.predict(current_X)[0]
-        
-        # Guardar predicción
-        future_predictions.append({'date': date, 'pred_sales': pred_sales})
-        
-        # Actualizar el historial con la predicción para el siguiente paso recursivo
-        history_df = pd.concat([history_df, pd.DataFrame([{'date': date, 'sales': pred_sales}])], ignore_index=True)
-
-    return pd.DataFrame(future_predictions)
+    # Número de meses futuros: Julio 2024 hasta Diciembre 2025
+    end_period = pd.Timestamp(end_date).to_period('M')
+    horizon = (end_period - last_date.to_period('M')).n
+
+    exo_names = [name for name in features if name.startswith(exogenous.PREFIX)]
+    exo_values = None
+    if exo_names:
+        future_dates = pd.date_range(start=last_date + pd.offsets.MonthEnd(1), periods=horizon, freq='ME')
+        exo_values = exogenous.future_values(exogenous.load_features(exo_names), future_dates)
+
+    # Pronóstico recursivo sobre el buffer de lags (sin DataFrames en el bucle)
+    future_dates, predictions = forecast_steps(
+        model, df_historical['sales'].to_numpy(), last_date, features, horizon, exo_values
+    )
+    return pd.DataFrame({'date': future_dates, 'pred_sales': predictions[0]})
 
 def plot_forecast(df_historical_sales, df_future_forecast):
     """
@@ -83,57 +206,390 @@ def plot_forecast(df_historical_sales, df_future_forecast):
     plt.tight_layout()
     plt.show()
 
-# 1. Cargar y Preparar Datos
-df = pd.read_csv('./data/df_expanded.csv')
-df['fecha_venta'] = pd.to_datetime(df['fecha_venta'])
-monthly_sales = df.set_index('fecha_venta').resample('ME')['importe'].sum().reset_index()
-monthly_sales.columns = ['date', 'sales']
+
+# 1. Carga y Preparación de Datos
+def load_monthly_sales():
+    """Ventas mensuales totales ('date', 'sales') del histórico expandido."""
+    # Agregación por bloques, solo con las columnas fecha_venta e importe
+    return data_access.load_monthly_sales().copy()
+
 
 # 2. Función de Ingeniería de Features
-def create_features(data, lags=[1, 2, 3, 6, 12]):
+def create_features(data, lags=[1, 2, 3, 6, 12], by=None, windows=[3]):
+    """
+    Calcula las features de calendario, lags y medias móviles sobre 'sales'.
+
+    Args:
+        data: DataFrame con 'date' y 'sales', ordenado por fecha.
+        lags: Lags a calcular.
+        by: Columna que identifica la serie cuando `data` contiene varias series
+            (en formato largo y ordenadas por fecha dentro de cada serie). Los lags
+            se calculan por serie en una sola pasada vectorizada.
+        windows: Ventanas de las medias móviles (de los meses anteriores, sin el actual).
+            Se calculan como la suma de los lags 1..w en orden dividida por w, igual
+            que en forecast_steps, por lo que el valor de cada fila depende solo de
+            sus w meses anteriores.
+    """
     df_feat = data.copy()
     df_feat['month'] = df_feat['date'].dt.month
     df_feat['year'] = df_feat['date'].dt.year
+    if by is None:
+        sales = df_feat['sales']
+    else:
+        # Un identificador entero por serie para agrupar shifts y ventanas.
+        series_id = df_feat.groupby(by, sort=False).ngroup()
+        sales = df_feat['sales'].groupby(series_id, sort=False)
+    shifted = {lag: sales.shift(lag) for lag in sorted(set(lags).union(range(1, max(windows, default=0) + 1)))}
     for lag in lags:
-        df_feat[f'lag_{lag}'] = df_feat['sales'].shift(lag)
-    df_feat['rolling_mean_3'] = df_feat['sales'].shift(1).rolling(window=3).mean()
+        df_feat[f'lag_{lag}'] = shifted[lag]
+    for window in windows:
+        df_feat[f'rolling_mean_{window}'] = sum(shifted[lag] for lag in range(1, window + 1)) / window
     return df_feat
 
-df_features = create_features(monthly_sales)
-df_model = df_features.dropna().reset_index(drop=True)
 
-# 3. División Entrenamiento / Validación
-train = df_model[df_model['date'] < '2024-01-01']
-val = df_model[df_model['date'] >= '2024-01-01']
+# Features ya calculadas: (nombre, lags, ventanas, by) -> (datos, features, disposición) (ver cached_features).
+_feature_cache = {}
+
+
+def _by_columns(by):
+    return [] if by is None else [by] if isinstance(by, str) else list(by)
+
+
+def _same_values(old, new):
+    """Máscara de las posiciones donde los arrays `old` y `new` coinciden (NaN == NaN)."""
+    return (old == new) | (pd.isna(old) & pd.isna(new))
+
+
+def _series_layout(df, by):
+    """
+    Ubicación de las filas de `df` por serie.
+
+    Returns:
+        Tupla (codigos, posiciones, claves, orden, inicios): código de serie (en
+        orden de aparición) y posición dentro de su serie de cada fila; claves de
+        cada serie en el orden de sus códigos; índices de las filas agrupadas por
+        serie (estable) y posición en `orden` donde empieza cada serie.
+    """
+    n_rows = len(df)
+    by_columns = _by_columns(by)
+    codes = np.zeros(n_rows, dtype=np.int64)
+    for column in by_columns:
+        column_codes, uniques = pd.factorize(df[column], use_na_sentinel=False)
+        codes = codes * len(uniques) + column_codes
+    if len(by_columns) > 1:
+        codes = pd.factorize(codes)[0]
+    counts = np.bincount(codes, minlength=0 if by_columns else 1)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    # Con las series contiguas (el caso habitual) no hace falta ordenar.
+    order = np.arange(n_rows) if np.all(codes[1:] >= codes[:-1]) else np.argsort(codes, kind="stable")
+    positions = np.empty(n_rows, dtype=np.int64)
+    positions[order] = np.arange(n_rows) - np.repeat(starts, counts)
+    if by_columns:
+        keys = pd.MultiIndex.from_frame(df[by_columns].iloc[order[starts]])
+    else:
+        keys = pd.MultiIndex.from_tuples([()])
+    return codes, positions, keys, order, starts
+
+
+def extend_features(stored, data, lags=[1, 2, 3, 6, 12], by=None, windows=[3], layout=None, data_layout=None):
+    """
+    Salida de create_features(data) calculando solo los meses que `data` agrega
+    al final de cada serie de `stored`.
+
+    Las filas ya guardadas se toman de `stored`; las nuevas se calculan en NumPy
+    leyendo sus lags de `data`. Cada fila depende solo de sus últimos
+    max(lags, windows) meses, así que solo se comparan esos meses guardados de
+    cada serie (el histórico anterior se supone sin cambios): si alguno cambió
+    (p. ej. el último mes, que sigue recibiendo lotes), se recalculan también
+    las filas a partir de él.
+
+    Args:
+        stored: Salida previa de create_features con los mismos `lags`, `by` y `windows`.
+        data: DataFrame de entrada de create_features.
+        layout: _series_layout(stored, by), si ya se calculó.
+        data_layout: _series_layout(data, by), si ya se calculó.
+
+    Returns:
+        Tupla (features, filas_calculadas) con las filas en el orden de `data`, o
+        None si `data` no extiende `stored` (falta alguna serie o alguna fila).
+    """
+    columns = list(data.columns)
+    if list(stored.columns[:len(columns)]) != columns:
+        return None
+    stored_codes, _, stored_keys, stored_order, stored_starts = layout or _series_layout(stored, by)
+    codes, positions, keys, order, starts = data_layout or _series_layout(data, by)
+    # Serie guardada de cada serie de `data` (-1 si es nueva); todas las guardadas deben seguir.
+    matching = stored_keys.get_indexer(keys)
+    if np.count_nonzero(matching >= 0) != len(stored_keys):
+        return None
+    stored_counts = np.bincount(stored_codes, minlength=len(stored_keys))
+    series_old = np.where(matching >= 0, stored_counts[matching], 0)
+    if np.any(np.diff(np.append(starts, len(data))) < series_old):
+        return None
+
+    n_old = series_old[codes]
+    old = positions < n_old
+    # Fila de `stored` con la misma serie y posición que cada fila ya calculada de `data`.
+    indexer = np.zeros(len(data), dtype=np.int64)
+    indexer[old] = stored_order[stored_starts[matching[codes[old]]] + positions[old]]
+
+    # Últimos meses guardados de cada serie: desde el primero que cambió se recalcula.
+    depth = max([*lags, *windows], default=0)
+    context = np.flatnonzero(old & (positions >= n_old - depth))
+    changed = np.zeros(len(context), dtype=bool)
+    for column in ("date", TARGET):
+        changed |= ~_same_values(stored[column].to_numpy()[indexer[context]], data[column].to_numpy()[context])
+    first_changed = n_old.max(initial=0) + np.zeros(len(keys), dtype=np.int64)
+    np.minimum.at(first_changed, codes[context[changed]], positions[context[changed]])
+    rows = np.flatnonzero(~old | (positions >= first_changed[codes]))
+
+    if not len(rows):
+        if len(data) == len(stored) and stored.index.equals(data.index) and np.all(indexer == np.arange(len(data))):
+            return stored, 0
+        return stored.iloc[indexer].set_axis(data.index), 0
+
+    # Lags de las filas a calcular: la fila de la misma serie `lag` meses antes.
+    sales = data[TARGET].to_numpy(dtype=float)
+    row_codes, row_positions = codes[rows], positions[rows]
+    shifted = {}
+    for lag in sorted(set(lags).union(range(1, max(windows, default=0) + 1))):
+        source = row_positions - lag
+        valid = source >= 0
+        values = np.full(len(rows), np.nan)
+        values[valid] = sales[order[starts[row_codes[valid]] + source[valid]]]
+        shifted[lag] = values
+    dates = pd.DatetimeIndex(data["date"].to_numpy()[rows])
+    computed = {"month": dates.month, "year": dates.year}
+    computed.update({f"lag_{lag}": shifted[lag] for lag in lags})
+    computed.update({f"rolling_mean_{window}": sum(shifted[lag] for lag in range(1, window + 1)) / window
+                     for window in windows})
+
+    # Las columnas de entrada salen de `data` y las features, de `stored` o de las filas calculadas.
+    result = {column: data[column] for column in columns}
+    for column in stored.columns[len(columns):]:
+        values = stored[column].to_numpy().take(indexer)
+        values[rows] = computed[column]
+        result[column] = values
+    return pd.DataFrame(result, index=data.index), len(rows)
+
+
+def cached_features(data, series="total", lags=[1, 2, 3, 6, 12], by=None, windows=[3]):
+    """
+    Salida de create_features(data, lags, by, windows) guardada en memoria.
+
+    Las features se guardan por `series` y configuración de lags y ventanas
+    durante la vida del proceso. Si `data` agrega meses al final de cada serie
+    respecto de la llamada anterior, solo se calculan esos meses (ver
+    extend_features); si no, se recalcula todo.
+
+    Args:
+        series: Nombre de los datos (p. ej. "total" o "segmentos"); distingue
+            entradas con la misma configuración.
+
+    Returns:
+        DataFrame compartido. No debe modificarse en sitio.
+    """
+    key = (series, tuple(lags), tuple(windows), tuple(_by_columns(by)))
+    entry = _feature_cache.get(key)
+    if entry is not None and entry[0] is data:
+        return entry[1]
+
+    layout = _series_layout(data, by)
+    extended = None if entry is None else extend_features(entry[1], data, lags, by, windows, entry[2], layout)
+    features = create_features(data, lags, by, windows) if extended is None else extended[0]
+    _feature_cache[key] = (data, features, layout)
+    return features
+
+
+def feature_names(lags=[1, 2, 3, 6, 12], windows=[3]):
+    """Features del modelo que create_features genera con estos `lags` y `windows`."""
+    return ['month', 'year'] + [f'lag_{lag}' for lag in lags] + [f'rolling_mean_{window}' for window in windows]
+
+
+FEATURES = feature_names()
+TARGET = 'sales'
+MODEL_PARAMS = {'n_estimators': 100, 'random_state': 42}
+
+# Backends del modelo: clase con la interfaz fit/predict de scikit-learn e
+# hiperparámetros por defecto en función de la lista de features. Todos se
+# entrenan sobre la salida de create_features y pronostican con forecast_steps.
+Backend = namedtuple("Backend", ["model_class", "params"])
+BACKENDS = {
+    "random_forest": Backend(RandomForestRegressor, lambda features: MODEL_PARAMS),
+    "hist_gradient_boosting": Backend(
+        HistGradientBoostingRegressor,
+        lambda features: {'max_iter': 200, 'learning_rate': 0.05, 'min_samples_leaf': 5, 'random_state': 42},
+    ),
+    "ridge": Backend(LagRidge, lambda features: {'alpha': 1.0}),
+    "seasonal_naive": Backend(SeasonalNaive, lambda features: {'features': list(features)}),
+    "holt_winters": Backend(HoltWinters, lambda features: {'features': list(features)}),
+}
+DEFAULT_BACKEND = "random_forest"
+
+
+def make_model(backend=DEFAULT_BACKEND, features=FEATURES, params=None):
+    """Modelo sin entrenar del backend `backend` (ver BACKENDS)."""
+    spec = BACKENDS[backend]
+    return spec.model_class(**(spec.params(features) if params is None else params))
+
+
+def get_final_model(df_model, features=FEATURES, params=None, train=True, backend=DEFAULT_BACKEND):
+    """
+    Modelo final entrenado con TODOS los datos, obtenido del registro de modelos.
+
+    Args:
+        df_model: DataFrame con features y objetivo, sin nulos.
+        features: Features del modelo.
+        params: Hiperparámetros del modelo (None usa los del backend).
+        train: Si es False y el modelo no está registrado, se lanza un error en lugar de entrenar.
+        backend: Nombre del backend en BACKENDS.
+
+    Returns:
+        Tupla (modelo, clave_del_registro, entrenado).
+    """
+    spec = BACKENDS[backend]
+    params = spec.params(features) if params is None else params
+    X, y = df_model[features], df_model[TARGET]
+    if not train:
+        fingerprint = model_registry.data_fingerprint(X, y)
+        key = model_registry.model_key(spec.model_class, params, features, fingerprint)
+        if not model_registry.exists(key):
+            raise LookupError(f"No hay un modelo registrado para estos datos y parámetros (clave {key}).")
+        return model_registry.load(key), key, False
+    return model_registry.get_or_train(spec.model_class, params, X, y)
+
+
+def compare_backends(monthly_sales, df_model, backends=None, features=FEATURES, horizon=18, backtest_step=3):
+    """
+    Compara los backends en costo y precisión.
+
+    Para cada backend mide el tiempo de entrenamiento con todos los datos, la
+    latencia por paso del pronóstico recursivo (mejor de 3 repeticiones de
+    `horizon` pasos), el tamaño del modelo serializado con joblib, el error de
+    la validación Ene-Jun 2024 y el MAE del backtesting de origen móvil (un
+    origen cada `backtest_step` meses).
+
+    Returns:
+        DataFrame con una fila por backend.
+    """
+    from backtest import backtest, default_origins
+
+    rows = []
+    train = df_model[df_model['date'] < '2024-01-01']
+    val = df_model[df_model['date'] >= '2024-01-01']
+    # Los mismos orígenes para todos los backends, contando desde el más reciente.
+    origins = default_origins(df_model)[::-1][::backtest_step][::-1]
+    exo_names = [name for name in features if name.startswith(exogenous.PREFIX)]
+    exo_values = None
+    if exo_names:
+        future_dates = pd.date_range(start=df_model['date'].max() + pd.offsets.MonthEnd(1), periods=horizon, freq='ME')
+        exo_values = exogenous.future_values(exogenous.load_features(exo_names), future_dates)
+    for name in backends or BACKENDS:
+        model = make_model(name, features)
+        started = time.perf_counter()
+        model.fit(df_model[features], df_model[TARGET])
+        fit_seconds = time.perf_counter() - started
+
+        history = df_model[TARGET].to_numpy()
+        step_seconds = []
+        for _ in range(3):
+            started = time.perf_counter()
+            forecast_steps(model, history, df_model['date'].max(), features, horizon, exo_values)
+            step_seconds.append((time.perf_counter() - started) / horizon)
+
+        buffer = io.BytesIO()
+        joblib.dump(model, buffer)
+
+        val_preds = make_model(name, features).fit(train[features], train[TARGET]).predict(val[features])
+        errors = backtest(monthly_sales, origins, features=features, df_features=df_model,
+                          model_class=BACKENDS[name].model_class, model_params=BACKENDS[name].params(features))
+        rows.append({
+            'backend': name,
+            'fit_s': fit_seconds,
+            'predict_ms_por_paso': min(step_seconds) * 1000,
+            'tamaño_kb': buffer.getbuffer().nbytes / 1024,
+            'val_mae': mean_absolute_error(val[TARGET], val_preds),
+            'val_rmse': np.sqrt(mean_squared_error(val[TARGET], val_preds)),
+            'backtest_mae': errors['abs_error'].mean(),
+            'backtest_mape': errors['pct_error'].mean(),
+        })
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Entrena el modelo de ventas y genera el pronóstico.")
+    parser.add_argument('--solo-pronostico', action='store_true',
+                        help="Pronosticar con el modelo registrado, sin entrenar ni validar.")
+    parser.add_argument('--modelo', choices=list(BACKENDS), default=DEFAULT_BACKEND,
+                        help="Backend del modelo (por defecto, %(default)s).")
+    parser.add_argument('--comparar-modelos', nargs='*', choices=list(BACKENDS), metavar='MODELO',
+                        help="Compara el costo y la precisión de los backends indicados (o de todos) y termina.")
+    parser.add_argument('--exogenas', action='store_true',
+                        help="Agregar las features exógenas del índice de supermercados (ver aurelion.exogenous).")
+    args = parser.parse_args()
+
+    monthly_sales = load_monthly_sales()
+    df_features = cached_features(monthly_sales)
+    features = FEATURES
+    if args.exogenas:
+        features = FEATURES + exogenous.feature_names()
+        df_features = exogenous.join_features(df_features, exogenous.feature_names())
+    df_model = df_features.dropna().reset_index(drop=True)
+
+    if args.comparar_modelos is not None:
+        comparison = compare_backends(monthly_sales, df_model, args.comparar_modelos or None, features)
+        print(comparison.to_string(index=False, float_format=lambda value: f"{value:,.2f}"))
+        return
+
+    if args.solo_pronostico:
+        try:
+            model_full, key, _ = get_final_model(df_model, features, train=False, backend=args.modelo)
+        except LookupError as e:
+            print(f"Error: {e} Ejecuta primero 'python train_model.py'.")
+            sys.exit(1)
+        print(f"Modelo cargado del registro (clave {key}).")
+        df_future = forecast_recursive(model_full, df_model, features)
+        df_future.to_csv('./data/sales_predictions_2024_2025_final.csv', index=False)
+        print("Predicciones guardadas en './data/sales_predictions_2024_2025_final.csv'")
+        return
+
+    # 3. División Entrenamiento / Validación
+    train = df_model[df_model['date'] < '2024-01-01']
+    val = df_model[df_model['date'] >= '2024-01-01']
+
+    target = TARGET
+
+    # 4. Entrenar y Evaluar
+    model = make_model(args.modelo, features)
+    model.fit(train[features], train[target])
 
-features = ['month', 'year', 'lag_1', 'lag_2', 'lag_3', 'lag_6', 'lag_12', 'rolling_mean_3']
-target = 'sales'
+    val_preds = model.predict(val[features])
+    print(f"Validation MAE: {mean_absolute_error(val[target], val_preds):,.2f}")
+    print(f"Validation RMSE: {np.sqrt(mean_squared_error(val[target], val_preds)):,.2f}")
 
-# 4. Entrenar y Evaluar
-model = RandomForestRegressor(n_estimators=100, random_state=42)
-model.fit(train[features], train[target])
+    # 5. Modelo Final con TODOS los datos (se reutiliza del registro si ya fue entrenado) y Exportar
+    model_full, key, trained = get_final_model(df_model, features, backend=args.modelo)
+    print(f"Modelo final {'entrenado' if trained else 'reutilizado'} (clave del registro: {key})")
+    if trained:
+        model_registry.prune()
 
-val_preds = model.predict(val[features])
-print(f"Validation MAE: {mean_absolute_error(val[target], val_preds):,.2f}")
-print(f"Validation RMSE: {np.sqrt(mean_squared_error(val[target], val_preds)):,.2f}")
+    # Exportar modelo
+    joblib.dump(model_full, 'sales_forecasting_model.pkl')
+    print("Modelo guardado exitosamente como 'sales_forecasting_model.pkl'")
 
-# 5. Entrenar Modelo Final con TODOS los datos y Exportar
-model_full = RandomForestRegressor(n_estimators=100, random_state=42)
-model_full.fit(df_model[features], df_model[target])
+    # 🚀 Ejecución de la Predicción
+    df_future = forecast_recursive(model_full, df_model, features)
+    print("\n--- Predicciones (Julio 2024 - Dic 2025) ---")
+    print(df_future.head())
+    print(df_future.tail())
 
-# Exportar modelo
-joblib.dump(model_full, 'sales_forecasting_model.pkl')
-print("Modelo guardado exitosamente como 'sales_forecasting_model.pkl'")
+    # Exportar Predicciones
+    df_future.to_csv('./data/sales_predictions_2024_2025_final.csv', index=False)
+    print("\nPredicciones guardadas en './data/sales_predictions_2024_2025_final.csv'")
 
-# 🚀 Ejecución de la Predicción
-df_future = forecast_recursive(model, df_model, features)
-print("\n--- Predicciones (Julio 2024 - Dic 2025) ---")
-print(df_future.head())
-print(df_future.tail())
+    # Visualización
+    plot_forecast(monthly_sales, df_future)
 
-# Exportar Predicciones
-df_future.to_csv('./data/sales_predictions_2024_2025_final.csv', index=False)
-print("\nPredicciones guardadas en './data/sales_predictions_2024_2025_final.csv'")
 
-# Visualización
-plot_forecast(monthly_sales, df_future)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
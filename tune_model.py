@@ -0,0 +1,267 @@
+"""
+Búsqueda de hiperparámetros del modelo de ventas con successive halving.
+
+Se busca el número de árboles, la profundidad y max_features del
+RandomForestRegressor junto con los lags y las ventanas de media móvil de
+create_features. Cada configuración se evalúa con el backtesting de origen
+móvil (ver backtest.py): en la primera ronda todas las candidatas se evalúan
+con pocos orígenes y en cada ronda siguiente solo el mejor 1/eta pasa a
+evaluarse con eta veces más orígenes, hasta usarlos todos. Las evaluaciones
+de cada ronda se reparten en un pool de procesos.
+
+Cada evaluación (configuración y origen) se guarda al terminar en
+./models/tuning/<huella de los datos>.jsonl. Una nueva ejecución reutiliza
+las evaluaciones guardadas, por lo que reanuda una búsqueda interrumpida, y
+añade a las candidatas las mejores configuraciones de búsquedas anteriores.
+
+Uso:
+    python tune_model.py --candidatos 27 --eta 3 --workers 4
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from aurelion import model_registry
+from backtest import HORIZONS, MIN_TRAIN, default_origins, forecast_from_origins
+from train_model import MODEL_PARAMS, TARGET, cached_features, feature_names, load_monthly_sales
+
+TUNING_DIR = "./models/tuning"
+
+# Valores posibles de cada hiperparámetro; "lags" y "windows" se pasan a create_features.
+SEARCH_SPACE = {
+    "n_estimators": [50, 100, 200, 400],
+    "max_depth": [None, 4, 8, 16],
+    "max_features": [1.0, "sqrt", 0.5],
+    "lags": [[1, 2, 3, 6, 12], [1, 2, 3, 12], [1, 2, 3, 4, 5, 6, 12], [1, 12]],
+    "windows": [[3], [3, 6], [3, 12], [6]],
+}
+
+# Datos compartidos con cada proceso del pool (ver _init_worker).
+_shared = {}
+
+
+def config_key(config):
+    """Identificador estable de una configuración."""
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def sample_configs(n, seed=42, space=SEARCH_SPACE):
+    """`n` configuraciones distintas elegidas al azar (reproducible con `seed`) del espacio de búsqueda."""
+    names = list(space)
+    grid = list(itertools.product(*(range(len(space[name])) for name in names)))
+    rng = np.random.default_rng(seed)
+    chosen = rng.choice(len(grid), size=min(n, len(grid)), replace=False)
+    return [{name: space[name][i] for name, i in zip(names, grid[index])} for index in chosen]
+
+
+def _model_params(config):
+    return {**MODEL_PARAMS, **{k: v for k, v in config.items() if k not in ("lags", "windows")}}
+
+
+class TrialLog:
+    """
+    Evaluaciones guardadas de una búsqueda: una línea JSON por configuración y origen.
+
+    Cada línea guarda el error absoluto para cada horizonte de 1 a `max_horizon`
+    con ventas reales disponibles, de modo que sirve para cualquier búsqueda
+    posterior con horizontes menores o iguales.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.configs = {}
+        self._errors = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as file:
+                for line in file:
+                    if line.strip():
+                        self._add(json.loads(line))
+
+    def _add(self, record):
+        self.configs[record["config"]] = record["params"]
+        self._errors[(record["config"], record["origin"])] = record
+
+    def errors(self, key, origin, horizons):
+        """Errores absolutos por horizonte de `key` en `origin`, o None si no están guardados."""
+        record = self._errors.get((key, origin))
+        if record is None or record["max_horizon"] < max(horizons):
+            return None
+        return {h: record["errors"][str(h)] for h in horizons if str(h) in record["errors"]}
+
+    def append(self, key, config, origin, max_horizon, errors):
+        record = {"config": key, "params": config, "origin": origin, "max_horizon": max_horizon,
+                  "errors": {str(h): error for h, error in errors.items()}}
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")
+        self._add(record)
+
+    def score(self, key, origins, horizons):
+        """MAE de `key` sobre todos los pares (origen, horizonte) guardados de `origins`."""
+        errors = [error for origin in origins
+                  for error in (self.errors(key, origin, horizons) or {}).values()]
+        return float(np.mean(errors)) if errors else np.inf
+
+    def best_configs(self, origins, horizons, n):
+        """Las `n` mejores configuraciones guardadas que se evaluaron con todos los `origins`."""
+        complete = [key for key in self.configs
+                    if all(self.errors(key, origin, horizons) is not None for origin in origins)]
+        complete.sort(key=lambda key: self.score(key, origins, horizons))
+        return [self.configs[key] for key in complete[:n]]
+
+
+def _init_worker(monthly_sales):
+    _shared.update(monthly_sales=monthly_sales, features={})
+
+
+def _evaluate_chunk(config, origins, max_horizon):
+    """
+    Errores absolutos de `config` en cada origen de `origins` (se ejecuta en un proceso del pool).
+
+    Returns:
+        Lista de tuplas (origen, {horizonte: error_absoluto}).
+    """
+    monthly_sales = _shared["monthly_sales"]
+    lags_key = (tuple(config["lags"]), tuple(config["windows"]))
+    # Las features de cada combinación de lags y ventanas se calculan una vez por proceso.
+    if lags_key not in _shared["features"]:
+        features = feature_names(config["lags"], config["windows"])
+        df_model = cached_features(monthly_sales, lags=config["lags"], windows=config["windows"]).dropna()
+        _shared["features"][lags_key] = (
+            features, df_model[features].to_numpy(dtype=float), df_model[TARGET].to_numpy(dtype=float),
+            df_model['date'].to_numpy(),
+        )
+    features, X, y, feature_dates = _shared["features"][lags_key]
+
+    actual = monthly_sales.set_index('date')[TARGET]
+    results = []
+    forecasts = forecast_from_origins(
+        X, y, feature_dates, monthly_sales[TARGET].to_numpy(dtype=float), monthly_sales['date'].to_numpy(),
+        features, _model_params(config), [pd.Timestamp(origin) for origin in origins], max_horizon,
+    )
+    for origin, _, predictions in forecasts:
+        errors = {}
+        for h in range(1, max_horizon + 1):
+            date = origin + pd.offsets.MonthEnd(h)
+            if date in actual.index:
+                errors[h] = float(abs(predictions[h - 1] - actual[date]))
+        results.append((f"{origin:%Y-%m-%d}", errors))
+    return results
+
+
+def rung_origins(origins, n_rungs, eta):
+    """
+    Orígenes de cada ronda: la última usa todos y cada ronda anterior uno de cada
+    eta (contando desde el más reciente), de modo que los de una ronda están
+    incluidos en los de la siguiente.
+    """
+    return [origins[::-1][::eta ** (n_rungs - 1 - rung)][::-1] for rung in range(n_rungs)]
+
+
+def successive_halving(monthly_sales, candidates, log, origins, horizons=HORIZONS, eta=3, workers=None, report=print):
+    """
+    Evalúa `candidates` con successive halving y devuelve la clasificación final.
+
+    Args:
+        monthly_sales: DataFrame con 'date' y 'sales'.
+        candidates: Lista de configuraciones (ver SEARCH_SPACE).
+        log: TrialLog donde se leen y guardan las evaluaciones.
+        origins: Orígenes del backtesting (todos los de la última ronda).
+        horizons: Horizontes con los que se calcula el MAE.
+        eta: Factor de reducción: cada ronda conserva 1/eta de las candidatas.
+        workers: Procesos del pool (None usa todos los núcleos).
+
+    Returns:
+        DataFrame con 'config', 'round', 'origins', 'mae' y los hiperparámetros de
+        cada candidata en la ronda más avanzada que tiene evaluada, ordenado de mejor a peor.
+    """
+    n_rungs = min(int(np.floor(np.log(len(candidates)) / np.log(eta) + 1e-9)) + 1,
+                  int(np.floor(np.log(len(origins)) / np.log(eta) + 1e-9)) + 1)
+    rungs = rung_origins([f"{origin:%Y-%m-%d}" for origin in origins], n_rungs, eta)
+    max_horizon = max(horizons)
+    configs = {config_key(config): config for config in candidates}
+    alive = list(configs)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(monthly_sales,)) as pool:
+        for rung, rung_dates in enumerate(rungs):
+            # Solo se evalúan los pares (configuración, origen) que no están guardados.
+            pending = {key: [origin for origin in rung_dates if log.errors(key, origin, horizons) is None]
+                       for key in alive}
+            n_pending = sum(len(dates) for dates in pending.values())
+            chunk_size = max(1, -(-n_pending // ((workers or os.cpu_count() or 1) * 4)))
+            futures = {
+                pool.submit(_evaluate_chunk, configs[key], dates[i:i + chunk_size], max_horizon): key
+                for key, dates in pending.items() for i in range(0, len(dates), chunk_size)
+            }
+            # Se guarda cada tarea al terminar: una búsqueda interrumpida se reanuda desde ahí.
+            for future in as_completed(futures):
+                key = futures[future]
+                for origin, errors in future.result():
+                    log.append(key, configs[key], origin, max_horizon, errors)
+
+            scores = {key: log.score(key, rung_dates, horizons) for key in alive}
+            report(f"Ronda {rung + 1}/{n_rungs}: {len(alive)} candidatas con {len(rung_dates)} orígenes "
+                   f"({n_pending} evaluaciones nuevas), mejor MAE {min(scores.values()):,.2f}")
+            if rung < n_rungs - 1:
+                alive = sorted(alive, key=scores.get)[:max(1, len(alive) // eta)]
+
+    # Cada candidata se clasifica en la ronda más avanzada con todas sus evaluaciones
+    # guardadas (una configuración de una búsqueda anterior puede tenerlas todas).
+    rows = []
+    for key in configs:
+        rung = max(r for r, dates in enumerate(rungs)
+                   if all(log.errors(key, origin, horizons) is not None for origin in dates))
+        rows.append((key, rung + 1, len(rungs[rung]), log.score(key, rungs[rung], horizons)))
+    ranking = pd.DataFrame(rows, columns=["config", "round", "origins", "mae"])
+    # Como objetos, para que max_depth=None no se muestre como NaN.
+    for name in SEARCH_SPACE:
+        ranking[name] = pd.Series([configs[key][name] for key in ranking["config"]], dtype=object)
+    return ranking.sort_values(["round", "mae"], ascending=[False, True]).reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Búsqueda de hiperparámetros con successive halving.")
+    parser.add_argument('--candidatos', type=int, default=27, help="Configuraciones nuevas elegidas al azar.")
+    parser.add_argument('--previas', type=int, default=3,
+                        help="Mejores configuraciones de búsquedas anteriores que se añaden a las candidatas.")
+    parser.add_argument('--eta', type=int, default=3, help="Factor de reducción entre rondas.")
+    parser.add_argument('--horizontes', type=int, nargs='+', default=list(HORIZONS),
+                        help="Horizontes con los que se calcula el MAE.")
+    parser.add_argument('--semilla', type=int, default=42, help="Semilla para elegir las candidatas.")
+    parser.add_argument('--workers', type=int, default=None, help="Procesos del pool (por defecto, todos los núcleos).")
+    parser.add_argument('--dir', default=TUNING_DIR, help="Carpeta de las evaluaciones guardadas.")
+    args = parser.parse_args()
+
+    monthly_sales = load_monthly_sales()
+    # Los mismos orígenes para todas las candidatas, sea cual sea su configuración de lags.
+    origins = default_origins(cached_features(monthly_sales).dropna(), args.horizontes, MIN_TRAIN)
+    fingerprint = model_registry.data_fingerprint(monthly_sales)[:16]
+    log = TrialLog(os.path.join(args.dir, f"{fingerprint}.jsonl"))
+
+    candidates = sample_configs(args.candidatos, args.semilla)
+    previous = log.best_configs([f"{origin:%Y-%m-%d}" for origin in origins], args.horizontes, args.previas)
+    keys = {config_key(config) for config in candidates}
+    candidates += [config for config in previous if config_key(config) not in keys]
+    print(f"{len(candidates)} candidatas ({len(log.configs)} configuraciones ya evaluadas en {log.path}), "
+          f"{len(origins)} orígenes, {args.workers or os.cpu_count()} procesos")
+
+    ranking = successive_halving(monthly_sales, candidates, log, origins, args.horizontes, args.eta, args.workers)
+    print("\nMejores configuraciones:")
+    print(ranking.head(10).to_string(index=False, float_format=lambda value: f"{value:,.2f}"))
+
+    best = ranking.iloc[0]
+    best_path = os.path.join(args.dir, f"{fingerprint}_best.json")
+    with open(best_path, "w", encoding="utf-8") as file:
+        json.dump({"config": best["config"], "mae": best["mae"], "origins": int(best["origins"]),
+                   "horizons": args.horizontes, "params": log.configs[best["config"]]}, file, indent=2)
+    print(f"\nMejor configuración guardada en '{best_path}'")
+
+
+if __name__ == "__main__":
+    main()
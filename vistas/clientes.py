@@ -0,0 +1,29 @@
+"""Vista de los clientes y su antigüedad, filtrable por ciudad."""
+from datetime import datetime
+
+import streamlit as st
+
+from aurelion import data_access, metrics, navigation
+
+
+def see_clients():
+    """Función que muestra la información de los clientes"""
+    # Extracción de datos desde la capa de acceso compartida (copia, pues se añade una columna)
+    clientes = data_access.load_clientes().copy()
+
+    with metrics.phase(metrics.TRANSFORM):
+        clientes["antiguedad"] = datetime.now() - clientes["fecha_alta"]
+
+    selected_cities = st.multiselect(
+        "Selecciona las ciudades de origen de los clientes:",
+        options=clientes["ciudad"].unique(),
+        default=clientes["ciudad"].unique()
+    )
+    st.dataframe(clientes[clientes["ciudad"].isin(selected_cities)].drop(columns=["ciudad"]))
+
+    st.markdown("---")
+    # Botón para regresar al menú principal
+    navigation.back_to_menu_button()
+
+
+see_clients()
@@ -0,0 +1,182 @@
+"""
+Vista interactiva de la documentación (README.md).
+
+Las secciones del README se leen del índice compartido de aurelion.doc_search,
+que divide el archivo una sola vez por proceso; el diagrama de flujo solo se
+carga cuando se usa.
+"""
+import streamlit as st
+
+from aurelion import navigation
+from aurelion.lazy import lazy_import
+
+doc_search = lazy_import("aurelion.doc_search")
+stmd = lazy_import("streamlit_mermaid")
+
+
+def see_documentation():
+    """Función que muestra la documentación del documentación.md de manera interactiva"""
+    st.title("Documentación del Proyecto: Tienda Aurelion")
+
+    # Secciones del README (headers ##), ya divididas por el índice compartido de
+    # aurelion.doc_search: no se vuelve a leer ni a dividir el archivo en cada interacción.
+    sections = {section.title: section for section in doc_search.document_sections("README.md")}
+
+    # Preparar las opciones para la navegación
+    main_title = next(iter(sections))
+    section_titles = list(sections)[1:]
+
+    # Crear una barra lateral para navegación
+    with st.sidebar:
+        st.header("📚 Navegación")
+        
+        # Añadir búsqueda en la documentación
+        search_term = st.text_input("🔍 Buscar en la documentación", "")
+        
+        # Radio buttons para selección de sección con íconos
+        selected_section = st.radio(
+            "Secciones:",
+            section_titles,
+            format_func=lambda x: "📌 " + x if x == main_title else "📑 " + x
+        )
+
+        st.markdown("---")
+        # Mostrar estadísticas de la documentación
+        st.markdown("### 📊 Estadísticas")
+        st.markdown(f"- **Secciones totales:** {len(section_titles)}")
+        st.markdown(f"- **Caracteres totales:** {sum(len(section.content) for section in sections.values())}")
+
+    # Contenedor principal para el contenido
+    main_container = st.container()
+    
+    with main_container:
+        # Si hay término de búsqueda, resaltarlo en el contenido
+        if search_term:
+            st.info(f"🔍 Mostrando resultados para: '{search_term}'")
+
+        # Mostrar el contenido de la sección seleccionada
+        content_to_show = sections[selected_section].content
+
+        # Si hay término de búsqueda, mostrar las coincidencias de todas las
+        # secciones ordenadas por relevancia (sin acentos y por prefijo).
+        if search_term and search_term.strip():
+            hits = doc_search.search(search_term, sources=["README.md", "instrucciones.md"])
+            if hits:
+                for hit in hits:
+                    text = doc_search.highlight(hit.text.lstrip("#").strip(), search_term)
+                    st.markdown(f"📑 *{hit.section}* ({hit.source})  \n{text}")
+            else:
+                st.warning("No se encontraron coincidencias en la documentación.")
+        else:
+            # Mostrar el contenido normal
+            st.markdown(content_to_show)
+
+        # Agregar elementos interactivos según el contenido
+        if "```" in content_to_show:  # Si hay bloques de código
+            st.info("ℹ️ Esta sección contiene ejemplos de código que puedes copiar.")
+        
+        if "|" in content_to_show:  # Si hay tablas
+            st.info("ℹ️ Esta sección contiene tablas con información estructurada.")
+
+        if sections[selected_section].subsections:  # Si hay subsecciones
+            with st.expander("🔍 Ver subsecciones"):
+                for subsection in sections[selected_section].subsections:
+                    st.markdown(f"- {subsection}")
+
+        # Mostrar el diagrama solo si la sección seleccionada es la correcta
+        if "Información, pasos, diagrama de flujo y pseudocódigo del programa" in selected_section.strip():
+            diagram ="""
+                flowchart TD
+                    A([Inicio])
+                    A --> B["Imprimir:<br>1.- Menú:<br>1.- Ver documentación<br>2.- Ver ventas<br>3.- Ver clientes<br>4.- Ver productos<br>0.- Salir"]
+                    B --> C["Leer: opcion_usuario"]
+                    C --> D{opcion_usuario}
+
+                    %% --- Ver productos ---
+                    D -->|1| E["Imprimir: 'Elegiste ver productos'"]
+                    E --> F["Extraer datos de 'productos_corregidos.xlsx'"]
+                    F --> G["Imprimir: 'Selecciona categoría:' + lista_categorias"]
+                    G --> H["Leer: categoria_seleccionada"]
+
+                    H --> I{categoria_seleccionada}
+                    I -->|Todas las categorías| J["Filtrar tabla_productos por 'todas las categorías'"]
+                    I -->|Alimentos| K["Filtrar tabla_productos por 'Alimentos'"]
+                    I -->|Limpieza| L["Filtrar tabla_productos por 'Limpieza'"]
+
+                    J --> M["Imprimir: tabla_productos[id_producto, nombre_producto, precio_unitario, categoria_corregida]"]
+                    K --> M
+                    L --> M
+                    M --> N["Imprimir: 'Regresando al menú principal...'"]
+                    N --> B
+
+                    %% --- Ver ventas ---
+                    D -->|2| O["Imprimir: 'Elegiste ver ventas'"]
+                    O --> P["Extraer datos de 'ventas.xlsx'"]
+                    P --> Q["Extraer datos de 'detalle_ventas.xlsx'"]
+                    Q --> R["Extraer datos de 'clientes.xlsx'"]
+                    R --> S["Unir tablas de ventas, detalle_ventas y clientes"]
+                    S --> T["Imprimir: 'Selecciona ciudad de origen de los clientes' + lista_ciudades"]
+                    T --> U["Filtrar tabla_ventas_unida por ciudad"]
+                    U --> V["Imprimir: 'Selecciona el medio de pago' + lista_medios_pago"]
+                    V --> W["Filtrar tabla_ventas_unida por medio_pago"]
+                    W --> X["Imprimir: 'Ingresa ID de la venta:'"]
+                    X --> Y["Leer: id_venta_ingresado"]
+                    Y --> Z["Filtrar tabla_ventas_unida por id_venta_ingresado"]
+                    Z --> ZA["Imprimir: tabla con datos de venta, cliente y producto"]
+                    ZA --> ZB["Imprimir: 'Regresando al menú principal...'"]
+                    ZB --> B
+
+                    %% --- Ver clientes ---
+                    D -->|3| AA["Imprimir: 'Elegiste ver clientes'"]
+                    AA --> AB["Extraer datos de 'clientes.xlsx'"]
+                    AB --> AC["Calcular antigüedad de los clientes"]
+                    AC --> AD["Imprimir: 'Selecciona ciudad de origen' + lista_ciudades"]
+                    AD --> AE["Filtrar tabla_clientes por ciudad"]
+                    AE --> AF["Imprimir: tabla_clientes con id_cliente, nombre_cliente, email, fecha_alta, antigüedad"]
+                    AF --> AG["Imprimir: 'Regresando al menú principal...'"]
+                    AG --> B
+
+                    %% --- Ver documentación ---
+                    D -->|4| BA["Imprimir: 'Elegiste ver documentación'"]
+                    BA --> BB["Cargar contenido del archivo 'documentación.md'"]
+                    BB --> BC["Extraer títulos de secciones"]
+                    BC --> BD["Imprimir: 'Selecciona una sección:' + lista_secciones"]
+                    BD --> BE["Leer: seccion_seleccionada"]
+                    BE --> BF["Mostrar contenido de la sección seleccionada"]
+                    BF --> BG["Si hay subsecciones, mostrar lista de subsecciones"]
+                    BG --> BH["Si es la sección correcta, mostrar diagrama de flujo"]
+                    BH --> BI["Imprimir: 'Regresando al menú principal...'"]
+                    BI --> B
+
+                    %% --- Salir ---
+                    D -->|0| HZ([Fin])
+            """
+            stmd.st_mermaid(diagram)
+
+    st.markdown("---")
+    # Botones de navegación
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if section_titles.index(selected_section) > 0:
+            prev_section = section_titles[section_titles.index(selected_section) - 1]
+            st.button(
+                f"⬅️ {prev_section}",
+                key="prev_section",
+                help=f"Ir a la sección anterior: {prev_section}"
+            )
+    
+    with col2:
+        navigation.back_to_menu_button()
+    
+    with col3:
+        if section_titles.index(selected_section) < len(section_titles) - 1:
+            next_section = section_titles[section_titles.index(selected_section) + 1]
+            st.button(
+                f"➡️ {next_section}",
+                key="next_section",
+                help=f"Ir a la siguiente sección: {next_section}"
+            )
+
+
+see_documentation()
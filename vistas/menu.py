@@ -0,0 +1,18 @@
+"""Menú principal: un botón por cada vista de la aplicación."""
+import streamlit as st
+
+from aurelion import navigation
+
+
+def main_menu():
+    """Función que muestra el menú principal"""
+    st.title("Tienda Aurelion")
+    st.markdown("Equipo sala 9: Andrea Emilia Gómez Gavilanes, Gester Danna Potosí Rujel, Francisco Alejandro Díaz Pezoa, Martin Otamendi Torres, Mauricio Andre Carpio Rosas, Kelly Lizeth Alomoto Catota.")
+    st.info("Seleccione una de las siguientes opciones:")
+
+    for name, (_, title) in navigation.PAGES.items():
+        if name != navigation.MENU and st.button(title, use_container_width=True):
+            navigation.go_to(name)
+
+
+main_menu()
@@ -0,0 +1,135 @@
+"""
+Vista de la predicción de ventas mensuales (Julio 2024 y 2025).
+
+Las series y sus pronósticos se leen de las predicciones ya exportadas a través
+de aurelion.forecast_service; la vista solo recorta y grafica.
+"""
+import os
+
+import matplotlib.pyplot as plt
+import streamlit as st
+
+from aurelion import data_access, forecast_service, metrics, navigation
+
+
+def see_sales_forecast():
+    """Función que carga el modelo y muestra la predicción de ventas para Julio 2024 y todo 2025"""
+    st.title("📈 Predicción de Ventas: Julio 2024 y 2025")
+    st.markdown("Esta sección muestra la predicción de ventas mensuales usando el modelo entrenado.")
+
+    # Cargar predicciones (servidas desde la caché LRU de aurelion.forecast_service)
+    pred_path = data_access.PREDICTIONS_BY_SERIES_PATH
+    if not os.path.exists(pred_path):
+        st.error(f"No se encontró el archivo de predicciones: {pred_path}")
+        return
+    hist_path = data_access.EXPANDED_PATH
+    if not os.path.exists(hist_path):
+        st.error(f"No se encontró el archivo de histórico: {hist_path}")
+        return
+
+    # Selección de la serie a mostrar (total, categoría, ciudad o producto)
+    series = forecast_service.available_series()
+    segment_labels = {"total": "Total", "categoria": "Categoría", "ciudad": "Ciudad", "producto": "Producto"}
+    col1, col2 = st.columns(2)
+    selected_segment = col1.selectbox(
+        "Segmento:", list(series["segmento"].unique()),
+        format_func=lambda x: segment_labels.get(x, x)
+    )
+    selected_serie = col2.selectbox(
+        "Serie:", list(series.loc[series["segmento"] == selected_segment, "serie"].unique())
+    )
+
+    # Versión del modelo (clave del registro) y meses de pronóstico a mostrar
+    versions = series[(series["segmento"] == selected_segment) & (series["serie"] == selected_serie)]
+    col3, col4 = st.columns(2)
+    selected_version = col3.selectbox("Versión del modelo:", list(versions["model_version"]))
+    max_horizon = int(versions.loc[versions["model_version"] == selected_version, "horizon"].iloc[0])
+    horizon = max_horizon
+    if max_horizon > 1:
+        horizon = col4.slider("Meses a pronosticar:", min_value=1, max_value=max_horizon, value=max_horizon)
+    history, forecast = forecast_service.get_forecast(selected_segment, selected_serie, selected_version, horizon)
+
+    # Filtro de fechas: solo recorta las series ya calculadas (no vuelve a agregar)
+    first_date, last_date = history.index.min().date(), forecast.index.max().date()
+    start_date, end_date = st.slider(
+        "Rango de fechas a mostrar:",
+        min_value=first_date, max_value=last_date,
+        value=(first_date, last_date), format="MMM YYYY"
+    )
+    with metrics.phase(metrics.TRANSFORM):
+        history = history.loc[str(start_date):str(end_date)]
+        forecast = forecast.loc[str(start_date):str(end_date)]
+        df_pred_filtered = forecast.reset_index()
+
+    st.subheader("Predicciones de ventas (Jul 2024 - Dic 2025)")
+    st.dataframe(df_pred_filtered, use_container_width=True)
+
+    # Gráfica 1: Solo valores predichos
+    st.markdown("### Gráfica: Valores Predichos")
+    with metrics.phase(metrics.CHARTS):
+        fig1, ax1 = plt.subplots(figsize=(10,5))
+        ax1.plot(df_pred_filtered['date'], df_pred_filtered['pred_sales'], marker='o', color='darkorange', label='Predicción de ventas')
+        ax1.set_title(f'Pronóstico de Ventas Mensuales: {selected_serie} (Jul 2024 - Dic 2025)')
+        ax1.set_xlabel('Fecha')
+        ax1.set_ylabel('Ventas Predichas ($)')
+        ax1.grid(True, linestyle='--', alpha=0.6)
+        ax1.legend()
+        plt.xticks(rotation=45)
+        st.pyplot(fig1)
+
+    # Gráfica 2: Histórico + valores predichos
+    st.markdown("### Gráfica: Histórico + Predicción")
+    monthly_sales = history.reset_index()
+    # Graficar histórico y predicción juntos
+    with metrics.phase(metrics.CHARTS):
+        fig2, ax2 = plt.subplots(figsize=(14,7))
+        ax2.plot(monthly_sales['date'], monthly_sales['sales'], label='Ventas Históricas (2017 - Jun 2024)', color='dodgerblue', linewidth=2)
+        ax2.plot(df_pred_filtered['date'], df_pred_filtered['pred_sales'], label='Pronóstico (Jul 2024 - Dic 2025)', color='darkorange', linestyle='--', marker='o', markersize=4)
+        if not monthly_sales.empty:
+            last_historical_date = monthly_sales['date'].max()
+            ax2.axvline(x=last_historical_date, color='grey', linestyle=':', linewidth=1.5, label='Inicio del Pronóstico')
+        ax2.set_title(f'📈 Histórico y Pronóstico de Ventas Mensuales: {selected_serie} (2017 - 2025)', fontsize=16)
+        ax2.set_xlabel('Fecha', fontsize=12)
+        ax2.set_ylabel('Ventas Totales ($)', fontsize=12)
+        ax2.legend(loc='upper left')
+        ax2.grid(True, linestyle='--')
+        plt.xticks(rotation=45)
+        plt.tight_layout()
+        st.pyplot(fig2)
+
+    st.markdown("""
+        1. Validación y confiabilidad: 
+            El gráfico de validación (Ene-Jun 2024) muestra que 
+                el modelo captura correctamente la direccionalidad y 
+                estacionalidad de las ventas. Aunque existe una 
+                desviación promedio (MAE) del ~16%, las curvas 
+                se mueven en sincronía. Esto indica que el 
+                modelo entiende cuándo suben o bajan las ventas, 
+                lo cual es más valioso para la planificación que 
+                acertar el monto exacto al centavo.
+
+        2. Tendencia y estacionalidad futura: El pronóstico extendido 
+                (hasta Dic 2025) revela un comportamiento cíclico y 
+                predecible. Se observan patrones claros de picos y 
+                valles que se repiten anualmente, heredados de la 
+                tendencia macroeconómica del mercado argentino. 
+                Esto sugiere que el negocio no es errático, 
+                sino que responde a ciclos de consumo definidos.
+
+        3. Estabilidad del negocio: La proyección no muestra caídas 
+                abruptas ni crecimientos explosivos injustificados, 
+                sino una tendencia de crecimiento sostenido. Esto 
+                permite a la gerencia anticipar la demanda de 
+                inventario para los meses de "temporada alta" y 
+                optimizar el flujo de caja durante los periodos 
+                de menores ventas, reduciendo la incertidumbre 
+                operativa para el próximo año y medio.
+    """)
+
+    st.markdown("---")
+    navigation.back_to_menu_button()
+
+    st.markdown("---")
+
+
+see_sales_forecast()
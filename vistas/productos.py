@@ -0,0 +1,29 @@
+"""Vista del catálogo de productos, filtrable por categoría."""
+import numpy as np
+import streamlit as st
+
+from aurelion import data_access, navigation
+
+
+def see_products():
+    """Función que muestra los productos disponibles en la tienda"""
+    # Extracción de datos desde la capa de acceso compartida
+    ventas = data_access.load_productos()
+    # Construcción de lista de categorias.
+    categories = np.insert(ventas["categoria_corregida"].unique(), 0, "Todas las categorias")
+    # Captura de selección de categoría.
+    selected_category = st.selectbox("Selecciona categoria:", categories)
+    # Eliminación de columna "categoria" para evitar confusión.
+    ventas = ventas.drop(columns=["categoria"])
+    # Filtro de dataframe con la columna "categoria"
+    if selected_category == "Todas las categorias":
+        st.dataframe(ventas)
+    else:
+        st.dataframe(ventas[ventas["categoria_corregida"] == selected_category])
+    
+    st.markdown("---")
+    # Botón para regresar al menú principal
+    navigation.back_to_menu_button()
+
+
+see_products()
@@ -0,0 +1,14 @@
+"""Vista de la opción "Salir"."""
+import streamlit as st
+
+from aurelion import navigation
+
+
+def test_page():
+    """Función que permite probar el cambio de página"""
+    st.markdown(f"Ha elegido la opción: {navigation.PAGES['salir'][1]}")
+
+    st.markdown("---")
+
+
+test_page()
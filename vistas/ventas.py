@@ -0,0 +1,67 @@
+"""Vista de búsqueda de ventas por ID, rango de IDs o fechas, ciudad y medio de pago."""
+import streamlit as st
+
+from aurelion import data_access, metrics, navigation
+
+
+def see_sales():
+    """Función que muestra la información de las ventas"""
+    # Índices sobre la tabla de hechos ya unificada (ventas + detalle_ventas + clientes).
+    # Las búsquedas cuestan O(filas coincidentes) en lugar de recorrer toda la tabla.
+    sales_index = data_access.load_sales_index()
+    clients = data_access.load_clientes(columns=["ciudad"])
+    display_columns = [
+        "id_venta", "fecha_venta", "id_cliente", "nombre_cliente", "email", "medio_pago",
+        "id_producto", "nombre_producto", "cantidad", "precio_unitario", "importe",
+    ]
+
+    selected_cities = st.multiselect(
+        "Selecciona las ciudades de origen de los clientes:",
+        options=clients["ciudad"].unique(),
+        default=clients["ciudad"].unique()
+    )
+
+    # Construcción de lista de medios de pago.
+    medios_pago = ["Todos los medios de pago"] + sales_index.values("medio_pago")
+    selected_medio_pago = st.selectbox("Selecciona el medio de pago:", medios_pago)
+
+    # Tipo de búsqueda: una venta, un rango de IDs o una ventana de fechas.
+    search_mode = st.radio(
+        "Buscar por:",
+        ["ID de venta", "Rango de IDs", "Rango de fechas"],
+        horizontal=True
+    )
+    min_id, max_id = sales_index.id_bounds
+    id_range, date_range = None, None
+    if search_mode == "ID de venta":
+        selected_id_venta = st.number_input('Ingresa el ID de la venta:', min_value=min_id, max_value=max_id, value=min_id, step=1)
+        id_range = (selected_id_venta, selected_id_venta)
+    elif search_mode == "Rango de IDs":
+        id_range = st.slider('Selecciona el rango de IDs de venta:', min_value=min_id, max_value=max_id, value=(min_id, max_id))
+    else:
+        first_date, last_date = sales_index.date_bounds
+        selected_dates = st.date_input(
+            'Selecciona el rango de fechas de venta:',
+            value=(first_date, last_date), min_value=first_date, max_value=last_date
+        )
+        # Mientras se elige el rango, date_input devuelve solo la fecha inicial.
+        if len(selected_dates) == 2:
+            date_range = selected_dates
+        else:
+            date_range = (selected_dates[0], selected_dates[0])
+
+    with metrics.phase(metrics.TRANSFORM):
+        resultado = sales_index.query(
+            id_range=id_range,
+            date_range=date_range,
+            ciudades=selected_cities,
+            medios_pago=None if selected_medio_pago == "Todos los medios de pago" else [selected_medio_pago],
+        )
+    st.dataframe(resultado[display_columns])
+
+    st.markdown("---")
+    # Botón para regresar al menú principal
+    navigation.back_to_menu_button()
+
+
+see_sales()